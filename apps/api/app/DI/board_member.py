@@ -1,34 +1,17 @@
 from uuid import UUID
 from fastapi import Depends, Path
 
+from app.api.services.board_access_service import BoardAccessServiceDep
 from app.common.errors.exceptions import PermissionDeniedError
-from app.core.database import DBSessionDep
-from app.database_models.board_member import BoardMember
-from app.database_models.board import Board
-from sqlalchemy import select, or_
-from app.DI.current_user import CurrentUserDep
-from app.database_models.user import User
+from app.DI.current_user import CurrentPrincipalDep, Principal
 
 
 async def board_member(
-    session: DBSessionDep,  # noqa: B008
+    board_access: BoardAccessServiceDep,
     board_id: UUID = Path(...),  # noqa: B008
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> None:
-    stmt = (
-        select(BoardMember.id)
-        .outerjoin(Board, Board.id == BoardMember.board_id)
-        .where(
-            Board.id == board_id,
-            or_(
-                Board.owner_id == current_user.id,
-                BoardMember.user_id == current_user.id,
-            ),
-        )
-        .limit(1)
-    )
-    result = await session.execute(stmt)
-    if not result.scalar_one_or_none():
+    if not await board_access.has_access(board_id, current_user.id):
         raise PermissionDeniedError("You are not a member of this board.")
 
 
@@ -1,15 +1,81 @@
-from datetime import datetime, timezone
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, cast
 from uuid import UUID
 from fastapi import Request, Depends
-from app.core.database import DBSessionDep
+import redis.asyncio as redis
+from app.api.services.user_cache_service import (
+    UserCacheService,
+    UserCacheServiceDep,
+)
+from app.core.logger import logger
+from app.core.redis import RedisDep
+from app.common.presence import record_presence
 from app.database_models.user import User
-from sqlalchemy import select, update
-from app.core.security import decode_token
+from app.core.security import IdentityClaims, TokenPayload, decode_token
 from app.common.errors.exceptions import TokenInvalidError, AccessTokenExpiredError
 
 
-async def current_user(request: Request, session: DBSessionDep) -> User:
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated user as far as handlers that only need identity go."""
+
+    id: UUID
+    email: str
+    first_name: str
+    last_name: str
+    avatar_url: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            avatar_url=user.avatar_url,
+        )
+
+
+async def current_user(
+    request: Request, user_cache: UserCacheServiceDep, redis_client: RedisDep
+) -> User:
+    payload = _access_token_payload(request)
+    user = await _load_user(user_cache, UUID(payload["sub"]))
+    await _record_presence(redis_client, user.id)
+    return user
+
+
+async def current_principal(
+    request: Request, user_cache: UserCacheServiceDep, redis_client: RedisDep
+) -> Principal:
+    """
+    Like `current_user`, but built from the identity claims of the access token
+    when it carries them. The user is only looked up for tokens without claims
+    and for tokens issued before the user's latest profile change.
+    """
+    payload = _access_token_payload(request)
+    user_id = UUID(payload["sub"])
+
+    principal: Optional[Principal] = None
+    if "pv" in payload:
+        claims = cast(IdentityClaims, payload)
+        latest_version = await user_cache.get_profile_version(user_id)
+        if latest_version is None or latest_version <= claims["pv"]:
+            principal = Principal(
+                id=user_id,
+                email=claims["email"],
+                first_name=claims["given_name"],
+                last_name=claims["family_name"],
+                avatar_url=claims["picture"],
+            )
+    if principal is None:
+        principal = Principal.from_user(await _load_user(user_cache, user_id))
+
+    await _record_presence(redis_client, user_id)
+    return principal
+
+
+def _access_token_payload(request: Request) -> TokenPayload:
     access_token = request.cookies.get("access_token")
     refresh_token = request.cookies.get("refresh_token")
 
@@ -21,26 +87,30 @@ async def current_user(request: Request, session: DBSessionDep) -> User:
 
     try:
         payload = decode_token(access_token)
-        user_id = UUID(payload["sub"])
+        UUID(payload["sub"])
     except Exception as err:
         raise TokenInvalidError("Invalid token") from err
+    return payload
 
-    result = await session.execute(select(User).where(User.id == user_id))
-    user: Optional[User] = result.scalar_one_or_none()
+
+async def _load_user(user_cache: UserCacheService, user_id: UUID) -> User:
+    user: Optional[User] = await user_cache.get(user_id)
     if not user:
         raise TokenInvalidError("User not found")
+    return user
 
+
+async def _record_presence(redis_client: redis.Redis, user_id: UUID) -> None:
+    # Presence goes to Redis; the maintenance worker writes it to
+    # users.last_seen_at in batches.
     try:
-        await session.execute(
-            update(User)
-            .where(User.id == user.id)
-            .values(last_seen_at=datetime.now(timezone.utc))
+        await record_presence(redis_client, user_id)
+    except Exception as err:
+        logger.warning(
+            "presence.record_failed",
+            extra={"user_id": str(user_id), "error": str(err)},
         )
-        await session.commit()
-    except Exception:
-        await session.rollback()
-
-    return user
 
 
 CurrentUserDep = Depends(current_user)
+CurrentPrincipalDep = Depends(current_principal)
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Annotated, FrozenSet, Optional
+from fastapi import Depends, Header
+
+
+async def if_match_version(
+    if_match: Annotated[Optional[str], Header()] = None,
+) -> Optional[int]:
+    """
+    Version the client last saw, taken from an `If-Match` header such as `"3"`
+    or `W/"3"`. A missing header or `*` skips the optimistic concurrency check.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    value = if_match.strip().removeprefix("W/").strip('"')
+    try:
+        return int(value)
+    except ValueError as err:
+        raise ValueError(f"Invalid If-Match header {if_match!r}") from err
+
+
+IfMatchDep = Annotated[Optional[int], Depends(if_match_version)]
+
+
+@dataclass(frozen=True, slots=True)
+class BoardIfMatch:
+    """
+    `If-Match` of a board: its `version`, or the ETag of its tree as sent by
+    GET /boards/{id}. Both are `None` when the header is missing or `*`.
+    """
+
+    version: Optional[int] = None
+    etag: Optional[str] = None
+
+
+async def if_match_board(
+    if_match: Annotated[Optional[str], Header()] = None,
+) -> BoardIfMatch:
+    if if_match is not None:
+        tag = if_match.strip().removeprefix("W/")
+        if tag.strip('"').startswith("board-"):
+            return BoardIfMatch(etag=tag)
+    return BoardIfMatch(version=await if_match_version(if_match))
+
+
+BoardIfMatchDep = Annotated[BoardIfMatch, Depends(if_match_board)]
+
+
+async def if_none_match_tags(
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> FrozenSet[str]:
+    """
+    Entity tags of an `If-None-Match` header. `W/` prefixes are dropped because
+    conditional GETs use the weak comparison.
+    """
+    if if_none_match is None:
+        return frozenset()
+    return frozenset(tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+IfNoneMatchDep = Annotated[FrozenSet[str], Depends(if_none_match_tags)]
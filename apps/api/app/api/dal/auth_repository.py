@@ -1,9 +1,10 @@
 from uuid import UUID
 from datetime import timedelta
-from typing import Optional, Annotated, List
+from typing import Dict, Optional, Annotated, List
 from fastapi import Depends
 from datetime import datetime, timezone
-from sqlalchemy import select
+from sqlalchemy import DateTime, column, delete, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import joinedload
 from app.core.database import DBSessionDep
 from app.database_models.user import User
@@ -12,6 +13,7 @@ from app.database_models.refresh_token import (
 )
 from app.core.security import (
     create_refresh_token as refresh_token_generator,
+    hash_refresh_token,
 )
 from app.common.repository import BaseRepository
 
@@ -28,7 +30,7 @@ class AuthRepository(BaseRepository[User]):
 
     async def create(self, user: User) -> User:
         self.session.add(user)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(user)
         return user
 
@@ -37,7 +39,7 @@ class AuthRepository(BaseRepository[User]):
             select(RefreshToken)
             .options(joinedload(RefreshToken.user))
             .where(
-                RefreshToken.token == token,
+                RefreshToken.token_hash == hash_refresh_token(token),
                 RefreshToken.revoked.is_(False),
                 RefreshToken.expires_at > datetime.now(timezone.utc),
             )
@@ -46,60 +48,46 @@ class AuthRepository(BaseRepository[User]):
         return refresh_token
 
     async def revoke_refresh_token(self, token: str) -> bool:
+        """Revoke `token`. It also expires now, so the next purge deletes it."""
         result = await self.session.execute(
-            select(RefreshToken).where(
-                RefreshToken.token == token,
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_refresh_token(token),
                 RefreshToken.revoked.is_(False),
             )
+            .values(revoked=True, expires_at=func.now())
+            .returning(RefreshToken.id)
         )
-        rt = result.scalar_one_or_none()
-        if not rt:
-            return False
-
-        rt.revoked = True
-        await self.session.commit()
-        return True
-
-    async def cleanup_old_tokens(self, user_id: UUID) -> None:
-        stmt = select(RefreshToken).where(
-            RefreshToken.user_id == user_id,
-            RefreshToken.expires_at < datetime.now(timezone.utc),
-            RefreshToken.revoked.is_(False),
+        return result.scalar_one_or_none() is not None
+
+    async def purge_expired_tokens(self, batch_size: int) -> int:
+        """
+        Delete up to `batch_size` expired or revoked refresh tokens, walking the
+        expiry index, and return how many were deleted.
+        """
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at <= func.now())
+            .order_by(RefreshToken.expires_at)
+            .limit(batch_size)
         )
-        result = await self.session.execute(stmt)
-        expired_tokens = result.scalars().all()
-
-        for token in expired_tokens:
-            token.revoked = True
-
-        await self.session.commit()
-
-    async def get_valid_refresh_token_for_user(
-        self, user_id: UUID
-    ) -> Optional[RefreshToken]:
-        stmt = (
-            select(RefreshToken)
-            .where(
-                RefreshToken.user_id == user_id,
-                RefreshToken.revoked.is_(False),
-                RefreshToken.expires_at > datetime.now(timezone.utc),
-            )
-            .order_by(RefreshToken.created_at.desc())
+        result = await self.session.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.id.in_(expired.scalar_subquery()))
+            .returning(RefreshToken.id)
         )
-        result = await self.session.execute(stmt)
-        refresh_token: Optional[RefreshToken] = result.scalar_one_or_none()
-        return refresh_token
+        return len(result.all())
 
     async def create_refresh_token(self, user_id: UUID) -> str:
         token = refresh_token_generator(str(user_id))
         new_token = RefreshToken(
             user_id=user_id,
-            token=token,
+            token_hash=hash_refresh_token(token),
             expires_at=datetime.now(timezone.utc) + timedelta(days=30),
             revoked=False,
         )
         self.session.add(new_token)
-        await self.session.commit()
+        await self.session.flush()
         return token
 
     async def get_all_users(self) -> list[User]:
@@ -117,5 +105,36 @@ class AuthRepository(BaseRepository[User]):
         user: Optional[User] = result.scalar_one_or_none()
         return user
 
+    async def bump_profile_version(self, user_id: UUID) -> Optional[int]:
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(profile_version=User.profile_version + 1)
+            .returning(User.profile_version)
+        )
+        version: Optional[int] = result.scalar_one_or_none()
+        return version
+
+    async def set_last_seen(self, last_seen: Dict[UUID, datetime]) -> None:
+        """
+        Write a batch of presence timestamps with one UPDATE ... FROM (VALUES ...).
+        A timestamp older than the stored one is ignored.
+        """
+        if not last_seen:
+            return
+        seen = values(
+            column("id", PGUUID(as_uuid=True)),
+            column("seen_at", DateTime(timezone=True)),
+            name="seen",
+        ).data(list(last_seen.items()))
+        await self.session.execute(
+            update(User)
+            .where(
+                User.id == seen.c.id,
+                or_(User.last_seen_at.is_(None), User.last_seen_at < seen.c.seen_at),
+            )
+            .values(last_seen_at=seen.c.seen_at, updated_at=User.updated_at)
+        )
+
 
 AuthRepositoryDep = Annotated[AuthRepository, Depends(AuthRepository)]
@@ -1,7 +1,8 @@
 from uuid import UUID
-from typing import Annotated, Optional
+from typing import Annotated, Dict, Optional
 from fastapi import Depends
 from sqlalchemy import delete, select
+from app.database_models.board import Board
 from app.database_models.board_member import BoardMember
 from app.common.repository import BaseRepository
 from app.core.database import DBSessionDep
@@ -18,6 +19,20 @@ class BoardMemberRepository(BaseRepository[BoardMember]):
         result = await self.session.execute(q)
         return list(result.scalars().all())
 
+    async def get_roles(self, board_id: UUID) -> Optional[Dict[UUID, RoleEnum]]:
+        """The role of every user with access to the board, `None` if it is missing."""
+        q = (
+            select(Board.owner_id, BoardMember.user_id, BoardMember.role)
+            .outerjoin(BoardMember, BoardMember.board_id == Board.id)
+            .where(Board.id == board_id)
+        )
+        rows = (await self.session.execute(q)).all()
+        if not rows:
+            return None
+        roles = {user_id: role for _, user_id, role in rows if user_id is not None}
+        roles[rows[0].owner_id] = RoleEnum.owner
+        return roles
+
     async def get_by_user_id(self, board_id: UUID, user_id: UUID) -> BoardMember | None:
         q = select(BoardMember).where(
             BoardMember.board_id == board_id,
@@ -32,7 +47,7 @@ class BoardMemberRepository(BaseRepository[BoardMember]):
     ) -> BoardMember:
         bm = BoardMember(board_id=board_id, user_id=user_id, role=role)
         self.session.add(bm)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(bm)
         return bm
 
@@ -42,7 +57,6 @@ class BoardMemberRepository(BaseRepository[BoardMember]):
             BoardMember.user_id == user_id,
         )
         await self.session.execute(q)
-        await self.session.commit()
 
 
 BoardMemberRepositoryDep = Annotated[
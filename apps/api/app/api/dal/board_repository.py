@@ -1,14 +1,153 @@
 from uuid import UUID
-from typing import List, Optional, Annotated
+from datetime import datetime
+from typing import Iterable, List, Optional, Annotated, Tuple
 from fastapi import Depends
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
+from collections import defaultdict
+from enum import Enum
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    and_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    literal_column,
+    select,
+    or_,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from app.database_models.board import Board
 from app.database_models.table import Table
 from app.database_models.row import Row
 from app.database_models.board_member import BoardMember
+from app.database_models.board_change import BoardChange
+from app.database_models.row_owner import RowOwner
 from app.common.repository import BaseRepository
-from app.core.database import DBSessionDep
+from app.core.database import DBSessionDep, run_before_commit
+from app.core.enums import ChangeEntityEnum, PriorityEnum, StatusEnum
+
+PENDING_CHANGES = "board_changes"
+ChangeBatch = Tuple[ChangeEntityEnum, List[UUID], bool]
+
+
+def _iso(column: str) -> str:
+    # Same shape as pydantic's JSON datetimes: UTC, microseconds only when set
+    # and a "Z" suffix.
+    utc = f"({column} AT TIME ZONE 'UTC')"
+    return (
+        f"""to_char({utc}, 'YYYY-MM-DD"T"HH24:MI:SS')"""
+        f""" || CASE WHEN date_trunc('second', {utc}) = {utc} THEN ''"""
+        f""" ELSE to_char({utc}, '.US') END || 'Z'"""
+    )
+
+
+def _enum_value(column: str, enum: type[Enum]) -> str:
+    # Enum columns store member names, the API exposes member values.
+    cases = " ".join(f"WHEN '{member.name}' THEN '{member.value}'" for member in enum)
+    return f"CASE {column}::text {cases} END"
+
+
+def _overdue(row: type[Row]) -> ColumnElement[bool]:
+    return func.coalesce(
+        and_(row.due_date < func.now(), row.status != StatusEnum.DONE), False
+    )
+
+
+# Renders a `BoardDetailRead` document. `:row_limit` keeps the first rows of
+# each table (NULL keeps all of them) and `nextRowsCursor` matches
+# `KeysetParams.encode_cursor`.
+BOARD_TREE_JSON = text(f"""
+SELECT json_build_object(
+    'id', b.id,
+    'name', b.name,
+    'description', b.description,
+    'ownerId', b.owner_id,
+    'memberIds', COALESCE(
+        (SELECT json_agg(bm.user_id) FROM boardmembers bm WHERE bm.board_id = b.id),
+        '[]'
+    ),
+    'position', b.position,
+    'version', b.version,
+    'changeSeq', b.change_seq,
+    'createdAt', {_iso("b.created_at")},
+    'updatedAt', {_iso("b.updated_at")},
+    'tables', COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', t.id,
+            'boardId', t.board_id,
+            'name', t.name,
+            'description', t.description,
+            'position', t.position,
+            'color', t.color,
+            'version', t.version,
+            'createdAt', {_iso("t.created_at")},
+            'updatedAt', {_iso("t.updated_at")},
+            'rows', COALESCE(tr.rows, '[]'),
+            'nextRowsCursor', tr.next_rows_cursor
+        ) ORDER BY t.position)
+        FROM tables t
+        LEFT JOIN LATERAL (
+            SELECT
+                json_agg(json_build_object(
+                    'id', r.id,
+                    'tableId', r.table_id,
+                    'name', r.name,
+                    'owners', COALESCE((
+                        SELECT json_agg(json_build_object(
+                            'id', u.id,
+                            'firstName', u.first_name,
+                            'lastName', u.last_name,
+                            'email', u.email,
+                            'avatarUrl', u.avatar_url
+                        ))
+                        FROM row_owners ro JOIN users u ON u.id = ro.user_id
+                        WHERE ro.row_id = r.id
+                    ), '[]'),
+                    'status', {_enum_value("r.status", StatusEnum)},
+                    'priority', {_enum_value("r.priority", PriorityEnum)},
+                    'dueDate', {_iso("r.due_date")},
+                    'position', r.position,
+                    'version', r.version,
+                    'createdAt', {_iso("r.created_at")},
+                    'updatedAt', {_iso("r.updated_at")}
+                ) ORDER BY r.rank) FILTER (
+                    WHERE :row_limit IS NULL OR r.position <= :row_limit
+                ) AS rows,
+                CASE WHEN count(*) > :row_limit THEN translate(
+                    encode(convert_to(
+                        :row_limit || ':' || max(r.rank) FILTER (
+                            WHERE r.position <= :row_limit
+                        ),
+                        'UTF8'
+                    ), 'base64'),
+                    E'+/\\n',
+                    '-_'
+                ) END AS next_rows_cursor
+            FROM (
+                SELECT r.*, row_number() OVER (ORDER BY r.rank) AS position
+                FROM rows r
+                WHERE r.table_id = t.id
+                ORDER BY r.rank
+                LIMIT :row_limit + 1
+            ) r
+        ) tr ON true
+        WHERE t.board_id = b.id
+    ), '[]')
+)::text
+FROM boards b
+WHERE b.id = :board_id
+""").bindparams(  # noqa: S608
+    bindparam("board_id", type_=PGUUID(as_uuid=True)),
+    bindparam("row_limit", type_=Integer),
+)
 
 
 class BoardRepository(BaseRepository[Board]):
@@ -16,23 +155,75 @@ class BoardRepository(BaseRepository[Board]):
         super().__init__(Board, Board.id, session)
         self.session = session
 
-    async def list_for_user(self, user_id: UUID) -> List[Board]:
+    async def list_page_for_user(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        name_prefix: Optional[str] = None,
+    ) -> List[Tuple[Board, int]]:
+        """
+        Up to `limit` boards of the user with their member counts, newest
+        first, walking the (updated_at, id) key after `after`.
+        """
+        member_count = (
+            select(func.count())
+            .where(BoardMember.board_id == Board.id)
+            .correlate(Board)
+            .scalar_subquery()
+        )
         q = (
-            select(Board)
-            .outerjoin(BoardMember, BoardMember.board_id == Board.id)
-            .where(
-                or_(
-                    Board.owner_id == user_id,
-                    BoardMember.user_id == user_id,
-                ),
-            )
-            .options(selectinload(Board.members))
-            .order_by(Board.updated_at.desc(), Board.created_at.desc())
+            select(Board, member_count)
+            .where(self._listed_for(user_id, name_prefix))
+            .order_by(Board.updated_at.desc(), Board.id.desc())
+            .limit(limit)
         )
-        res = await self.session.execute(q)
-        return list(res.unique().scalars().all())
+        if after is not None:
+            q = q.where(tuple_(Board.updated_at, Board.id) < tuple_(*after))
+        result = await self.session.execute(q)
+        return [(board, int(count)) for board, count in result.all()]
+
+    async def count_for_user(
+        self, user_id: UUID, name_prefix: Optional[str] = None
+    ) -> int:
+        return await self.get_count(self._listed_for(user_id, name_prefix))
 
-    async def get_full_tree(self, board_id: UUID, user_id: UUID) -> Optional[Board]:
+    @staticmethod
+    def _listed_for(user_id: UUID, name_prefix: Optional[str]) -> ColumnElement[bool]:
+        criteria = or_(
+            Board.owner_id == user_id,
+            exists().where(
+                BoardMember.board_id == Board.id, BoardMember.user_id == user_id
+            ),
+        )
+        if name_prefix:
+            criteria = and_(
+                criteria, Board.name.istartswith(name_prefix, autoescape=True)
+            )
+        return criteria
+
+    async def get_full_tree(  # noqa: PLR0913
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        rows_per_table: Optional[int] = None,
+        *,
+        with_tables: bool = True,
+        with_rows: bool = True,
+        with_owners: bool = True,
+    ) -> Optional[Board]:
+        """
+        The board with members, tables, rows and row owners. With
+        `rows_per_table`, each table only gets its first `rows_per_table` rows.
+        Tables, rows or owners that are left out are not queried and read as
+        empty.
+        """
+        with_rows = with_tables and with_rows
+        tables_option = selectinload(Board.tables)
+        if with_rows and rows_per_table is None:
+            tables_option = tables_option.selectinload(Table.rows)
+            if with_owners:
+                tables_option = tables_option.selectinload(Row.owner_users)
         q = (
             select(Board)
             .outerjoin(BoardMember, BoardMember.board_id == Board.id)
@@ -46,15 +237,250 @@ class BoardRepository(BaseRepository[Board]):
             .options(
                 selectinload(Board.members).selectinload(BoardMember.user),
                 selectinload(Board.owner),
-                selectinload(Board.tables)
-                .selectinload(Table.rows)
-                .selectinload(Row.owner_users),
             )
         )
+        if with_tables:
+            q = q.options(tables_option)
         res = await self.session.execute(q)
         board: Optional[Board] = res.unique().scalars().one_or_none()
+        if board is None:
+            return None
+        if not with_tables:
+            set_committed_value(board, "tables", [])
+        if with_rows and rows_per_table is not None:
+            await self._load_first_rows(board.tables, rows_per_table, with_owners)
+        for table in board.tables:
+            if not with_rows:
+                set_committed_value(table, "rows", [])
+            elif not with_owners:
+                for row in table.rows:
+                    set_committed_value(row, "owner_users", [])
         return board
 
+    async def get_full_tree_json(
+        self, board_id: UUID, rows_per_table: Optional[int] = None
+    ) -> Optional[str]:
+        """The `BoardDetailRead` JSON of a board, rendered by Postgres."""
+        payload: Optional[str] = await self.session.scalar(
+            BOARD_TREE_JSON, {"board_id": board_id, "row_limit": rows_per_table}
+        )
+        return payload
+
+    async def _load_first_rows(
+        self, tables: List[Table], limit: int, with_owners: bool = True
+    ) -> None:
+        """
+        Load the first `limit` rows of every table in one query. A LATERAL
+        subquery walks the (table_id, rank) key of each table, so the cost does
+        not depend on how many rows the tables hold.
+        """
+        if not tables:
+            return
+        ranked = aliased(Row)
+        first_rows = (
+            select(ranked.id)
+            .where(ranked.table_id == Table.id)
+            .order_by(ranked.rank.asc())
+            .limit(limit)
+            .correlate(Table)
+            .lateral()
+        )
+        q = (
+            select(Row)
+            .select_from(Table)
+            .join(first_rows, true())
+            .join(Row, Row.id == first_rows.c.id)
+            .where(Table.id.in_([table.id for table in tables]))
+            .order_by(Row.table_id, Row.rank.asc())
+        )
+        if with_owners:
+            q = q.options(selectinload(Row.owner_users))
+        rows_by_table = defaultdict(list)
+        for row in (await self.session.scalars(q)).all():
+            rows_by_table[row.table_id].append(row)
+        for table in tables:
+            set_committed_value(table, "rows", rows_by_table[table.id])
+
+    async def record_changes(
+        self,
+        board_id: UUID,
+        entity: ChangeEntityEnum,
+        entity_ids: Iterable[UUID],
+        deleted: bool = False,
+    ) -> None:
+        """
+        Log `entity_ids` as changed under the board's next `change_seq`. The
+        entries are written right before the request commits: bumping the
+        sequence locks the board row until commit, which keeps sequence numbers
+        of a board visible in order, and deferring it keeps concurrent writers
+        of the board waiting only for each other's commit.
+        """
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if not entity_ids:
+            return
+        pending = self.session.info.setdefault(PENDING_CHANGES, [])
+        pending.append((board_id, entity, entity_ids, deleted))
+        run_before_commit(self.session, PENDING_CHANGES, self._write_changes)
+
+    async def _write_changes(self) -> None:
+        batches: defaultdict[UUID, List[ChangeBatch]] = defaultdict(list)
+        for board_id, entity, entity_ids, deleted in self.session.info.pop(
+            PENDING_CHANGES, []
+        ):
+            batches[board_id].append((entity, entity_ids, deleted))
+
+        # Boards are locked in id order so that requests touching several
+        # boards cannot deadlock.
+        for board_id in sorted(batches):
+            board_batches = batches[board_id]
+            # The clock is read under the lock, so entries of a board are
+            # created in `seq` order and pruning by age leaves no gaps.
+            bumped = (
+                await self.session.execute(
+                    update(Board)
+                    .where(Board.id == board_id)
+                    .values(
+                        change_seq=Board.change_seq + len(board_batches),
+                        updated_at=Board.updated_at,
+                    )
+                    .returning(Board.change_seq, func.clock_timestamp())
+                )
+            ).first()
+            if bumped is None:
+                continue
+            last_seq, created_at = bumped
+            first_seq = last_seq - len(board_batches) + 1
+            await self.session.execute(
+                insert(BoardChange),
+                [
+                    {
+                        "board_id": board_id,
+                        "seq": seq,
+                        "entity": entity,
+                        "entity_id": entity_id,
+                        "deleted": deleted,
+                        "created_at": created_at,
+                    }
+                    for seq, (entity, entity_ids, deleted) in enumerate(
+                        board_batches, first_seq
+                    )
+                    for entity_id in entity_ids
+                ],
+            )
+
+    async def get_change_seq(self, board_id: UUID) -> Optional[int]:
+        q = select(Board.change_seq).where(Board.id == board_id)
+        change_seq: Optional[int] = await self.session.scalar(q)
+        return change_seq
+
+    async def get_oldest_change_seq(self, board_id: UUID) -> Optional[int]:
+        q = select(func.min(BoardChange.seq)).where(BoardChange.board_id == board_id)
+        seq: Optional[int] = await self.session.scalar(q)
+        return seq
+
+    async def prune_changes(self, before: datetime, batch_size: int) -> int:
+        """
+        Delete up to `batch_size` change log entries created before `before`,
+        walking the creation index, and return how many were deleted.
+        """
+        key = (
+            BoardChange.board_id,
+            BoardChange.seq,
+            BoardChange.entity,
+            BoardChange.entity_id,
+        )
+        expired = (
+            select(*key)
+            .where(BoardChange.created_at < before)
+            .order_by(BoardChange.created_at)
+            .limit(batch_size)
+        )
+        result = await self.session.execute(
+            delete(BoardChange)
+            .where(tuple_(*key).in_(expired))
+            .returning(BoardChange.seq)
+        )
+        return len(result.all())
+
+    async def list_changes(
+        self, board_id: UUID, since: int, until: int
+    ) -> List[Tuple[ChangeEntityEnum, UUID, bool]]:
+        """
+        The last change of every entity touched in `(since, until]`, as
+        (entity, entity_id, deleted).
+        """
+        q = (
+            select(BoardChange.entity, BoardChange.entity_id, BoardChange.deleted)
+            .where(
+                BoardChange.board_id == board_id,
+                BoardChange.seq > since,
+                BoardChange.seq <= until,
+            )
+            .order_by(BoardChange.entity, BoardChange.entity_id, BoardChange.seq.desc())
+            .distinct(BoardChange.entity, BoardChange.entity_id)
+        )
+        result = await self.session.execute(q)
+        return [(entity, entity_id, deleted) for entity, entity_id, deleted in result]
+
+    async def list_tables(self, board_id: UUID, table_ids: List[UUID]) -> List[Table]:
+        if not table_ids:
+            return []
+        q = (
+            select(Table)
+            .where(Table.board_id == board_id, Table.id.in_(table_ids))
+            .order_by(Table.position)
+        )
+        return list((await self.session.scalars(q)).all())
+
+    async def count_rows(
+        self, board_id: UUID
+    ) -> List[Tuple[UUID, Optional[StatusEnum], Optional[PriorityEnum], bool, int]]:
+        """
+        Row counts of the board's tables grouped by (table, status, priority,
+        overdue), tables in order. A table without rows has one group with a
+        count of 0.
+        """
+        overdue = _overdue(Row).label("overdue")
+        q = (
+            select(Table.id, Row.status, Row.priority, overdue, func.count(Row.id))
+            .select_from(Table)
+            .outerjoin(Row, Row.table_id == Table.id)
+            .where(Table.board_id == board_id)
+            .group_by(
+                Table.id,
+                Table.position,
+                Row.status,
+                Row.priority,
+                literal_column(overdue.name),
+            )
+            .order_by(Table.position)
+        )
+        result = await self.session.execute(q)
+        return [
+            (table_id, status, priority, bool(is_overdue), int(count))
+            for table_id, status, priority, is_overdue, count in result.all()
+        ]
+
+    async def count_rows_by_owner(self, board_id: UUID) -> List[Tuple[UUID, int, int]]:
+        """(user_id, owned rows, owned overdue rows) for every row owner of the board."""
+        q = (
+            select(
+                RowOwner.user_id,
+                func.count(),
+                func.count().filter(_overdue(Row)),
+            )
+            .join(Row, Row.id == RowOwner.row_id)
+            .join(Table, Table.id == Row.table_id)
+            .where(Table.board_id == board_id)
+            .group_by(RowOwner.user_id)
+            .order_by(func.count().desc(), RowOwner.user_id)
+        )
+        result = await self.session.execute(q)
+        return [
+            (user_id, int(count), int(overdue))
+            for user_id, count, overdue in result.all()
+        ]
+
     async def get_for_user(self, board_id: UUID, user_id: UUID) -> Optional[Board]:
         q = (
             select(Board)
@@ -75,6 +501,18 @@ class BoardRepository(BaseRepository[Board]):
         board: Optional[Board] = res.unique().scalars().one_or_none()
         return board
 
+    async def get_with_members(self, board_id: UUID) -> Optional[Board]:
+        q = (
+            select(Board)
+            .where(Board.id == board_id)
+            .options(
+                selectinload(Board.members).selectinload(BoardMember.user),
+                selectinload(Board.owner),
+            )
+        )
+        board: Optional[Board] = await self.session.scalar(q)
+        return board
+
     async def get(self, board_id: UUID) -> Optional[Board]:
         q = select(Board).where(Board.id == board_id)
         res = await self.session.execute(q)
@@ -83,14 +521,16 @@ class BoardRepository(BaseRepository[Board]):
 
     async def create(self, board: Board) -> Board:
         self.session.add(board)
-        await self.session.commit()
+        await self.session.flush()
         q = select(Board).where(Board.id == board.id).options(selectinload(Board.members))
         result = await self.session.execute(q)
         created_board: Board = result.scalar_one()
         return created_board
 
-    async def update(self, board: Board, data: dict) -> Board:
-        return await self.update_entity(board, **data)
+    async def update(
+        self, board: Board, data: dict, expected_version: Optional[int] = None
+    ) -> Board:
+        return await self.update_returning(board, data, expected_version=expected_version)
 
     async def delete(self, board_id: UUID, user_id: UUID) -> None:
         board = await self.get_for_user(board_id, user_id)
@@ -98,7 +538,7 @@ class BoardRepository(BaseRepository[Board]):
             return
 
         await self.session.delete(board)
-        await self.session.commit()
+        await self.session.flush()
 
 
 BoardRepositoryDep = Annotated[BoardRepository, Depends(BoardRepository)]
@@ -1,9 +1,11 @@
 from uuid import UUID
-from typing import Annotated
+from typing import Annotated, List
 from fastapi import Depends
-from sqlalchemy import insert, delete
+from sqlalchemy import insert, delete, select, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.database_models.row import Row
 from app.database_models.row_owner import RowOwner
+from app.database_models.user import User
 from app.common.repository import BaseRepository
 from app.core.database import DBSessionDep
 
@@ -23,5 +25,32 @@ class RowOwnerRepository(BaseRepository[Row]):
             delete(RowOwner).where(RowOwner.row_id == row_id, RowOwner.user_id == user_id)
         )
 
+    async def replace(self, row_id: UUID, user_ids: List[UUID]) -> List[User]:
+        """
+        Make `user_ids` the exact owner set of the row in one round trip: a
+        DELETE of owners outside the set and an INSERT ... ON CONFLICT DO NOTHING
+        of the missing ones run as CTEs of the SELECT that returns the owners.
+        Unknown user ids are skipped and simply absent from the result.
+        """
+        removed = (
+            delete(RowOwner)
+            .where(RowOwner.row_id == row_id, RowOwner.user_id.not_in(user_ids))
+            .cte("removed_owners")
+        )
+        added = (
+            pg_insert(RowOwner)
+            .from_select(
+                ["row_id", "user_id"],
+                select(literal(row_id, RowOwner.row_id.type), User.id).where(
+                    User.id.in_(user_ids)
+                ),
+            )
+            .on_conflict_do_nothing()
+            .cte("added_owners")
+        )
+        q = select(User).where(User.id.in_(user_ids)).add_cte(removed, added)
+        result = await self.session.execute(q)
+        return list(result.scalars().all())
+
 
 RowOwnerRepositoryDep = Annotated[RowOwnerRepository, Depends(RowOwnerRepository)]
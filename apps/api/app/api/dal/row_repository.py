@@ -1,10 +1,14 @@
 from uuid import UUID
-from typing import List, Optional, Annotated
+from typing import AsyncIterator, List, Optional, Annotated, Sequence, Tuple
 from fastapi import Depends
-from sqlalchemy import select, update, func
+from sqlalchemy import RowMapping, select, update, delete, func, case
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from app.database_models.row import Row
+from app.database_models.table import Table
+from app.database_models.row_owner import RowOwner
 from app.common.repository import BaseRepository
+from app.common.rank import rank_between, spaced_ranks
 from app.core.database import DBSessionDep
 
 
@@ -18,7 +22,7 @@ class RowRepository(BaseRepository[Row]):
             select(Row)
             .options(selectinload(Row.owner_users))
             .where(Row.table_id == table_id)
-            .order_by(Row.position.asc())
+            .order_by(Row.rank.asc())
         )
         res = await self.session.execute(stmt)
         return list(res.unique().scalars().all())
@@ -28,46 +32,277 @@ class RowRepository(BaseRepository[Row]):
             select(Row)
             .options(selectinload(Row.owner_users))
             .where(Row.id == row_id, Row.table_id == table_id)
-            .order_by(Row.position.asc())
         )
         result = await self.session.execute(q)
         row: Optional[Row] = result.scalar_one_or_none()
         return row
 
-    async def create(self, row: Row) -> Row:
-        if row.position > 0:
-            max_position = (
-                await self.session.execute(
-                    select(func.max(Row.position)).where(Row.table_id == row.table_id)
-                )
-            ).scalar_one() or 0
-            row.position = max_position + 1
-        else:
-            await self.session.execute(
-                update(Row)
-                .where(Row.table_id == row.table_id, Row.position >= row.position)
-                .values(position=Row.position + 1)
-            )
+    async def get_many(
+        self, row_ids: List[UUID], table_id: UUID, lock: bool = False
+    ) -> List[Row]:
+        """Rows of `table_id` among `row_ids`; `lock` locks them in id order."""
+        if not row_ids:
+            return []
+        q = (
+            select(Row)
+            .options(selectinload(Row.owner_users))
+            .where(Row.id.in_(row_ids), Row.table_id == table_id)
+            .execution_options(populate_existing=True)
+        )
+        if lock:
+            q = q.order_by(Row.id).with_for_update(of=Row)
+        result = await self.session.execute(q)
+        return list(result.scalars().all())
 
-        self.session.add(row)
-        await self.session.commit()
+    async def list_page(
+        self,
+        table_id: UUID,
+        after_rank: Optional[str],
+        limit: int,
+        with_owners: bool = True,
+    ) -> List[Row]:
+        """Up to `limit` rows after `after_rank`, walking the (table_id, rank) key."""
+        q = (
+            select(Row)
+            .where(Row.table_id == table_id)
+            .order_by(Row.rank.asc())
+            .limit(limit)
+        )
+        if after_rank is not None:
+            q = q.where(Row.rank > after_rank)
+        if with_owners:
+            q = q.options(selectinload(Row.owner_users))
+        result = await self.session.execute(q)
+        rows = list(result.scalars().all())
+        if not with_owners:
+            for row in rows:
+                set_committed_value(row, "owner_users", [])
+        return rows
 
-        q = select(Row).options(selectinload(Row.owner_users)).where(Row.id == row.id)
+    async def list_with_positions(
+        self, board_id: UUID, row_ids: List[UUID]
+    ) -> List[Tuple[Row, int]]:
+        """The rows of `board_id` among `row_ids`, with their positions."""
+        if not row_ids:
+            return []
+        positions = (
+            select(
+                Row.id,
+                func.row_number()
+                .over(partition_by=Row.table_id, order_by=Row.rank)
+                .label("position"),
+            )
+            .where(Row.table_id.in_(select(Row.table_id).where(Row.id.in_(row_ids))))
+            .subquery()
+        )
+        q = (
+            select(Row, positions.c.position)
+            .join(positions, positions.c.id == Row.id)
+            .join(Table, Table.id == Row.table_id)
+            .where(Row.id.in_(row_ids), Table.board_id == board_id)
+            .order_by(Row.table_id, Row.rank.asc())
+            .options(selectinload(Row.owner_users))
+        )
         result = await self.session.execute(q)
-        created_row: Row = result.scalar_one()
-        return created_row
+        return [(row, int(position)) for row, position in result.all()]
+
+    async def stream_for_export(
+        self, table_id: UUID, batch_size: int
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        Columns of the rows of `table_id` in rank order with their owner ids,
+        fetched `batch_size` at a time through a server-side cursor.
+        """
+        owner_ids = (
+            select(func.array_agg(RowOwner.user_id))
+            .where(RowOwner.row_id == Row.id)
+            .scalar_subquery()
+            .label("owner_ids")
+        )
+        q = (
+            select(
+                Row.id,
+                Row.name,
+                Row.status,
+                Row.priority,
+                Row.due_date,
+                Row.created_at,
+                Row.updated_at,
+                owner_ids,
+            )
+            .where(Row.table_id == table_id)
+            .order_by(Row.rank.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(q)
+        async for batch in result.mappings().partitions():
+            yield batch
 
-    async def update(self, row: Row, data: dict) -> Row:
-        updated_row = await self.update_entity(row, **data)
+    async def share_ranks(self, table_id: UUID) -> None:
+        """
+        Keep `rebalance` off `table_id` until commit. Call it before reading
+        ranks to place rows. Writers only share the lock, so they never wait
+        for each other.
+        """
+        await self.session.execute(
+            select(Table.id).where(Table.id == table_id).with_for_update(key_share=True)
+        )
 
+    async def list_ranks(self, table_id: UUID) -> List[Tuple[UUID, str]]:
         q = (
-            select(Row)
-            .options(selectinload(Row.owner_users))
-            .where(Row.id == updated_row.id)
+            select(Row.id, Row.rank)
+            .where(Row.table_id == table_id)
+            .order_by(Row.rank.asc())
+        )
+        result = await self.session.execute(q)
+        return [(row_id, rank) for row_id, rank in result.all()]
+
+    async def lock_for_move(
+        self, row_ids: List[UUID], board_id: UUID
+    ) -> List[Tuple[UUID, UUID, str]]:
+        """(id, table_id, name) of the rows of `board_id` among `row_ids`, locked."""
+        q = (
+            select(Row.id, Row.table_id, Row.name)
+            .join(Table, Table.id == Row.table_id)
+            .where(Row.id.in_(row_ids), Table.board_id == board_id)
+            .with_for_update(of=Row)
         )
         result = await self.session.execute(q)
-        updated_row_full: Row = result.scalar_one()
-        return updated_row_full
+        return [(row_id, table_id, name) for row_id, table_id, name in result.all()]
+
+    async def neighbour_ranks(
+        self, table_id: UUID, position: int, exclude_row_ids: List[UUID]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Ranks of the rows that end up just before and after the 1-based
+        `position` once `exclude_row_ids` are taken out. Past the end, the row
+        before is the last one.
+        """
+        filters = (Row.table_id == table_id, Row.id.not_in(exclude_row_ids))
+        q = select(Row.rank).where(*filters).order_by(Row.rank.asc())
+
+        if position <= 1:
+            return None, await self.session.scalar(q.limit(1))
+
+        result = await self.session.scalars(q.offset(position - 2).limit(2))
+        neighbours = list(result.all())
+        if not neighbours:
+            return await self.session.scalar(
+                select(func.max(Row.rank)).where(*filters)
+            ), None
+        return neighbours[0], neighbours[1] if len(neighbours) > 1 else None
+
+    async def get_position(self, row: Row) -> int:
+        q = select(func.count()).where(Row.table_id == row.table_id, Row.rank < row.rank)
+        return int(await self.session.scalar(q) or 0) + 1
+
+    async def get_last_rank(self, table_id: UUID) -> Optional[str]:
+        q = select(func.max(Row.rank)).where(Row.table_id == table_id)
+        last_rank: Optional[str] = await self.session.scalar(q)
+        return last_rank
+
+    async def rank_for_position(
+        self, table_id: UUID, position: int, exclude_row_id: Optional[UUID] = None
+    ) -> Optional[str]:
+        """
+        Rank that places a row at the 1-based `position` of the table, or `None`
+        when the position is past the end. Only the two neighbours are read.
+        """
+        q = select(Row.rank).where(Row.table_id == table_id).order_by(Row.rank.asc())
+        if exclude_row_id is not None:
+            q = q.where(Row.id != exclude_row_id)
+
+        if position <= 1:
+            first = await self.session.scalar(q.limit(1))
+            return rank_between(None, first)
+
+        result = await self.session.scalars(q.offset(position - 2).limit(2))
+        neighbours = list(result.all())
+        if not neighbours:
+            return None
+        return rank_between(neighbours[0], neighbours[1] if len(neighbours) > 1 else None)
+
+    async def append(self, row: Row) -> None:
+        """
+        Insert `row` after the last row of its table. The last rank is read
+        backwards from the (table_id, rank) index, so no other rows are
+        visited.
+        """
+        q = (
+            select(Row.rank)
+            .where(Row.table_id == row.table_id)
+            .order_by(Row.rank.desc())
+            .limit(1)
+        )
+        row.rank = rank_between(await self.session.scalar(q), None)
+
+        self.session.add(row)
+        await self.session.flush()
+        set_committed_value(row, "owner_users", [])
+
+    async def update(
+        self, row: Row, data: dict, expected_version: Optional[int] = None
+    ) -> Row:
+        return await self.update_returning(row, data, expected_version=expected_version)
+
+    async def move_many(self, table_id: UUID, ranks: dict[UUID, str]) -> None:
+        """Move every row in `ranks` into `table_id` with one UPDATE."""
+        await self.session.execute(
+            update(Row)
+            .where(Row.id.in_(ranks))
+            .values(
+                table_id=table_id,
+                rank=case(ranks, value=Row.id),
+                version=Row.version + 1,
+            )
+        )
+
+    async def apply_batch(
+        self, created: List[Row], updates: List[dict], deleted_ids: List[UUID]
+    ) -> None:
+        """
+        Write a batch of row changes: a multi-row INSERT,
+        an executemany UPDATE keyed by id, and a single DELETE ... WHERE id IN.
+        """
+        if created:
+            self.session.add_all(created)
+            await self.session.flush()
+        if updates:
+            await self.session.execute(update(Row), updates)
+        if deleted_ids:
+            await self.session.execute(delete(Row).where(Row.id.in_(deleted_ids)))
+
+    async def rebalance(self, table_id: UUID) -> Optional[Tuple[UUID, List[UUID]]]:
+        """
+        Respace the ranks of `table_id` and bump the version of every row. The
+        table is locked first, which waits for the writers placing rows in it
+        (see `share_ranks`) and holds new ones off until commit. Returns the
+        board id and the row ids, or `None` when the table is gone.
+        """
+        board_id = await self.session.scalar(
+            select(Table.board_id).where(Table.id == table_id).with_for_update()
+        )
+        if board_id is None:
+            return None
+
+        q = (
+            select(Row.id, Row.version)
+            .where(Row.table_id == table_id)
+            .order_by(Row.rank.asc())
+            .with_for_update()
+        )
+        rows = (await self.session.execute(q)).all()
+        if rows:
+            await self.session.execute(
+                update(Row),
+                [
+                    {"id": row_id, "rank": rank, "version": version + 1}
+                    for (row_id, version), rank in zip(
+                        rows, spaced_ranks(len(rows)), strict=True
+                    )
+                ],
+            )
+        return board_id, [row_id for row_id, _ in rows]
 
     async def delete(self, row_id: UUID, table_id: UUID) -> None:
         row = await self.get(row_id, table_id)
@@ -75,7 +310,7 @@ class RowRepository(BaseRepository[Row]):
             return
 
         await self.session.delete(row)
-        await self.session.commit()
+        await self.session.flush()
 
 
 RowRepositoryDep = Annotated[RowRepository, Depends(RowRepository)]
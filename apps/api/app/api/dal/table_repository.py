@@ -1,14 +1,14 @@
 from uuid import UUID
 from fastapi import Depends
-from typing import List, Optional, Annotated
-from sqlalchemy import select
+from typing import List, Optional, Annotated, Tuple
+from sqlalchemy import select, update, case, insert, func, inspect
 from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.database import DBSessionDep
 from app.common.repository import BaseRepository
 from app.database_models.table import Table
 from app.database_models.row import Row
-from app.database_models.board_member import BoardMember
 
 
 class TableRepository(BaseRepository[Table]):
@@ -16,15 +16,27 @@ class TableRepository(BaseRepository[Table]):
         super().__init__(Table, Table.id, session)
         self.session = session
 
-    async def list_by_board(self, board_id: UUID) -> List[Table]:
-        q = (
-            select(Table)
-            .where(Table.board_id == board_id)
-            .options(selectinload(Table.rows).selectinload(Row.owner_users))
-            .order_by(Table.position)
-        )
+    async def list_by_board(
+        self, board_id: UUID, with_rows: bool = True, with_owners: bool = True
+    ) -> List[Table]:
+        """
+        Tables of the board with rows and their owners. Rows or owners that are
+        left out are not queried and read as empty.
+        """
+        q = select(Table).where(Table.board_id == board_id).order_by(Table.position)
+        if with_rows and with_owners:
+            q = q.options(selectinload(Table.rows).selectinload(Row.owner_users))
+        elif with_rows:
+            q = q.options(selectinload(Table.rows))
         res = await self.session.execute(q)
-        return list(res.unique().scalars().all())
+        tables = list(res.unique().scalars().all())
+        for table in tables:
+            if not with_rows:
+                set_committed_value(table, "rows", [])
+            elif not with_owners:
+                for row in table.rows:
+                    set_committed_value(row, "owner_users", [])
+        return tables
 
     async def get(self, table_id: UUID, board_id: UUID) -> Optional[Table]:
         q = (
@@ -36,38 +48,76 @@ class TableRepository(BaseRepository[Table]):
         table: Optional[Table] = result.unique().scalar_one_or_none()
         return table
 
-    async def get_by_user(self, table_id: UUID, user_id: UUID) -> Optional[Table]:
-        q = (
-            select(Table)
-            .join(BoardMember, Table.board_id == BoardMember.board_id)
-            .where(
-                Table.id == table_id,
-                BoardMember.user_id == user_id,
-            )
-            .options(joinedload(Table.rows))
+    async def get_board_id(self, table_id: UUID) -> Optional[UUID]:
+        board_id: Optional[UUID] = await self.session.scalar(
+            select(Table.board_id).where(Table.id == table_id)
         )
-        result = await self.session.execute(q)
-        table: Optional[Table] = result.unique().scalar_one_or_none()
-        return table
+        return board_id
 
-    async def create(self, table: Table) -> Table:
-        self.session.add(table)
-        await self.session.commit()
+    async def append(self, table: Table) -> Table:
+        """
+        Insert `table` after the last table of its board. The next position is
+        computed inside the INSERT itself, so existing tables are never loaded.
+        """
+        next_position = (
+            select(func.coalesce(func.max(Table.position), 0) + 1)
+            .where(Table.board_id == table.board_id)
+            .scalar_subquery()
+        )
+        values = {
+            attr.key: value
+            for attr in inspect(Table).column_attrs
+            if (value := getattr(table, attr.key)) is not None
+        }
+        values["position"] = next_position
 
-        q = select(Table).where(Table.id == table.id).options(selectinload(Table.rows))
-        result = await self.session.execute(q)
+        result = await self.session.execute(
+            insert(Table).values(**values).returning(Table)
+        )
         created_table: Table = result.scalar_one()
+        set_committed_value(created_table, "rows", [])
         return created_table
 
-    async def update(self, table: Table, data: dict) -> Table:
-        return await self.update_entity(table, **data)
+    async def update(
+        self, table: Table, data: dict, expected_version: Optional[int] = None
+    ) -> Table:
+        return await self.update_returning(table, data, expected_version=expected_version)
+
+    async def list_positions(self, board_id: UUID) -> List[Tuple[UUID, int, int]]:
+        q = (
+            select(Table.id, Table.position, Table.version)
+            .where(Table.board_id == board_id)
+            .order_by(Table.position, Table.created_at)
+            .with_for_update()
+        )
+        res = await self.session.execute(q)
+        return [
+            (table_id, position, version) for table_id, position, version in res.all()
+        ]
+
+    async def reorder(
+        self, board_id: UUID, positions: dict[UUID, int], moved_table_id: UUID
+    ) -> None:
+        if not positions:
+            return
+        await self.session.execute(
+            update(Table)
+            .where(Table.board_id == board_id, Table.id.in_(positions))
+            .values(
+                position=case(positions, value=Table.id),
+                version=case(
+                    (Table.id == moved_table_id, Table.version + 1),
+                    else_=Table.version,
+                ),
+            )
+        )
 
     async def delete(self, table_id: UUID, board_id: UUID) -> None:
         table = await self.get(table_id, board_id)
         if not table:
             return
         await self.session.delete(table)
-        await self.session.commit()
+        await self.session.flush()
 
 
 TableRepositoryDep = Annotated[TableRepository, Depends(TableRepository)]
@@ -1,9 +1,11 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field
 from datetime import datetime
 from app.db.base import BaseSchema
-from app.api.models.table_model import TableRead
+from app.api.models.row_model import RowRead
+from app.api.models.table_model import TableRead, TableSummaryRead
+from app.core.enums import PriorityEnum, StatusEnum
 
 
 class BoardCreate(BaseSchema):
@@ -25,6 +27,20 @@ class BoardRead(BaseSchema):
     owner_id: UUID
     member_ids: Optional[List[UUID]] = []
     position: int
+    version: int
+    change_seq: int = Field(0, description="Last change recorded for the board")
+    created_at: datetime
+    updated_at: datetime
+
+
+class BoardSummaryRead(BaseSchema):
+    id: UUID
+    name: str
+    description: Optional[str]
+    owner_id: UUID
+    member_count: int
+    position: int
+    version: int
     created_at: datetime
     updated_at: datetime
 
@@ -33,5 +49,46 @@ class BoardDetailRead(BoardRead):
     tables: List[TableRead] = []
 
 
+class BoardChangesRead(BaseSchema):
+    change_seq: int = Field(description="Pass as `since` on the next sync")
+    reload: bool = Field(
+        False,
+        description="The change log no longer reaches back to `since`: load the "
+        "full board and sync from its `changeSeq` instead",
+    )
+    board: Optional[BoardRead] = Field(None, description="The board, if it changed")
+    tables: List[TableSummaryRead] = Field([], description="Created or updated tables")
+    rows: List[RowRead] = Field([], description="Created, updated or moved rows")
+    member_ids: List[UUID] = Field([], description="Added members")
+    deleted_table_ids: List[UUID] = Field([], description="Deleted tables, with rows")
+    deleted_row_ids: List[UUID] = Field([], description="Deleted rows")
+    deleted_member_ids: List[UUID] = Field([], description="Removed members")
+
+
+class RowCountsRead(BaseSchema):
+    row_count: int = Field(description="Number of rows")
+    overdue_count: int = Field(description="Rows past their due date and not done")
+    by_status: Dict[StatusEnum, int] = Field(description="Number of rows per status")
+    by_priority: Dict[PriorityEnum, int] = Field(
+        description="Number of rows per priority"
+    )
+
+
+class TableStatsRead(RowCountsRead):
+    table_id: UUID
+
+
+class OwnerStatsRead(BaseSchema):
+    user_id: UUID
+    row_count: int = Field(description="Rows owned by the user")
+    overdue_count: int = Field(description="Owned rows past their due date and not done")
+
+
+class BoardStatsRead(RowCountsRead):
+    board_id: UUID
+    tables: List[TableStatsRead] = Field(description="Counts per table, in order")
+    owners: List[OwnerStatsRead] = Field(description="Counts per row owner")
+
+
 class AddBoardMemberRequest(BaseSchema):
     user_id: UUID = Field(..., description="ID of the user to add as a member")
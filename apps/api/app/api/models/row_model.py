@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Literal, Union, Annotated
 from pydantic import Field
 from app.core.enums import StatusEnum, PriorityEnum
 from app.db.base import BaseSchema
@@ -24,7 +24,13 @@ class RowUpdate(BaseSchema):
     status: Optional[StatusEnum] = Field(None)
     priority: Optional[PriorityEnum] = Field(None)
     due_date: Optional[datetime] = Field(None)
-    position: Optional[int] = Field(None, ge=1, le=30)
+    position: Optional[int] = Field(None, ge=1)
+
+
+class RowOwnersReplace(BaseSchema):
+    owner_ids: List[UUID] = Field(
+        ..., max_length=10, description="Complete set of owners for the row"
+    )
 
 
 class RowRead(BaseSchema):
@@ -35,15 +41,86 @@ class RowRead(BaseSchema):
     status: StatusEnum
     priority: PriorityEnum
     due_date: Optional[datetime] = None
-    position: int
+    # Always set, except on a row created with `with_position=false`.
+    position: Optional[int] = None
+    version: int
     created_at: datetime
     updated_at: datetime
 
 
 class UpdateRowPositionRequest(BaseSchema):
     new_position: int = Field(
-        ..., ge=1, le=30, description="New position for the row in the table"
+        ..., ge=1, description="New position for the row in the table"
     )
     target_table_id: Optional[UUID] = Field(
         None, description="ID of the target table if moving to a different table"
     )
+
+
+class RowMoveRequest(BaseSchema):
+    row_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Rows to move, in the order they should appear in the table",
+    )
+    new_position: int = Field(
+        ..., ge=1, description="Position of the first moved row in the table"
+    )
+
+
+class RowBatchCreate(BaseSchema):
+    op: Literal["create"]
+    name: str = Field(..., min_length=1, max_length=255)
+
+
+class RowBatchUpdate(BaseSchema):
+    op: Literal["update"]
+    row_id: UUID
+    version: Optional[int] = Field(None, description="Expected row version")
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    status: Optional[StatusEnum] = Field(None)
+    priority: Optional[PriorityEnum] = Field(None)
+    due_date: Optional[datetime] = Field(None)
+    position: Optional[int] = Field(None, ge=1)
+
+
+class RowBatchDelete(BaseSchema):
+    op: Literal["delete"]
+    row_id: UUID
+    version: Optional[int] = Field(None, description="Expected row version")
+
+
+class RowBatchMove(BaseSchema):
+    op: Literal["move"]
+    row_id: UUID
+    version: Optional[int] = Field(None, description="Expected row version")
+    new_position: int = Field(..., ge=1, description="New position for the row")
+
+
+RowBatchOperation = Annotated[
+    Union[RowBatchCreate, RowBatchUpdate, RowBatchDelete, RowBatchMove],
+    Field(discriminator="op"),
+]
+
+
+class RowBatchRequest(BaseSchema):
+    operations: List[RowBatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Operations applied in order inside a single transaction",
+    )
+
+
+class RowBatchResult(BaseSchema):
+    index: int = Field(description="Index of the operation in the request")
+    op: Literal["create", "update", "delete", "move"]
+    row_id: UUID
+    row: Optional[RowRead] = Field(
+        None, description="Row state after the batch, omitted for deleted rows"
+    )
+
+
+class RowBatchResponse(BaseSchema):
+    results: List[RowBatchResult]
@@ -21,19 +21,32 @@ class TableUpdate(BaseSchema):
     color: Optional[str] = Field(None)
 
 
-class TableRead(BaseSchema):
+class TableSummaryRead(BaseSchema):
     id: UUID = Field(description="Primary key for table")
     board_id: UUID = Field(description="Foreign key for board")
     name: str = Field(description="Table name")
     description: Optional[str] = Field(description="Table description")
     position: int = Field(description="Table order")
     color: str = Field(description="Table color")
+    version: int = Field(description="Optimistic concurrency version")
     created_at: datetime = Field(description="Table creation date")
     updated_at: datetime = Field(description="Table update date")
+
+
+class TableRead(TableSummaryRead):
     rows: List[RowRead] = Field(description="List of rows in the table")
+    next_rows_cursor: Optional[str] = Field(
+        None, description="Cursor for the rows after `rows`, when they were truncated"
+    )
 
 
 class UpdateTablePositionRequest(BaseSchema):
     new_position: int = Field(
         ..., ge=1, le=10, description="New position for the table in the board"
     )
+
+
+class TablePositionRead(BaseSchema):
+    id: UUID = Field(description="Primary key for table")
+    position: int = Field(description="Table order")
+    version: int = Field(description="Optimistic concurrency version")
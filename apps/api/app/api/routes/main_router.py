@@ -9,7 +9,8 @@ from app.api.routes.v1.table_route import router as table_router
 from app.api.routes.v1.row_route import router as row_router
 from app.api.routes.v1.health_route import router as health_router
 from app.api.routes.util import use_route_names_as_operation_ids, save_openapi_yaml
-from app.DI.current_user import CurrentUserDep
+from app.DI.current_user import CurrentPrincipalDep
+from app.DI.rate_limit import WRITE_POLICY, rate_limit
 from app.common.errors.error_model import ErrorResponseModel
 
 
@@ -72,7 +73,7 @@ def add_routes(app: FastAPI) -> None:
 
             deps = []
             if controller.protected:
-                deps.append(CurrentUserDep)
+                deps.extend([CurrentPrincipalDep, rate_limit(WRITE_POLICY)])
 
             app.include_router(
                 controller.router,
@@ -3,6 +3,7 @@ from fastapi import APIRouter, status, Response, Cookie
 from app.api.services.auth_service import AuthServiceDep
 from app.api.models.user_model import UserCreate, UserRead, UserLogin
 from app.utils.auth_cookies import set_auth_cookies, delete_auth_cookies
+from app.DI.rate_limit import LOGIN_POLICY, REGISTER_POLICY, rate_limit
 
 
 router = APIRouter()
@@ -12,6 +13,7 @@ router = APIRouter()
     "/register",
     response_model=UserRead,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[rate_limit(REGISTER_POLICY)],
 )
 async def register(
     data: UserCreate, response: Response, auth_service: AuthServiceDep
@@ -25,6 +27,7 @@ async def register(
     "/login",
     response_model=UserRead,
     status_code=status.HTTP_200_OK,
+    dependencies=[rate_limit(LOGIN_POLICY)],
 )
 async def login(
     data: UserLogin, response: Response, auth_service: AuthServiceDep
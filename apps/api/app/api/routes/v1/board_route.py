@@ -1,45 +1,141 @@
 from uuid import UUID
-from typing import List
-from fastapi import APIRouter, status
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Query, Response, status
+from fastapi.responses import StreamingResponse
 from app.api.models.board_model import (
     AddBoardMemberRequest,
     BoardCreate,
     BoardRead,
     BoardUpdate,
     BoardDetailRead,
+    BoardChangesRead,
+    BoardSummaryRead,
+    BoardStatsRead,
 )
 from app.api.services.board_service import BoardServiceDep
-from app.DI.current_user import CurrentUserDep
-from app.database_models.user import User
+from app.api.services.board_export_service import (
+    BoardExportServiceDep,
+    EXPORT_MEDIA_TYPES,
+)
+from app.common.projection import ProjectionDep
+from app.common.paging import KeysetParamsDep, PaginatedResponse
+from app.DI.current_user import CurrentPrincipalDep, Principal
+from app.DI.if_match import BoardIfMatchDep, IfNoneMatchDep
+from app.DI.rate_limit import DUPLICATE_BOARD_POLICY, rate_limit
 from app.api.models.user_model import UserRead
+from app.core.enums import ExportFormatEnum
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[BoardRead])
+@router.get(
+    "/",
+    response_model=PaginatedResponse[BoardSummaryRead],
+    description="Page through the user's boards, most recently updated first",
+)
 async def list_boards(
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
-) -> List[BoardRead]:
-    return await board_service.list_boards(current_user.id)
+    page: KeysetParamsDep,
+    name: Optional[str] = Query(
+        None, min_length=1, max_length=50, description="Board name prefix"
+    ),
+    current_user: Principal = CurrentPrincipalDep,
+) -> PaginatedResponse[BoardSummaryRead]:
+    return await board_service.list_boards(current_user.id, page, name)
 
 
 @router.post("/", response_model=BoardRead, status_code=status.HTTP_201_CREATED)
 async def create_board(
     data: BoardCreate,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> BoardRead:
     return await board_service.create_board(current_user.id, data)
 
 
-@router.get("/{board_id}", response_model=BoardDetailRead)
-async def get_board(
+@router.get(
+    "/{board_id}",
+    response_model=BoardDetailRead,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Board unchanged"}},
+)
+async def get_board(  # noqa: PLR0913
+    board_id: UUID,
+    board_service: BoardServiceDep,
+    if_none_match: IfNoneMatchDep,
+    projection: ProjectionDep,
+    rows_per_table: Optional[int] = Query(
+        None, ge=1, le=500, description="Only return the first rows of each table"
+    ),
+    current_user: Principal = CurrentPrincipalDep,
+) -> Response:
+    etag, payload = await board_service.get_board_full_tree(
+        board_id, current_user.id, if_none_match, rows_per_table, projection
+    )
+    headers = {"Cache-Control": "private, no-cache"}
+    if etag is not None:
+        headers["ETag"] = etag
+    if payload is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+@router.get("/{board_id}/changes", response_model=BoardChangesRead)
+async def get_board_changes(
+    board_id: UUID,
+    board_service: BoardServiceDep,
+    since: int = Query(..., ge=0, description="`changeSeq` of the last sync"),
+    current_user: Principal = CurrentPrincipalDep,
+) -> BoardChangesRead:
+    return await board_service.get_changes(board_id, current_user.id, since)
+
+
+@router.get(
+    "/{board_id}/stats",
+    response_model=BoardStatsRead,
+    description="Row counts per status, priority and owner, per table and overall",
+)
+async def get_board_stats(
     board_id: UUID,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
-) -> BoardDetailRead:
-    return await board_service.get_board_full_tree(board_id, current_user.id)
+    current_user: Principal = CurrentPrincipalDep,
+) -> Response:
+    payload = await board_service.get_stats(board_id, current_user.id)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"Cache-Control": "private, no-cache"},
+    )
+
+
+@router.get(
+    "/{board_id}/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}
+        }
+    },
+    description="Stream every row of the board as NDJSON or CSV, in board order",
+)
+async def export_board(
+    board_id: UUID,
+    export_service: BoardExportServiceDep,
+    export_format: Annotated[
+        ExportFormatEnum, Query(alias="format")
+    ] = ExportFormatEnum.NDJSON,
+    current_user: Principal = CurrentPrincipalDep,
+) -> StreamingResponse:
+    body = await export_service.export_rows(board_id, current_user.id, export_format)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="board-{board_id}.{export_format.value}"'
+            ),
+            "Cache-Control": "no-store",
+        },
+    )
 
 
 @router.patch("/{board_id}", response_model=BoardRead)
@@ -47,16 +143,19 @@ async def update_board(
     board_id: UUID,
     data: BoardUpdate,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    if_match: BoardIfMatchDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> BoardRead:
-    return await board_service.update_board(board_id, current_user.id, data)
+    return await board_service.update_board(
+        board_id, current_user.id, data, if_match.version, if_match.etag
+    )
 
 
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_board(
     board_id: UUID,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> None:
     await board_service.delete_board(board_id, current_user.id)
 
@@ -66,7 +165,7 @@ async def add_member(
     board_id: UUID,
     data: AddBoardMemberRequest,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> UUID:
     return await board_service.add_member(board_id, current_user.id, data.user_id)
 
@@ -76,18 +175,21 @@ async def remove_member(
     board_id: UUID,
     user_id: UUID,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> None:
     await board_service.remove_member(board_id, current_user.id, user_id)
 
 
 @router.post(
-    "/{board_id}/duplicate", response_model=BoardRead, status_code=status.HTTP_201_CREATED
+    "/{board_id}/duplicate",
+    response_model=BoardRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[rate_limit(DUPLICATE_BOARD_POLICY)],
 )
 async def duplicate_board(
     board_id: UUID,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> BoardRead:
     return await board_service.duplicate_board(board_id, current_user.id)
 
@@ -96,6 +198,6 @@ async def duplicate_board(
 async def get_board_members(
     board_id: UUID,
     board_service: BoardServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> List[UserRead]:
     return await board_service.get_board_members(board_id, current_user.id)
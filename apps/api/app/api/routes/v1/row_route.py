@@ -1,38 +1,116 @@
 from uuid import UUID
-from fastapi import APIRouter, status
+from typing import List
+from fastapi import APIRouter, Query, status
+from fastapi.responses import JSONResponse
+from app.common.paging import KeysetParamsDep, PaginatedResponse
+from app.common.projection import ROW_RELATIONS, ProjectionDep
 from app.api.models.row_model import (
     RowCreate,
     RowRead,
     RowUpdate,
     RowOwnerRead,
+    RowOwnersReplace,
     UpdateRowPositionRequest,
+    RowBatchRequest,
+    RowMoveRequest,
+    RowBatchResponse,
 )
 from app.api.services.row_service import RowServiceDep
-from app.DI.current_user import CurrentUserDep
-from app.database_models.user import User
+from app.DI.current_user import CurrentPrincipalDep, Principal
+from app.DI.if_match import IfMatchDep
 
 router = APIRouter()
 
 
+@router.get(
+    "/",
+    response_model=PaginatedResponse[RowRead],
+    description="Page through the rows of a table in order",
+)
+async def list_rows(  # noqa: PLR0913
+    table_id: UUID,
+    page: KeysetParamsDep,
+    projection: ProjectionDep,
+    row_service: RowServiceDep,
+    with_total_count: bool = Query(
+        False, description="Also return totalCount, which counts the whole table"
+    ),
+    current_user: Principal = CurrentPrincipalDep,
+) -> PaginatedResponse[RowRead] | JSONResponse:
+    rows = await row_service.list_rows(
+        table_id, current_user.id, page, projection, with_total_count
+    )
+    if projection.is_default:
+        return rows
+
+    content = rows.model_dump(mode="json", by_alias=True)
+    content["items"] = projection.apply(content["items"], ROW_RELATIONS)
+    return JSONResponse(content)
+
+
 @router.post("/", response_model=RowRead, status_code=status.HTTP_201_CREATED)
 async def create_row(
     table_id: UUID,
     data: RowCreate,
     row_service: RowServiceDep,
-    current_user: User = CurrentUserDep,
+    with_position: bool = Query(
+        True,
+        description="Return the row's position; it counts the table, so bulk "
+        "importers may pass false and get a null position",
+    ),
+    current_user: Principal = CurrentPrincipalDep,
 ) -> RowRead:
-    return await row_service.create_row(table_id, current_user.id, data)
+    return await row_service.create_row(table_id, current_user.id, data, with_position)
+
+
+@router.post(
+    ":batch",
+    response_model=RowBatchResponse,
+    status_code=status.HTTP_200_OK,
+    description="Apply create/update/delete/move operations in one transaction",
+)
+async def batch_rows(
+    board_id: UUID,
+    table_id: UUID,
+    request: RowBatchRequest,
+    row_service: RowServiceDep,
+    current_user: Principal = CurrentPrincipalDep,
+) -> RowBatchResponse:
+    return await row_service.apply_batch(
+        board_id, table_id, current_user.id, request.operations
+    )
+
+
+@router.post(
+    ":move",
+    response_model=List[RowRead],
+    status_code=status.HTTP_200_OK,
+    description="Move rows from any table of the board into this table",
+)
+async def move_rows(
+    board_id: UUID,
+    table_id: UUID,
+    request: RowMoveRequest,
+    row_service: RowServiceDep,
+    current_user: Principal = CurrentPrincipalDep,
+) -> List[RowRead]:
+    return await row_service.move_rows(
+        board_id, table_id, current_user.id, request.row_ids, request.new_position
+    )
 
 
 @router.patch("/{row_id}", response_model=RowRead)
-async def update_row(
+async def update_row(  # noqa: PLR0913
     table_id: UUID,
     row_id: UUID,
     data: RowUpdate,
     row_service: RowServiceDep,
-    current_user: User = CurrentUserDep,
+    expected_version: IfMatchDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> RowRead:
-    return await row_service.update_row(row_id, table_id, current_user.id, data)
+    return await row_service.update_row(
+        row_id, table_id, current_user.id, data, expected_version
+    )
 
 
 @router.delete("/{row_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -40,7 +118,7 @@ async def delete_row(
     table_id: UUID,
     row_id: UUID,
     row_service: RowServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> None:
     await row_service.delete_row(row_id, table_id, current_user.id)
 
@@ -59,6 +137,24 @@ async def add_owner(
     return await row_service.add_owner(row_id, table_id, owner_id)
 
 
+@router.put(
+    "/{row_id}/owners",
+    response_model=List[RowOwnerRead],
+    status_code=status.HTTP_200_OK,
+    description="Replace the owners of a row",
+)
+async def replace_owners(
+    table_id: UUID,
+    row_id: UUID,
+    data: RowOwnersReplace,
+    row_service: RowServiceDep,
+    current_user: Principal = CurrentPrincipalDep,
+) -> List[RowOwnerRead]:
+    return await row_service.replace_owners(
+        row_id, table_id, current_user.id, data.owner_ids
+    )
+
+
 @router.delete("/{row_id}/owners/{owner_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_owner(
     table_id: UUID,
@@ -79,7 +175,7 @@ async def duplicate_row(
     row_id: UUID,
     table_id: UUID,
     row_service: RowServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> RowRead:
     return await row_service.duplicate_row(row_id, table_id, current_user.id)
 
@@ -90,13 +186,19 @@ async def duplicate_row(
     status_code=status.HTTP_200_OK,
     description="Update the position of a row",
 )
-async def update_row_position(
+async def update_row_position(  # noqa: PLR0913
     table_id: UUID,
     row_id: UUID,
     data: UpdateRowPositionRequest,
     row_service: RowServiceDep,
-    current_user: User = CurrentUserDep,
+    expected_version: IfMatchDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> RowRead:
     return await row_service.update_row_position(
-        row_id, table_id, current_user.id, data.new_position, data.target_table_id
+        row_id,
+        table_id,
+        current_user.id,
+        data.new_position,
+        data.target_table_id,
+        expected_version,
     )
@@ -1,16 +1,18 @@
 from uuid import UUID
 from typing import List
 from fastapi import APIRouter, status
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response
 from app.api.models.table_model import (
     TableCreate,
     TableRead,
     TableUpdate,
+    TablePositionRead,
     UpdateTablePositionRequest,
 )
 from app.api.services.table_service import TableServiceDep
-from app.DI.current_user import CurrentUserDep
-from app.database_models.user import User
+from app.common.projection import TABLE_RELATIONS, ProjectionDep
+from app.DI.current_user import CurrentPrincipalDep, Principal
+from app.DI.if_match import IfMatchDep, IfNoneMatchDep
 
 router = APIRouter()
 
@@ -19,13 +21,35 @@ router = APIRouter()
     "/",
     response_model=List[TableRead],
     description="List all tables",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Tables unchanged"}},
 )
-async def list_tables(
+async def list_tables(  # noqa: PLR0913
     board_id: UUID,
+    response: Response,
     table_service: TableServiceDep,
-    current_user: User = CurrentUserDep,
-) -> List[TableRead]:
-    return await table_service.list_tables(board_id, current_user.id)
+    if_none_match: IfNoneMatchDep,
+    projection: ProjectionDep,
+    current_user: Principal = CurrentPrincipalDep,
+) -> List[TableRead] | Response:
+    etag, tables = await table_service.list_tables(
+        board_id, current_user.id, if_none_match, projection
+    )
+    headers = {"Cache-Control": "private, no-cache"}
+    if etag is not None:
+        headers["ETag"] = etag
+    if tables is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if not projection.is_default:
+        return JSONResponse(
+            projection.apply(
+                [table.model_dump(mode="json", by_alias=True) for table in tables],
+                TABLE_RELATIONS,
+            ),
+            headers=headers,
+        )
+
+    response.headers.update(headers)
+    return tables
 
 
 @router.post(
@@ -38,20 +62,23 @@ async def create_table(
     board_id: UUID,
     data: TableCreate,
     table_service: TableServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> TableRead:
     return await table_service.create_table(board_id, current_user.id, data)
 
 
 @router.patch("/{table_id}", response_model=TableRead, description="Update a table by ID")
-async def update_table(
+async def update_table(  # noqa: PLR0913
     board_id: UUID,
     table_id: UUID,
     data: TableUpdate,
     table_service: TableServiceDep,
-    current_user: User = CurrentUserDep,
+    expected_version: IfMatchDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> TableRead:
-    return await table_service.update_table(table_id, board_id, current_user.id, data)
+    return await table_service.update_table(
+        table_id, board_id, current_user.id, data, expected_version
+    )
 
 
 @router.delete(
@@ -63,7 +90,7 @@ async def delete_table(
     board_id: UUID,
     table_id: UUID,
     table_service: TableServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> Response:
     await table_service.delete_table(table_id, board_id, current_user.id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -79,21 +106,24 @@ async def duplicate_table(
     board_id: UUID,
     table_id: UUID,
     table_service: TableServiceDep,
-    current_user: User = CurrentUserDep,
+    current_user: Principal = CurrentPrincipalDep,
 ) -> TableRead:
     return await table_service.duplicate_table(table_id, board_id, current_user.id)
 
 
 @router.patch(
-    "/{table_id}/position", response_model=TableRead, description="Update table position"
+    "/{table_id}/position",
+    response_model=List[TablePositionRead],
+    description="Update table position and return the new table order",
 )
-async def update_table_position(
+async def update_table_position(  # noqa: PLR0913
     board_id: UUID,
     table_id: UUID,
     request: UpdateTablePositionRequest,
     table_service: TableServiceDep,
-    current_user: User = CurrentUserDep,
-) -> TableRead:
+    expected_version: IfMatchDep,
+    current_user: Principal = CurrentPrincipalDep,
+) -> List[TablePositionRead]:
     return await table_service.update_table_position(
-        table_id, board_id, current_user.id, request.new_position
+        table_id, board_id, current_user.id, request.new_position, expected_version
     )
@@ -2,10 +2,16 @@ from .row_service import RowService  # noqa: F401
 from .table_service import TableService  # noqa: F401
 from .auth_service import AuthService  # noqa: F401
 from .board_service import BoardService  # noqa: F401
+from .board_cache_service import BoardCacheService  # noqa: F401
+from .board_access_service import BoardAccessService  # noqa: F401
+from .user_cache_service import UserCacheService  # noqa: F401
 
 __all__ = [
     "RowService",
     "TableService",
     "AuthService",
     "BoardService",
+    "BoardCacheService",
+    "BoardAccessService",
+    "UserCacheService",
 ]
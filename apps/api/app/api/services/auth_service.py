@@ -1,10 +1,11 @@
 from uuid import UUID
-from typing import Annotated, Tuple
+from typing import Annotated, Optional, Tuple
 from fastapi import Depends
 from uuid import uuid4
 from app.api.models.user_model import UserCreate, UserRead
 from app.api.dal.auth_repository import AuthRepositoryDep
-from app.core.security import hash_password, verify_password
+from app.core.config import get_settings
+from app.core.security import IdentityClaims, password_hasher
 from app.database_models.user import User
 from app.common.service import BaseService
 from app.common.errors.exceptions import (
@@ -35,7 +36,7 @@ class AuthService(BaseService[User, UserRead]):
             email=data.email,
             first_name=data.first_name,
             last_name=data.last_name,
-            password_hash=hash_password(data.password),
+            password_hash=await password_hasher.hash(data.password),
             avatar_url=user_avatar_url,
         )
         await self.auth_repository.create(new_user)
@@ -47,8 +48,13 @@ class AuthService(BaseService[User, UserRead]):
 
     async def authenticate(self, email: str, password: str) -> Tuple[UserRead, str, str]:
         user = await self.auth_repository.get_by_email(email)
-        if not user or not verify_password(password, user.password_hash):
+        if not user:
+            raise InvalidCredentialsError(message="Invalid email or password")
+        valid, new_hash = await password_hasher.verify(password, user.password_hash)
+        if not valid:
             raise InvalidCredentialsError(message="Invalid email or password")
+        if new_hash is not None:
+            user.password_hash = new_hash
 
         access_token, refresh_token = await self._issue_tokens(user)
         return self.convert_to_model(user), access_token, refresh_token
@@ -58,7 +64,7 @@ class AuthService(BaseService[User, UserRead]):
         if not token_obj:
             raise RefreshTokenExpiredError(message="Refresh token is invalid or expired")
 
-        access_token, refresh_token = await self._issue_tokens(token_obj.user)
+        access_token, refresh_token = await self._issue_tokens(token_obj.user, token)
         return self.convert_to_model(token_obj.user), access_token, refresh_token
 
     async def logout(self, refresh_token: str) -> None:
@@ -77,18 +83,28 @@ class AuthService(BaseService[User, UserRead]):
             raise NotFoundError(message="User not found")
         return self.convert_to_model(user)
 
-    async def _issue_tokens(self, user: User) -> Tuple[str, str]:
-        user.access_token = TokenService.create_access_token(str(user.id))
-
-        existing_token = await self.auth_repository.get_valid_refresh_token_for_user(
-            user.id
-        )
-        if existing_token:
-            user.refresh_token = existing_token.token
-        else:
-            user.refresh_token = await self.auth_repository.create_refresh_token(user.id)
+    async def _issue_tokens(
+        self, user: User, refresh_token: Optional[str] = None
+    ) -> Tuple[str, str]:
+        claims = identity_claims(user) if get_settings().access_token_claims else None
+        user.access_token = TokenService.create_access_token(str(user.id), claims)
+        # Only a hash of each refresh token is stored, so a stored token cannot be
+        # handed out again: every sign-in gets its own.
+        if refresh_token is None:
+            refresh_token = await self.auth_repository.create_refresh_token(user.id)
+        user.refresh_token = refresh_token
 
         return user.access_token, user.refresh_token
 
 
+def identity_claims(user: User) -> IdentityClaims:
+    return {
+        "email": user.email,
+        "given_name": user.first_name,
+        "family_name": user.last_name,
+        "picture": user.avatar_url,
+        "pv": user.profile_version,
+    }
+
+
 AuthServiceDep = Annotated[AuthService, Depends(AuthService)]
@@ -0,0 +1,132 @@
+import json
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Annotated, Mapping, Optional, Tuple
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.api.dal.board_member_repository import BoardMemberRepositoryDep
+from app.api.services.board_cache_service import BoardCacheServiceDep
+from app.common.errors.exceptions import NotFoundError, PermissionDeniedError
+from app.core.config import get_settings
+from app.core.database import DBSessionDep, run_after_commit
+from app.core.enums import RoleEnum
+
+BoardRoles = Mapping[UUID, RoleEnum]
+
+
+class LocalBoardRoles:
+    """A bounded LRU of board memberships whose entries expire after `ttl` seconds."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, Tuple[float, BoardRoles]] = OrderedDict()
+
+    def get(self, board_id: UUID) -> Optional[BoardRoles]:
+        entry = self._entries.get(board_id)
+        if entry is None:
+            return None
+        expires_at, roles = entry
+        if expires_at <= time.monotonic():
+            del self._entries[board_id]
+            return None
+        self._entries.move_to_end(board_id)
+        return roles
+
+    def put(self, board_id: UUID, roles: BoardRoles) -> None:
+        self._entries[board_id] = (time.monotonic() + self.ttl, roles)
+        self._entries.move_to_end(board_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, board_id: UUID) -> None:
+        self._entries.pop(board_id, None)
+
+
+_settings = get_settings()
+local_board_roles = LocalBoardRoles(
+    _settings.board_access_cache_max_size, _settings.board_access_cache_ttl_seconds
+)
+
+
+class BoardAccessService:
+    """
+    Who may access a board, as a map of user id to role that includes the
+    owner. Memberships are cached in Redis under a version of their own, so
+    edits to the board's content leave them cached, and for a few seconds in a
+    per-process LRU, so an access check is a dictionary lookup. Changes to the
+    members and deletion of the board go through `invalidate`; entries that
+    other processes hold locally age out with the TTL.
+    """
+
+    def __init__(
+        self,
+        member_repository: BoardMemberRepositoryDep,
+        board_cache: BoardCacheServiceDep,
+        session: DBSessionDep,
+    ):
+        self.member_repository = member_repository
+        self.board_cache = board_cache
+        self.session = session
+
+    async def get_roles(self, board_id: UUID) -> Optional[BoardRoles]:
+        """The roles on the board, `None` if the board does not exist."""
+        roles = local_board_roles.get(board_id)
+        if roles is not None:
+            return roles
+
+        version, payload = await self.board_cache.get_members(board_id)
+        if payload is not None:
+            roles = {
+                UUID(user_id): RoleEnum(role)
+                for user_id, role in json.loads(payload).items()
+            }
+        else:
+            loaded = await self.member_repository.get_roles(board_id)
+            if loaded is None:
+                return None
+            roles = loaded
+            await self.board_cache.set_members(
+                board_id,
+                version,
+                json.dumps({str(user_id): role.value for user_id, role in roles.items()}),
+            )
+        local_board_roles.put(board_id, roles)
+        return roles
+
+    async def has_access(self, board_id: UUID, user_id: UUID) -> bool:
+        roles = await self.get_roles(board_id)
+        return roles is not None and user_id in roles
+
+    async def check(self, board_id: UUID, user_id: UUID) -> RoleEnum:
+        """The user's role on the board, raising when the board is not theirs."""
+        roles = await self.get_roles(board_id)
+        if roles is None:
+            raise NotFoundError(f"Board with ID {board_id} not found")
+        role = roles.get(user_id)
+        if role is None:
+            raise PermissionDeniedError(
+                f"You do not have permission to access board with ID {board_id}"
+            )
+        return role
+
+    def invalidate(self, *board_ids: UUID) -> None:
+        """
+        Drop the memberships of `board_ids` now and again once the current
+        request commits, and bump their memberships version. The board version
+        is bumped too, as its tree lists the members.
+        """
+        self.board_cache.invalidate(*board_ids)
+        self.board_cache.invalidate_members(*board_ids)
+        for board_id in board_ids:
+            local_board_roles.discard(board_id)
+            run_after_commit(self.session, partial(self._drop, board_id))
+
+    async def _drop(self, board_id: UUID) -> None:
+        local_board_roles.discard(board_id)
+
+
+BoardAccessServiceDep = Annotated[BoardAccessService, Depends(BoardAccessService)]
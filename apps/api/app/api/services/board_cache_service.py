@@ -0,0 +1,221 @@
+import time
+from functools import partial
+from typing import AbstractSet, Annotated, Optional, Set, Tuple
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.core.config import get_settings
+from app.core.database import DBSessionDep, run_after_commit
+from app.core.logger import logger
+from app.core.redis import RedisDep
+
+
+def board_version_key(board_id: UUID) -> str:
+    return f"board:{board_id}:version"
+
+
+def board_tree_key(board_id: UUID, rows_per_table: Optional[int] = None) -> str:
+    if rows_per_table is None:
+        return f"board:{board_id}:tree"
+    return f"board:{board_id}:tree:{rows_per_table}"
+
+
+def board_stats_key(board_id: UUID) -> str:
+    return f"board:{board_id}:stats"
+
+
+def board_members_key(board_id: UUID) -> str:
+    return f"board:{board_id}:members"
+
+
+def board_members_version_key(board_id: UUID) -> str:
+    return f"board:{board_id}:members:version"
+
+
+def board_etag(version: Optional[int]) -> Optional[str]:
+    if version is None:
+        return None
+    return f'W/"board-{version}"'
+
+
+def etag_matches(etag: Optional[str], if_none_match: AbstractSet[str]) -> bool:
+    if etag is None:
+        return False
+    return "*" in if_none_match or etag.removeprefix("W/") in if_none_match
+
+
+class BoardCacheService:
+    """
+    Serialized board trees and memberships shared by every member of a board. An entry is
+    stored as "<version>:<payload>" and only served while it matches the
+    board's version counter. Every mutation bumps the counter and drops the
+    entry after its commit, so a reader that raced the commit cannot store
+    its stale tree under the new version. The counter also backs the board's
+    ETag, so it is seeded from the clock rather than 0: a counter that Redis
+    evicted never repeats a version a client may still hold. When Redis fails,
+    reads miss with no version and writes are skipped, so callers render from
+    the database and send no ETag. Memberships change far less often than the
+    tree, so they are validated against a counter of their own that only
+    `invalidate_members` bumps.
+    """
+
+    def __init__(self, redis_client: RedisDep, session: DBSessionDep):
+        self.redis_client = redis_client
+        self.session = session
+        self._invalidated: Set[UUID] = set()
+        self._members_invalidated: Set[UUID] = set()
+
+    async def get_version(self, board_id: UUID) -> Optional[int]:
+        try:
+            version = await self.redis_client.get(board_version_key(board_id))
+            if version is None:
+                return await self._seed_version(board_version_key(board_id))
+            return int(version)
+        except Exception as err:
+            self._log_failure("board_cache.read_failed", board_id, err)
+            return None
+
+    async def get_tree(
+        self, board_id: UUID, rows_per_table: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Current board version and the cached payload, if it is still fresh.
+        Trees truncated to `rows_per_table` rows are cached under their own key.
+        """
+        return await self._get_entry(board_id, board_tree_key(board_id, rows_per_table))
+
+    async def set_tree(
+        self,
+        board_id: UUID,
+        version: Optional[int],
+        payload: str,
+        rows_per_table: Optional[int] = None,
+    ) -> None:
+        await self._set_entry(
+            board_id,
+            board_tree_key(board_id, rows_per_table),
+            version,
+            payload,
+            get_settings().board_cache_ttl_seconds,
+        )
+
+    async def get_stats(self, board_id: UUID) -> Tuple[Optional[int], Optional[str]]:
+        """Current board version and the cached stats, if they are still fresh."""
+        return await self._get_entry(board_id, board_stats_key(board_id))
+
+    async def set_stats(
+        self, board_id: UUID, version: Optional[int], payload: str
+    ) -> None:
+        # Overdue counts age with the clock, so stats also expire on their own.
+        await self._set_entry(
+            board_id,
+            board_stats_key(board_id),
+            version,
+            payload,
+            get_settings().board_stats_ttl_seconds,
+        )
+
+    async def get_members(self, board_id: UUID) -> Tuple[Optional[int], Optional[str]]:
+        """Current memberships version and the cached memberships, if still fresh."""
+        return await self._get_entry(
+            board_id, board_members_key(board_id), board_members_version_key(board_id)
+        )
+
+    async def set_members(
+        self, board_id: UUID, version: Optional[int], payload: str
+    ) -> None:
+        await self._set_entry(
+            board_id,
+            board_members_key(board_id),
+            version,
+            payload,
+            get_settings().board_cache_ttl_seconds,
+        )
+
+    def invalidate(self, *board_ids: UUID) -> None:
+        """Bump the version of `board_ids` once the current request commits."""
+        for board_id in board_ids:
+            if board_id in self._invalidated:
+                continue
+            self._invalidated.add(board_id)
+            run_after_commit(
+                self.session,
+                partial(
+                    self._bump,
+                    board_id,
+                    board_version_key(board_id),
+                    board_tree_key(board_id),
+                    board_stats_key(board_id),
+                ),
+            )
+
+    def invalidate_members(self, *board_ids: UUID) -> None:
+        """Bump the memberships version of `board_ids` once the request commits."""
+        for board_id in board_ids:
+            if board_id in self._members_invalidated:
+                continue
+            self._members_invalidated.add(board_id)
+            run_after_commit(
+                self.session,
+                partial(
+                    self._bump,
+                    board_id,
+                    board_members_version_key(board_id),
+                    board_members_key(board_id),
+                ),
+            )
+
+    async def _bump(self, board_id: UUID, version_key: str, *keys: str) -> None:
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.set(version_key, time.time_ns(), nx=True)
+        pipe.incr(version_key)
+        pipe.delete(*keys)
+        try:
+            await pipe.execute()
+        except Exception as err:
+            self._log_failure("board_cache.invalidate_failed", board_id, err)
+
+    async def _get_entry(
+        self, board_id: UUID, key: str, version_key: Optional[str] = None
+    ) -> Tuple[Optional[int], Optional[str]]:
+        version_key = version_key or board_version_key(board_id)
+        try:
+            version, entry = await self.redis_client.mget(version_key, key)
+            if version is None:
+                return await self._seed_version(version_key), None
+        except Exception as err:
+            self._log_failure("board_cache.read_failed", board_id, err)
+            return None, None
+        if entry is None:
+            return int(version), None
+
+        entry_version, _, payload = entry.partition(":")
+        return int(version), payload if entry_version == version else None
+
+    async def _set_entry(
+        self,
+        board_id: UUID,
+        key: str,
+        version: Optional[int],
+        payload: str,
+        ttl: int,
+    ) -> None:
+        # Without a version the entry could never be validated, so skip it.
+        if version is None:
+            return
+        try:
+            await self.redis_client.set(key, f"{version}:{payload}", ex=ttl)
+        except Exception as err:
+            self._log_failure("board_cache.write_failed", board_id, err)
+
+    async def _seed_version(self, version_key: str) -> int:
+        await self.redis_client.set(version_key, time.time_ns(), nx=True)
+        return int(await self.redis_client.get(version_key) or 0)
+
+    @staticmethod
+    def _log_failure(event: str, board_id: UUID, err: Exception) -> None:
+        logger.warning(event, extra={"board_id": str(board_id), "error": str(err)})
+
+
+BoardCacheServiceDep = Annotated[BoardCacheService, Depends(BoardCacheService)]
@@ -0,0 +1,140 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import RowMapping
+
+from app.api.dal.row_repository import RowRepository
+from app.api.dal.table_repository import TableRepository
+from app.api.services.board_access_service import BoardAccessServiceDep
+from app.common.errors.exceptions import NotFoundError
+from app.core.config import get_settings
+from app.core.database import DBSessionDep, detached_session
+from app.core.enums import ExportFormatEnum
+
+EXPORT_COLUMNS = (
+    "tableId",
+    "tableName",
+    "id",
+    "position",
+    "name",
+    "status",
+    "priority",
+    "dueDate",
+    "ownerIds",
+    "createdAt",
+    "updatedAt",
+)
+
+# Spreadsheets evaluate cells starting with these as formulas.
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv; charset=utf-8",
+}
+
+
+class BoardExportService:
+    """
+    Streams the rows of a board, table by table in board order, as NDJSON or
+    CSV. Rows are read through a server-side cursor and written out one batch
+    at a time, so memory does not grow with the board and the first rows are
+    sent before the last ones are read.
+    """
+
+    def __init__(self, board_access: BoardAccessServiceDep, session: DBSessionDep):
+        self.board_access = board_access
+        self.session = session
+
+    async def export_rows(
+        self, board_id: UUID, user_id: UUID, export_format: ExportFormatEnum
+    ) -> AsyncIterator[str]:
+        """Check access up front and return the stream of the export body."""
+        if not await self.board_access.has_access(board_id, user_id):
+            raise NotFoundError(message=f"Board with ID {board_id} not found")
+        return self._stream(board_id, export_format)
+
+    async def _stream(
+        self, board_id: UUID, export_format: ExportFormatEnum
+    ) -> AsyncIterator[str]:
+        # The body is sent after the request's session is closed, so the export
+        # reads from its own session, in one snapshot across all tables.
+        async with detached_session(self.session) as session:
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+            tables = await TableRepository(session).list_by_board(
+                board_id, with_rows=False, with_owners=False
+            )
+            rows = RowRepository(session)
+            batch_size = get_settings().board_export_batch_size
+
+            if export_format == ExportFormatEnum.CSV:
+                yield _csv_lines([list(EXPORT_COLUMNS)])
+            for table in tables:
+                position = 0
+                async for batch in rows.stream_for_export(table.id, batch_size):
+                    records = []
+                    for row in batch:
+                        position += 1
+                        records.append(_record(table.id, table.name, position, row))
+                    if export_format == ExportFormatEnum.CSV:
+                        yield _csv_lines(
+                            [
+                                [_csv_value(record[c]) for c in EXPORT_COLUMNS]
+                                for record in records
+                            ]
+                        )
+                    else:
+                        yield "".join(
+                            json.dumps(record, separators=(",", ":")) + "\n"
+                            for record in records
+                        )
+
+
+def _record(
+    table_id: UUID, table_name: str, position: int, row: RowMapping
+) -> Dict[str, Any]:
+    return {
+        "tableId": str(table_id),
+        "tableName": table_name,
+        "id": str(row["id"]),
+        "position": position,
+        "name": row["name"],
+        "status": row["status"].value,
+        "priority": row["priority"].value,
+        "dueDate": _iso(row["due_date"]),
+        "ownerIds": sorted(str(owner_id) for owner_id in row["owner_ids"] or []),
+        "createdAt": _iso(row["created_at"]),
+        "updatedAt": _iso(row["updated_at"]),
+    }
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        value = " ".join(value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def _csv_lines(lines: Sequence[List[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(lines)
+    return buffer.getvalue()
+
+
+BoardExportServiceDep = Annotated[BoardExportService, Depends(BoardExportService)]
@@ -1,26 +1,47 @@
+import json
 from uuid import uuid4, UUID
+from datetime import datetime
 from app.api.models.user_model import UserRead
 from fastapi import Depends
-from typing import List, Annotated
+from typing import AbstractSet, Any, Dict, Iterable, List, Annotated, Optional, Tuple
 
 from app.api.dal.board_repository import BoardRepositoryDep
 from app.api.dal.board_member_repository import BoardMemberRepositoryDep
 from app.api.services.row_service import RowServiceDep
+from app.api.services.board_access_service import BoardAccessServiceDep
+from app.api.services.board_cache_service import (
+    BoardCacheServiceDep,
+    board_etag,
+    etag_matches,
+)
 from app.api.services.duplicate.duplication_factory import DuplicationServiceFactory
 
-from app.database_models import Board
+from app.database_models import Board, Table
 
 from app.api.models.board_model import (
     BoardCreate,
     BoardUpdate,
     BoardRead,
     BoardDetailRead,
+    BoardChangesRead,
+    BoardSummaryRead,
+    BoardStatsRead,
+    OwnerStatsRead,
+    TableStatsRead,
 )
-from app.api.models.table_model import TableRead
+from app.api.models.table_model import TableRead, TableSummaryRead
 from app.api.models.board_member_model import RoleEnum
 
 from app.common.service import BaseService
-from app.common.errors.exceptions import NotFoundError, PermissionDeniedError
+from app.common.paging import KeysetParams, PaginatedResponse
+from app.common.projection import BOARD_RELATIONS, Projection
+from app.core.config import get_settings
+from app.core.enums import ChangeEntityEnum, PriorityEnum, StatusEnum
+from app.common.errors.exceptions import (
+    ConflictError,
+    NotFoundError,
+    PermissionDeniedError,
+)
 from app.common.service import convert_to_model
 
 
@@ -30,22 +51,230 @@ class BoardService(BaseService[Board, BoardRead]):
         board_repository: BoardRepositoryDep,
         member_repository: BoardMemberRepositoryDep,
         row_service: RowServiceDep,
+        board_cache: BoardCacheServiceDep,
+        board_access: BoardAccessServiceDep,
     ):
         super().__init__(BoardRead, board_repository)
         self.board_repository = board_repository
         self.member_repository = member_repository
         self.row_service = row_service
+        self.board_cache = board_cache
+        self.board_access = board_access
+
+    async def list_boards(
+        self, user_id: UUID, page: KeysetParams, name_prefix: Optional[str] = None
+    ) -> PaginatedResponse[BoardSummaryRead]:
+        """
+        A page of the user's boards, most recently updated first, walking the
+        (updated_at, id) key from the cursor.
+        """
+        last_position, after = 0, None
+        if page.cursor:
+            last_position, key = KeysetParams.decode_cursor(page.cursor)
+            updated_at, _, board_id = key.partition("|")
+            after = (datetime.fromisoformat(updated_at), UUID(board_id))
+
+        boards = await self.board_repository.list_page_for_user(
+            user_id, page.limit + 1, after, name_prefix
+        )
+        has_more = len(boards) > page.limit
+        boards = boards[: page.limit]
+
+        last = boards[-1][0] if boards else None
+        return PaginatedResponse(
+            total_count=await self.board_repository.count_for_user(user_id, name_prefix),
+            items=[
+                convert_to_model(
+                    board, BoardSummaryRead, custom_mapping={"member_count": count}
+                )
+                for board, count in boards
+            ],
+            next_cursor=KeysetParams.encode_cursor(
+                last_position + len(boards), f"{last.updated_at.isoformat()}|{last.id}"
+            )
+            if has_more and last is not None
+            else None,
+        )
 
-    async def list_boards(self, user_id: UUID) -> List[BoardRead]:
-        boards = await self.board_repository.list_for_user(user_id)
-        return [self._to_board_with_members(board) for board in boards]
+    async def get_board_full_tree(
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        if_none_match: AbstractSet[str] = frozenset(),
+        rows_per_table: Optional[int] = None,
+        projection: Optional[Projection] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        The ETag and `BoardDetailRead` JSON of a board. Access is checked per
+        user, while the payload itself is cached once per board version. The
+        payload is `None` when `if_none_match` already holds the current ETag.
+        The ETag is `None` while the board version cannot be read from Redis.
+        With `rows_per_table`, tables carry a cursor for the rows left out.
+        Projected trees only load what they return and are not cached.
+        """
+        if projection is not None:
+            projection.check(BOARD_RELATIONS)
+        if not await self.board_access.has_access(board_id, user_id):
+            raise NotFoundError(message=f"Board with ID {board_id} not found")
 
-    async def get_board_full_tree(self, board_id: UUID, user_id: UUID) -> BoardDetailRead:
-        board = await self.board_repository.get_full_tree(board_id, user_id)
-        if not board:
+        if if_none_match:
+            etag = board_etag(await self.board_cache.get_version(board_id))
+            if etag_matches(etag, if_none_match):
+                return etag, None
+
+        if projection is not None and not projection.is_default:
+            version = await self.board_cache.get_version(board_id)
+            payload = await self._render_full_tree(
+                board_id, user_id, rows_per_table, projection
+            )
+            if payload is None:
+                raise NotFoundError(message=f"Board with ID {board_id} not found")
+            return board_etag(version), payload
+
+        version, payload = await self.board_cache.get_tree(board_id, rows_per_table)
+        if payload is not None:
+            return board_etag(version), payload
+
+        if get_settings().board_tree_sql_render:
+            payload = await self.board_repository.get_full_tree_json(
+                board_id, rows_per_table
+            )
+        else:
+            payload = await self._render_full_tree(board_id, user_id, rows_per_table)
+        if payload is None:
+            raise NotFoundError(message=f"Board with ID {board_id} not found")
+
+        await self.board_cache.set_tree(board_id, version, payload, rows_per_table)
+        return board_etag(version), payload
+
+    async def get_changes(
+        self, board_id: UUID, user_id: UUID, since: int
+    ) -> BoardChangesRead:
+        """
+        What changed on the board after change `since`: the current state of
+        every created or updated entity and tombstones for the deleted ones.
+        Positions are current, rows that are not listed keep their order. When
+        the changes after `since` were already pruned, only `reload` is set.
+        """
+        if not await self.board_access.has_access(board_id, user_id):
+            raise NotFoundError(message=f"Board with ID {board_id} not found")
+
+        change_seq = await self.board_repository.get_change_seq(board_id)
+        if change_seq is None:
+            raise NotFoundError(message=f"Board with ID {board_id} not found")
+        if since > change_seq:
+            raise ValueError(f"Change {since} is ahead of the board ({change_seq})")
+        if since < change_seq:
+            oldest_seq = await self.board_repository.get_oldest_change_seq(board_id)
+            if oldest_seq is None or since + 1 < oldest_seq:
+                return BoardChangesRead(change_seq=change_seq, reload=True)
+
+        changes = BoardChangesRead(change_seq=change_seq)
+        upserts: dict[ChangeEntityEnum, List[UUID]] = {e: [] for e in ChangeEntityEnum}
+        deletes: dict[ChangeEntityEnum, List[UUID]] = {e: [] for e in ChangeEntityEnum}
+        for entity, entity_id, deleted in await self.board_repository.list_changes(
+            board_id, since, change_seq
+        ):
+            (deletes if deleted else upserts)[entity].append(entity_id)
+
+        if upserts[ChangeEntityEnum.BOARD]:
+            changes.board = self._to_board_with_members(
+                await self.get_board_entity(board_id, user_id)
+            )
+        changes.tables = [
+            convert_to_model(table, TableSummaryRead)
+            for table in await self.board_repository.list_tables(
+                board_id, upserts[ChangeEntityEnum.TABLE]
+            )
+        ]
+        changes.rows = await self.row_service.list_by_ids(
+            board_id, upserts[ChangeEntityEnum.ROW]
+        )
+        changes.member_ids = upserts[ChangeEntityEnum.MEMBER]
+        changes.deleted_table_ids = deletes[ChangeEntityEnum.TABLE]
+        changes.deleted_row_ids = deletes[ChangeEntityEnum.ROW]
+        changes.deleted_member_ids = deletes[ChangeEntityEnum.MEMBER]
+        return changes
+
+    async def get_stats(self, board_id: UUID, user_id: UUID) -> str:
+        """
+        The `BoardStatsRead` JSON of a board: row counts per status, priority
+        and owner for the board and each table. Cached per board version.
+        """
+        if not await self.board_access.has_access(board_id, user_id):
             raise NotFoundError(message=f"Board with ID {board_id} not found")
 
-        return self._to_board_detailed(board)
+        version, payload = await self.board_cache.get_stats(board_id)
+        if payload is not None:
+            return payload
+
+        groups = await self.board_repository.count_rows(board_id)
+        owners = await self.board_repository.count_rows_by_owner(board_id)
+
+        board_counts = _empty_row_counts()
+        table_counts: Dict[UUID, Dict[str, Any]] = {}
+        for table_id, status, priority, overdue, count in groups:
+            counts = table_counts.setdefault(table_id, _empty_row_counts())
+            if status is None or priority is None:
+                continue
+            for totals in (board_counts, counts):
+                totals["row_count"] += count
+                totals["overdue_count"] += count if overdue else 0
+                totals["by_status"][status] += count
+                totals["by_priority"][priority] += count
+
+        stats = BoardStatsRead(
+            board_id=board_id,
+            **board_counts,
+            tables=[
+                TableStatsRead(table_id=table_id, **counts)
+                for table_id, counts in table_counts.items()
+            ],
+            owners=[
+                OwnerStatsRead(user_id=owner_id, row_count=count, overdue_count=overdue)
+                for owner_id, count, overdue in owners
+            ],
+        )
+        payload = stats.model_dump_json(by_alias=True)
+        await self.board_cache.set_stats(board_id, version, payload)
+        return payload
+
+    async def record_changes(
+        self,
+        board_id: UUID,
+        entity: ChangeEntityEnum,
+        entity_ids: Iterable[UUID],
+        deleted: bool = False,
+    ) -> None:
+        await self.board_repository.record_changes(board_id, entity, entity_ids, deleted)
+
+    async def _render_full_tree(
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        rows_per_table: Optional[int],
+        projection: Optional[Projection] = None,
+    ) -> Optional[str]:
+        wants = projection.wants if projection is not None else lambda _: True
+        board = await self.board_repository.get_full_tree(
+            board_id,
+            user_id,
+            rows_per_table=None if rows_per_table is None else rows_per_table + 1,
+            with_tables=wants("tables"),
+            with_rows=wants("tables.rows"),
+            with_owners=wants("tables.rows.owners"),
+        )
+        if not board:
+            return None
+        detailed = self._to_board_detailed(board, rows_per_table)
+        if projection is None:
+            return detailed.model_dump_json(by_alias=True)
+        return json.dumps(
+            projection.apply(
+                detailed.model_dump(mode="json", by_alias=True), BOARD_RELATIONS
+            ),
+            separators=(",", ":"),
+        )
 
     async def create_board(self, user_id: UUID, data: BoardCreate) -> BoardRead:
         board_to_add = Board(
@@ -71,24 +300,48 @@ class BoardService(BaseService[Board, BoardRead]):
         return self._to_board_with_members(created_board)
 
     async def update_board(
-        self, board_id: UUID, user_id: UUID, data: BoardUpdate
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        data: BoardUpdate,
+        expected_version: Optional[int] = None,
+        expected_etag: Optional[str] = None,
     ) -> BoardRead:
+        """
+        Update the board's own fields. `expected_version` guards the update
+        with the board's `version`. `expected_etag` is the tree ETag of a
+        previous GET: it must still be current, so nothing on the board may
+        have changed since.
+        """
         board = await self.get_board_entity(board_id, user_id)
+        if expected_etag is not None and not etag_matches(
+            board_etag(await self.board_cache.get_version(board_id)),
+            {expected_etag},
+        ):
+            raise ConflictError(
+                message=f"Board with ID {board_id} was modified, expected {expected_etag}"
+            )
 
         payload = data.model_dump(
             exclude_none=True, include={"name", "description", "position"}
         )
-        await self.board_repository.update(board, payload)
-        board_with_members = await self.get_board_entity(board_id, user_id)
+        updated_board = await self.board_repository.update(
+            board, payload, expected_version
+        )
+        await self.record_changes(board_id, ChangeEntityEnum.BOARD, [board_id])
+        self.board_cache.invalidate(board_id)
 
-        return self._to_board_with_members(board_with_members)
+        return self._to_board_with_members(updated_board)
 
     async def delete_board(self, board_id: UUID, user_id: UUID) -> None:
         await self.get_board_entity(board_id, user_id)
         await self.board_repository.delete(board_id, user_id)
+        self.board_access.invalidate(board_id)
 
     async def get_board_members(self, board_id: UUID, user_id: UUID) -> List[UserRead]:
-        board_with_members = await self.board_repository.get_for_user(board_id, user_id)
+        if not await self.board_access.has_access(board_id, user_id):
+            raise NotFoundError(f"Board with ID {board_id} not found")
+        board_with_members = await self.board_repository.get_with_members(board_id)
         if not board_with_members:
             raise NotFoundError(f"Board with ID {board_id} not found")
 
@@ -112,6 +365,8 @@ class BoardService(BaseService[Board, BoardRead]):
             return existing_member.id
 
         board_member = await self.member_repository.add(board_id, user_id_to_add)
+        await self.record_changes(board_id, ChangeEntityEnum.MEMBER, [user_id_to_add])
+        self.board_access.invalidate(board_id)
         return board_member.id
 
     async def remove_member(
@@ -119,6 +374,10 @@ class BoardService(BaseService[Board, BoardRead]):
     ) -> None:
         await self.get_board_entity(board_id, current_user_id)
         await self.member_repository.remove(board_id, user_to_remove_id)
+        await self.record_changes(
+            board_id, ChangeEntityEnum.MEMBER, [user_to_remove_id], deleted=True
+        )
+        self.board_access.invalidate(board_id)
 
     async def duplicate_board(self, board_id: UUID, user_id: UUID) -> BoardRead:
         await self.get_board_entity(board_id, user_id)
@@ -135,20 +394,19 @@ class BoardService(BaseService[Board, BoardRead]):
             },
         )
 
-        await self.board_repository.session.commit()
+        await self.board_repository.session.flush()
         new_board = await self.get_board_entity(duplicated_board.id, user_id)
 
         return self._to_board_with_members(new_board)
 
+    async def check_access(self, board_id: UUID, user_id: UUID) -> RoleEnum:
+        return await self.board_access.check(board_id, user_id)
+
     async def get_board_entity(self, board_id: UUID, user_id: UUID) -> Board:
-        board_exists = await self.board_repository.get(board_id)
-        if not board_exists:
-            raise NotFoundError(f"Board with ID {board_id} not found")
-        board = await self.board_repository.get_for_user(board_id, user_id)
+        await self.check_access(board_id, user_id)
+        board = await self.board_repository.get_with_members(board_id)
         if not board:
-            raise PermissionDeniedError(
-                f"You do not have permission to access board with ID {board_id}"
-            )
+            raise NotFoundError(f"Board with ID {board_id} not found")
 
         return board
 
@@ -161,26 +419,49 @@ class BoardService(BaseService[Board, BoardRead]):
             },
         )
 
-    def _to_board_detailed(self, board: Board) -> BoardDetailRead:
+    def table_to_read(
+        self, table: Table, rows_per_table: Optional[int] = None
+    ) -> TableRead:
+        rows = table.rows
+        next_rows_cursor = None
+        if rows_per_table is not None and len(rows) > rows_per_table:
+            rows = rows[:rows_per_table]
+            next_rows_cursor = KeysetParams.encode_cursor(len(rows), rows[-1].rank)
+
+        return convert_to_model(
+            table,
+            TableRead,
+            custom_mapping={
+                "rows": [
+                    self.row_service.row_to_read(row, position)
+                    for position, row in enumerate(rows, start=1)
+                ],
+                "next_rows_cursor": next_rows_cursor,
+            },
+        )
+
+    def _to_board_detailed(
+        self, board: Board, rows_per_table: Optional[int] = None
+    ) -> BoardDetailRead:
         return convert_to_model(
             board,
             BoardDetailRead,
             custom_mapping={
                 "member_ids": [str(m.user_id) for m in board.members],
                 "tables": [
-                    convert_to_model(
-                        table,
-                        TableRead,
-                        custom_mapping={
-                            "rows": [
-                                self.row_service.row_to_read(row) for row in table.rows
-                            ],
-                        },
-                    )
-                    for table in board.tables
+                    self.table_to_read(table, rows_per_table) for table in board.tables
                 ],
             },
         )
 
 
+def _empty_row_counts() -> Dict[str, Any]:
+    return {
+        "row_count": 0,
+        "overdue_count": 0,
+        "by_status": dict.fromkeys(StatusEnum, 0),
+        "by_priority": dict.fromkeys(PriorityEnum, 0),
+    }
+
+
 BoardServiceDep = Annotated[BoardService, Depends(BoardService)]
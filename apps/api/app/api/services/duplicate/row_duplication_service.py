@@ -1,10 +1,12 @@
 from uuid import uuid4, UUID
-from typing import Dict, Any
-from sqlalchemy import select
+from typing import Dict, Any, Optional
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 from app.database_models import Row
 from app.database_models.row_owner import RowOwner
 from app.common.errors.exceptions import NotFoundError
+from app.common.rank import rank_between
+from app.api.dal.row_repository import RowRepository
 from .base_duplication_service import BaseDuplicationService
 
 
@@ -18,17 +20,15 @@ class RowDuplicationService(BaseDuplicationService[Row]):
         final_table_id = target_table_id or source_row.table_id
         is_same_table = final_table_id == source_row.table_id
 
+        await RowRepository(self.session).share_ranks(final_table_id)
         if is_same_table:
-            new_position = await self._get_next_position_with_shift(
-                model_class=Row,
-                owner_field_name="table_id",
-                owner_id=final_table_id,
-                source_position=source_row.position,
+            # A rebalance may have moved the source row before the lock was taken.
+            await self.session.refresh(source_row, ["rank"])
+            new_rank = rank_between(
+                source_row.rank, await self._get_next_rank(source_row)
             )
         else:
-            new_position = (
-                await self._get_max_position(Row, "table_id", final_table_id) + 1
-            )
+            new_rank = rank_between(await self._get_max_rank(final_table_id), None)
 
         new_row = Row(
             id=uuid4(),
@@ -37,7 +37,7 @@ class RowDuplicationService(BaseDuplicationService[Row]):
             status=source_row.status,
             priority=source_row.priority,
             due_date=source_row.due_date,
-            position=new_position,
+            rank=new_rank,
         )
 
         self.session.add(new_row)
@@ -48,12 +48,7 @@ class RowDuplicationService(BaseDuplicationService[Row]):
         return new_row
 
     async def _get_source_row(self, row_id: UUID) -> Row:
-        stmt = (
-            select(Row)
-            .where(Row.id == row_id)
-            .options(selectinload(Row.owner_users))
-            .order_by(Row.position)
-        )
+        stmt = select(Row).where(Row.id == row_id).options(selectinload(Row.owner_users))
         result = await self.session.execute(stmt)
         row = result.scalar_one_or_none()
 
@@ -62,6 +57,18 @@ class RowDuplicationService(BaseDuplicationService[Row]):
 
         return row
 
+    async def _get_next_rank(self, source_row: Row) -> Optional[str]:
+        stmt = select(func.min(Row.rank)).where(
+            Row.table_id == source_row.table_id, Row.rank > source_row.rank
+        )
+        next_rank: Optional[str] = await self.session.scalar(stmt)
+        return next_rank
+
+    async def _get_max_rank(self, table_id: UUID) -> Optional[str]:
+        stmt = select(func.max(Row.rank)).where(Row.table_id == table_id)
+        max_rank: Optional[str] = await self.session.scalar(stmt)
+        return max_rank
+
     async def _duplicate_owners(self, source_row: Row, new_row_id: UUID) -> None:
         if not source_row.owner_users:
             return
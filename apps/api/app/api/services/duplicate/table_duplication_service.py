@@ -76,7 +76,7 @@ class TableDuplicationService(BaseDuplicationService[Table]):
     async def _duplicate_rows(
         self, source_table: Table, new_table_id: UUID, user_id: UUID
     ) -> None:
-        for row in sorted(source_table.rows, key=lambda r: r.position):
+        for row in source_table.rows:
             await self.row_duplication_service.duplicate(
                 source_id=row.id,
                 context={
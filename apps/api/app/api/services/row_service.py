@@ -1,20 +1,40 @@
 from fastapi import Depends
 
-from typing import Annotated, List, Optional
+from typing import Annotated, Optional, List, Dict, Tuple
 from uuid import uuid4, UUID
 
 from app.api.dal.row_repository import RowRepositoryDep
 from app.api.dal.table_repository import TableRepositoryDep
 from app.api.dal.row_owner_repository import RowOwnerRepositoryDep
-from app.api.dal.auth_repository import AuthRepositoryDep
 from app.api.dal.board_repository import BoardRepositoryDep
+from app.api.services.board_cache_service import BoardCacheServiceDep
+from app.api.services.user_cache_service import UserCacheServiceDep
+from app.api.services.board_access_service import BoardAccessServiceDep
 from app.database_models import Row, Table
-from app.api.models.row_model import RowCreate, RowUpdate, RowRead
+from app.api.models.row_model import (
+    RowCreate,
+    RowUpdate,
+    RowRead,
+    RowBatchOperation,
+    RowBatchResponse,
+    RowBatchResult,
+)
 from app.common.service import BaseService, convert_to_model
+from app.common.paging import KeysetParams, PaginatedResponse
+from app.common.projection import ROW_RELATIONS, Projection
 from app.common.errors.exceptions import NotFoundError, ConflictError
+from app.core.enums import ChangeEntityEnum
 from app.api.models.row_model import RowOwnerRead
 from app.api.services.duplicate.duplication_factory import DuplicationServiceFactory
 from app.notification.notification_service import NotificationServiceDep
+from app.common.rank import (
+    rank_between,
+    ranks_between,
+    needs_rebalance,
+    RANK_REBALANCE_SET,
+)
+from app.core.redis import RedisDep
+from sqlalchemy.orm.attributes import set_committed_value
 
 
 class RowService(BaseService[Row, RowRead]):
@@ -24,46 +44,100 @@ class RowService(BaseService[Row, RowRead]):
         row_repository: RowRepositoryDep,
         table_repository: TableRepositoryDep,
         row_owner_repository: RowOwnerRepositoryDep,
-        auth_repository: AuthRepositoryDep,
         board_repository: BoardRepositoryDep,
         notification_service: NotificationServiceDep,
+        redis_client: RedisDep,
+        board_cache: BoardCacheServiceDep,
+        user_cache: UserCacheServiceDep,
+        board_access: BoardAccessServiceDep,
     ):
         super().__init__(RowRead, row_repository)
         self.row_repository = row_repository
         self.table_repository = table_repository
         self.row_owner_repository = row_owner_repository
-        self.auth_repository = auth_repository
         self.board_repository = board_repository
         self.notification_service = notification_service
+        self.redis_client = redis_client
+        self.board_cache = board_cache
+        self.user_cache = user_cache
+        self.board_access = board_access
 
     async def get_row(self, row_id: UUID, table_id: UUID) -> RowRead:
         row = await self.row_repository.get(row_id, table_id)
         if not row:
             raise NotFoundError(message=f"Row with ID {row_id} not found")
-        return self.row_to_read(row)
+        return self.row_to_read(row, await self.row_repository.get_position(row))
+
+    async def list_rows(
+        self,
+        table_id: UUID,
+        user_id: UUID,
+        page: KeysetParams,
+        projection: Optional[Projection] = None,
+        with_total_count: bool = False,
+    ) -> PaginatedResponse[RowRead]:
+        """
+        A page of a table's rows, walking the (table_id, rank) key from the cursor.
+        Counting the table costs a scan per page, so `total_count` is only filled
+        `with_total_count`.
+        """
+        if projection is not None:
+            projection.check(ROW_RELATIONS)
+        await self._check_if_table_exists(table_id, user_id)
+
+        last_position, after_rank = (
+            KeysetParams.decode_cursor(page.cursor) if page.cursor else (0, None)
+        )
+        rows = await self.row_repository.list_page(
+            table_id,
+            after_rank,
+            page.limit + 1,
+            with_owners=projection is None or projection.wants("owners"),
+        )
+        has_more = len(rows) > page.limit
+        rows = rows[: page.limit]
+
+        return PaginatedResponse(
+            total_count=await self.row_repository.get_count(Row.table_id == table_id)
+            if with_total_count
+            else None,
+            items=[
+                self.row_to_read(row, position)
+                for position, row in enumerate(rows, start=last_position + 1)
+            ],
+            next_cursor=KeysetParams.encode_cursor(
+                last_position + len(rows), rows[-1].rank
+            )
+            if has_more
+            else None,
+        )
 
     async def create_row(
         self,
         table_id: UUID,
         user_id: UUID,
         data: RowCreate,
+        with_position: bool = True,
     ) -> RowRead:
+        """
+        Append a row to the table. Its position takes a count of the rows
+        before it, so callers that do not need it can skip it with
+        `with_position=False` and get a `None` position.
+        """
         table = await self._check_if_table_exists(table_id, user_id)
 
-        existing_rows = await self.row_repository.list_by_table(table_id)
-        next_position = len(existing_rows) + 1 if existing_rows else 1
-
         row_data = data.model_dump(exclude_none=True)
 
         new_row = Row(
             id=uuid4(),
             table_id=table_id,
-            position=next_position,
             **row_data,
         )
-        created = await self.row_repository.create(new_row)
+        await self.row_repository.share_ranks(table_id)
+        await self.row_repository.append(new_row)
+        await self._rows_changed(table.board_id, [new_row.id])
 
-        actor = await self.auth_repository.get_by_id(user_id)
+        actor = await self.user_cache.get(user_id)
         if actor is None:
             raise NotFoundError(message=f"User with ID {user_id} not found")
 
@@ -73,29 +147,49 @@ class RowService(BaseService[Row, RowRead]):
 
         await self.notification_service.emit_row_created(
             db=self.row_repository.session,
-            row=created,
+            row=new_row,
             table=table,
             board=board,
             actor=actor,
         )
 
-        return self.row_to_read(created)
+        position = (
+            await self.row_repository.get_position(new_row) if with_position else None
+        )
+        return self.row_to_read(new_row, position)
 
     async def update_row(
-        self, row_id: UUID, table_id: UUID, user_id: UUID, data: RowUpdate
+        # ruff: noqa: PLR0913
+        self,
+        row_id: UUID,
+        table_id: UUID,
+        user_id: UUID,
+        data: RowUpdate,
+        expected_version: Optional[int] = None,
     ) -> RowRead:
         table = await self._check_if_table_exists(table_id, user_id)
         row = await self._get_row_entity(row_id, table_id)
 
         payload = data.model_dump(exclude_unset=True)
+        owner_ids = payload.pop("owners", None)
+        new_position = payload.pop("position", None)
+        if new_position is not None:
+            payload["rank"] = await self._rank_for_position(
+                table_id, new_position, row.id
+            )
 
         old_values = {}
         for field in payload:
             old_values[field] = getattr(row, field, None)
 
-        updated = await self.row_repository.update(row, payload)
+        updated = await self.row_repository.update(row, payload, expected_version)
+        if owner_ids is not None:
+            await self._replace_owners(updated, owner_ids)
+        if new_position is not None:
+            await self._schedule_rebalance_if_needed(updated)
+        await self._rows_changed(table.board_id, [updated.id])
 
-        actor = await self.auth_repository.get_by_id(user_id)
+        actor = await self.user_cache.get(user_id)
         if actor is None:
             raise NotFoundError(message=f"User with ID {user_id} not found")
 
@@ -109,17 +203,17 @@ class RowService(BaseService[Row, RowRead]):
             table=table,
             board=board,
             actor=actor,
-            changed_fields=list(payload.keys()),
+            changed_fields=[field for field in payload if field != "rank"],
             old_values=old_values,
         )
 
-        return self.row_to_read(updated)
+        return self.row_to_read(updated, await self.row_repository.get_position(updated))
 
     async def delete_row(self, row_id: UUID, table_id: UUID, user_id: UUID) -> None:
         table = await self._check_if_table_exists(table_id, user_id)
         row = await self._get_row_entity(row_id, table_id)
 
-        actor = await self.auth_repository.get_by_id(user_id)
+        actor = await self.user_cache.get(user_id)
         if actor is None:
             raise NotFoundError(message=f"User with ID {user_id} not found")
 
@@ -128,6 +222,7 @@ class RowService(BaseService[Row, RowRead]):
             raise NotFoundError(message=f"Board with ID {table.board_id} not found")
 
         await self.row_repository.delete(row_id, table_id)
+        await self._rows_changed(table.board_id, [row_id], deleted=True)
 
         await self.notification_service.emit_row_deleted(
             db=self.row_repository.session,
@@ -148,9 +243,9 @@ class RowService(BaseService[Row, RowRead]):
             )
 
         await self.row_owner_repository.add(row_id, new_owner_id)
-        await self.row_owner_repository.session.commit()
+        await self._row_changed_in_table(table_id, row_id)
 
-        user = await self.auth_repository.get_by_id(new_owner_id)
+        user = await self.user_cache.get(new_owner_id)
         if not user:
             raise NotFoundError(message=f"User with ID {new_owner_id} not found")
 
@@ -162,13 +257,22 @@ class RowService(BaseService[Row, RowRead]):
             avatar_url=user.avatar_url,
         )
 
+    async def replace_owners(
+        self, row_id: UUID, table_id: UUID, user_id: UUID, owner_ids: List[UUID]
+    ) -> List[RowOwnerRead]:
+        table = await self._check_if_table_exists(table_id, user_id)
+        row = await self._get_row_entity(row_id, table_id)
+        await self._replace_owners(row, owner_ids)
+        await self._rows_changed(table.board_id, [row.id])
+        return self._owners_to_read(row)
+
     async def remove_owner(self, row_id: UUID, table_id: UUID, owner_id: UUID) -> None:
         await self._get_row_entity(row_id, table_id)
         await self.row_owner_repository.remove(row_id, owner_id)
-        await self.row_owner_repository.session.commit()
+        await self._row_changed_in_table(table_id, row_id)
 
     async def duplicate_row(self, row_id: UUID, table_id: UUID, user_id: UUID) -> RowRead:
-        await self._check_if_table_exists(table_id, user_id)
+        table = await self._check_if_table_exists(table_id, user_id)
 
         duplication_service = DuplicationServiceFactory.create_row_service(
             self.row_repository.session
@@ -177,11 +281,12 @@ class RowService(BaseService[Row, RowRead]):
             source_id=row_id, context={"user_id": user_id}
         )
 
-        await self.row_repository.session.commit()
+        await self.row_repository.session.flush()
+        await self._rows_changed(table.board_id, [new_row.id])
 
         new_row = await self._get_row_entity(new_row.id, table_id)
 
-        return self.row_to_read(new_row)
+        return self.row_to_read(new_row, await self.row_repository.get_position(new_row))
 
     async def update_row_position(
         # ruff: noqa: PLR0913
@@ -191,92 +296,356 @@ class RowService(BaseService[Row, RowRead]):
         user_id: UUID,
         new_position: int,
         target_table_id: Optional[UUID],
+        expected_version: Optional[int] = None,
     ) -> RowRead:
-        await self._check_if_table_exists(source_table_id, user_id)
+        source_table = await self._check_if_table_exists(source_table_id, user_id)
+        row = await self._get_row_entity(row_id, source_table_id)
+        target_board_id = source_table.board_id
 
         if target_table_id is not None and source_table_id != target_table_id:
-            return await self._move_row_between_tables(
-                row_id, source_table_id, target_table_id, new_position
-            )
+            target_table = await self._check_if_table_exists(target_table_id, user_id)
+            target_board_id = target_table.board_id
+            rank = await self._rank_for_position(target_table_id, new_position, row.id)
+            payload = {"table_id": target_table_id, "rank": rank}
         else:
-            return await self._reorder_row_within_table(
-                row_id, source_table_id, new_position
+            await self.row_repository.share_ranks(source_table_id)
+            rank = await self.row_repository.rank_for_position(
+                source_table_id, new_position, exclude_row_id=row.id
             )
+            if rank is None:
+                raise ValueError(f"New position {new_position} is out of bounds")
+            payload = {"rank": rank}
+
+        updated_row = await self.row_repository.update(row, payload, expected_version)
+        await self._schedule_rebalance_if_needed(updated_row)
+        if target_board_id != source_table.board_id:
+            await self._rows_changed(source_table.board_id, [row.id], deleted=True)
+        await self._rows_changed(target_board_id, [row.id])
+
+        return self.row_to_read(
+            updated_row, await self.row_repository.get_position(updated_row)
+        )
 
-    def row_to_read(self, row: Row) -> RowRead:
-        owners = [
-            RowOwnerRead(
-                id=u.id,
-                first_name=u.first_name,
-                last_name=u.last_name,
-                email=u.email,
-                avatar_url=u.avatar_url,
+    async def move_rows(
+        # ruff: noqa: PLR0913
+        self,
+        board_id: UUID,
+        table_id: UUID,
+        user_id: UUID,
+        row_ids: List[UUID],
+        new_position: int,
+    ) -> List[RowRead]:
+        """
+        Move `row_ids` from any tables of the board into `table_id`, starting at
+        `new_position` and keeping the requested order. New ranks are computed
+        from the two neighbours only, so the cost does not grow with the table.
+        """
+        table = await self._check_if_table_exists(table_id, user_id)
+        if table.board_id != board_id:
+            raise NotFoundError(message=f"Table with ID {table_id} not found")
+
+        requested = list(dict.fromkeys(row_ids))
+        await self.row_repository.share_ranks(table_id)
+        sources = {
+            row_id: (source_table_id, name)
+            for row_id, source_table_id, name in await self.row_repository.lock_for_move(
+                requested, board_id
             )
-            for u in row.owner_users
+        }
+        missing = [str(row_id) for row_id in requested if row_id not in sources]
+        if missing:
+            raise NotFoundError(
+                message=f"Row with ID {', '.join(missing)} not found in board {board_id}"
+            )
+
+        actor = await self.user_cache.get(user_id)
+        if actor is None:
+            raise NotFoundError(message=f"User with ID {user_id} not found")
+
+        board = await self.board_repository.get(board_id)
+        if board is None:
+            raise NotFoundError(message=f"Board with ID {board_id} not found")
+
+        before, after = await self.row_repository.neighbour_ranks(
+            table_id, new_position, requested
+        )
+        ranks = dict(
+            zip(requested, ranks_between(before, after, len(requested)), strict=True)
+        )
+        await self.row_repository.move_many(table_id, ranks)
+        await self._rows_changed(board_id, requested)
+
+        if any(needs_rebalance(rank) for rank in ranks.values()):
+            await self.redis_client.sadd(RANK_REBALANCE_SET, str(table_id))  # type: ignore
+
+        await self.notification_service.emit_rows_moved(
+            db=self.row_repository.session,
+            table=table,
+            board=board,
+            actor=actor,
+            rows=[
+                {
+                    "id": str(row_id),
+                    "name": sources[row_id][1],
+                    "from_table_id": str(sources[row_id][0]),
+                }
+                for row_id in requested
+            ],
+        )
+
+        rows = {
+            row.id: row for row in await self.row_repository.get_many(requested, table_id)
+        }
+        first = await self.row_repository.get_position(rows[requested[0]])
+        return [
+            self.row_to_read(rows[row_id], position)
+            for position, row_id in enumerate(requested, start=first)
         ]
-        return convert_to_model(row, RowRead, custom_mapping={"owners": owners})
 
-    async def _move_row_between_tables(
+    async def apply_batch(
         self,
-        row_id: UUID,
-        source_table_id: UUID,
-        target_table_id: UUID,
-        new_position: int,
-    ) -> RowRead:
-        row = await self._get_row_entity(row_id, source_table_id)
+        board_id: UUID,
+        table_id: UUID,
+        user_id: UUID,
+        operations: List[RowBatchOperation],
+    ) -> RowBatchResponse:
+        table = await self._check_if_table_exists(table_id, user_id)
+        if table.board_id != board_id:
+            raise NotFoundError(message=f"Table with ID {table_id} not found")
 
-        target_rows = await self.row_repository.list_by_table(target_table_id)
+        actor = await self.user_cache.get(user_id)
+        if actor is None:
+            raise NotFoundError(message=f"User with ID {user_id} not found")
 
-        max_position = len(target_rows) + 1
-        if new_position < 1 or new_position > max_position:
-            new_position = max_position
+        board = await self.board_repository.get(table.board_id)
+        if board is None:
+            raise NotFoundError(message=f"Board with ID {table.board_id} not found")
 
-        for target_row in target_rows:
-            if target_row.position >= new_position:
-                await self.row_repository.update(
-                    target_row, {"position": target_row.position + 1}
-                )
+        plan = await self._plan_batch(table_id, operations)
+        created, changes, old_values, deleted, order, result_ids = plan
 
-        await self.row_repository.update(
-            row, {"table_id": target_table_id, "position": new_position}
+        await self.row_repository.apply_batch(
+            created,
+            [{"id": row_id, **values} for row_id, values in changes.items() if values],
+            [row.id for row in deleted],
         )
+        await self._rows_changed(board_id, [row.id for row in created] + list(changes))
+        await self._rows_changed(board_id, [row.id for row in deleted], deleted=True)
+
+        # Rows moved to where they already were are unchanged but still returned.
+        rows = {
+            row.id: row
+            for row in await self.row_repository.get_many(
+                list(dict.fromkeys(row_id for _, row_id in result_ids)), table_id
+            )
+        }
+        if any(needs_rebalance(row.rank) for row in rows.values()):
+            await self.redis_client.sadd(RANK_REBALANCE_SET, str(table_id))  # type: ignore
 
-        await self._get_normalized_row_positions(source_table_id)
+        await self.notification_service.emit_row_batch(
+            db=self.row_repository.session,
+            table=table,
+            board=board,
+            actor=actor,
+            created=[rows[row.id] for row in created],
+            updated=[
+                (rows[row_id], list(values), values)
+                for row_id, values in old_values.items()
+                if row_id in rows
+            ],
+            deleted=deleted,
+        )
 
-        updated_row = await self._get_row_entity(row_id, target_table_id)
-        return self.row_to_read(updated_row)
+        positions = {row_id: index for index, row_id in enumerate(order, start=1)}
+        return RowBatchResponse(
+            results=[
+                RowBatchResult(
+                    index=index,
+                    op=op_name,
+                    row_id=row_id,
+                    row=self.row_to_read(rows[row_id], positions[row_id])
+                    if row_id in rows and row_id in positions
+                    else None,
+                )
+                for index, (op_name, row_id) in enumerate(result_ids)
+            ]
+        )
 
-    async def _reorder_row_within_table(
-        self, row_id: UUID, table_id: UUID, new_position: int
-    ) -> RowRead:
-        row = await self._get_row_entity(row_id, table_id)
-        all_rows = await self._get_normalized_row_positions(table_id)
+    async def list_by_ids(self, board_id: UUID, row_ids: List[UUID]) -> List[RowRead]:
+        return [
+            self.row_to_read(row, position)
+            for row, position in await self.row_repository.list_with_positions(
+                board_id, row_ids
+            )
+        ]
+
+    def row_to_read(self, row: Row, position: Optional[int]) -> RowRead:
+        return convert_to_model(
+            row,
+            RowRead,
+            custom_mapping={"owners": self._owners_to_read(row), "position": position},
+        )
 
-        old_position = row.position
+    def _owners_to_read(self, row: Row) -> List[RowOwnerRead]:
+        return [
+            RowOwnerRead(
+                id=u.id,
+                first_name=u.first_name,
+                last_name=u.last_name,
+                email=u.email,
+                avatar_url=u.avatar_url,
+            )
+            for u in row.owner_users
+        ]
 
-        if new_position < 1 or new_position > len(all_rows):
-            raise ValueError(f"New position {new_position} is out of bounds")
+    async def _replace_owners(self, row: Row, owner_ids: List[UUID]) -> None:
+        requested = list(dict.fromkeys(owner_ids))
+        owners = await self.row_owner_repository.replace(row.id, requested)
 
-        if old_position == new_position:
-            return self.row_to_read(row)
+        missing = set(requested) - {owner.id for owner in owners}
+        if missing:
+            raise NotFoundError(
+                message=f"User with ID {', '.join(str(m) for m in missing)} not found"
+            )
+        set_committed_value(row, "owner_users", owners)
+
+    async def _rank_for_position(
+        self, table_id: UUID, new_position: int, row_id: UUID
+    ) -> str:
+        await self.row_repository.share_ranks(table_id)
+        rank = await self.row_repository.rank_for_position(
+            table_id, new_position, exclude_row_id=row_id
+        )
+        if rank is None:
+            rank = rank_between(await self.row_repository.get_last_rank(table_id), None)
+        return rank
+
+    async def _plan_batch(  # noqa: PLR0912
+        self, table_id: UUID, operations: List[RowBatchOperation]
+    ) -> Tuple[
+        List[Row],
+        Dict[UUID, dict],
+        Dict[UUID, dict],
+        List[Row],
+        List[UUID],
+        List[Tuple[str, UUID]],
+    ]:
+        # Replay every operation against the table's (id, rank) ordering so that
+        # positions are resolved in request order before anything is written.
+        # Only the rows the batch touches are locked, which makes their version
+        # checks hold until commit; a concurrent write that lands on one of the
+        # new ranks fails the unique rank check at commit instead.
+        await self.row_repository.share_ranks(table_id)
+        existing_ids = [op.row_id for op in operations if op.op != "create"]
+        existing = {
+            row.id: row
+            for row in await self.row_repository.get_many(
+                existing_ids, table_id, lock=True
+            )
+        }
+
+        ranked = await self.row_repository.list_ranks(table_id)
+        order = [row_id for row_id, _ in ranked]
+        ranks = dict(ranked)
+
+        created: List[Row] = []
+        changes: Dict[UUID, dict] = {}
+        old_values: Dict[UUID, dict] = {}
+        deleted: List[Row] = []
+        result_ids: List[Tuple[str, UUID]] = []
+
+        for op in operations:
+            if op.op == "create":
+                row = Row(id=uuid4(), table_id=table_id, name=op.name)
+                row.rank = self._rank_at(order, ranks, len(order))
+                order.append(row.id)
+                ranks[row.id] = row.rank
+                created.append(row)
+                result_ids.append((op.op, row.id))
+                continue
+
+            row = existing.get(op.row_id)
+            if row is None or row.id not in ranks:
+                raise NotFoundError(
+                    message=f"Row with ID {op.row_id} not found in table {table_id}"
+                )
 
-        if old_position < new_position:
-            for r in all_rows:
-                if old_position < r.position <= new_position:
-                    await self.row_repository.update(r, {"position": r.position - 1})
-        else:
-            for r in all_rows:
-                if new_position <= r.position < old_position:
-                    await self.row_repository.update(r, {"position": r.position + 1})
+            if op.version is not None and op.version != row.version:
+                raise ConflictError(
+                    message=f"Row with ID {row.id} was modified, expected version {op.version}"  # noqa: E501
+                )
 
-        await self.row_repository.update(row, {"position": new_position})
+            if op.op == "delete":
+                order.remove(row.id)
+                del ranks[row.id]
+                changes.pop(row.id, None)
+                old_values.pop(row.id, None)
+                deleted.append(row)
+            elif op.op == "move":
+                if op.new_position > len(order):
+                    raise ValueError(f"New position {op.new_position} is out of bounds")
+                if self._move_in_order(order, ranks, row.id, op.new_position):
+                    changes.setdefault(row.id, {})["rank"] = ranks[row.id]
+            else:
+                payload = op.model_dump(
+                    exclude_unset=True, exclude={"op", "row_id", "version"}
+                )
+                new_position = payload.pop("position", None)
+                if new_position is not None and self._move_in_order(
+                    order, ranks, row.id, min(new_position, len(order))
+                ):
+                    payload["rank"] = ranks[row.id]
+                for field in payload:
+                    if field != "rank":
+                        old_values.setdefault(row.id, {}).setdefault(
+                            field, getattr(row, field, None)
+                        )
+                if payload:
+                    changes.setdefault(row.id, {}).update(payload)
+            if op.op != "delete" and changes.get(row.id):
+                changes[row.id]["version"] = row.version + 1
+            result_ids.append((op.op, row.id))
+
+        return created, changes, old_values, deleted, order, result_ids
+
+    @staticmethod
+    def _rank_at(order: List[UUID], ranks: Dict[UUID, str], index: int) -> str:
+        before = ranks[order[index - 1]] if index > 0 else None
+        after = ranks[order[index]] if index < len(order) else None
+        return rank_between(before, after)
+
+    def _move_in_order(
+        self, order: List[UUID], ranks: Dict[UUID, str], row_id: UUID, position: int
+    ) -> bool:
+        """Move `row_id` to `position`, returning False when it is already there."""
+        index = position - 1
+        if order.index(row_id) == index:
+            return False
+        order.remove(row_id)
+        ranks[row_id] = self._rank_at(order, ranks, index)
+        order.insert(index, row_id)
+        return True
+
+    async def _schedule_rebalance_if_needed(self, row: Row) -> None:
+        if needs_rebalance(row.rank):
+            await self.redis_client.sadd(RANK_REBALANCE_SET, str(row.table_id))  # type: ignore
+
+    async def _rows_changed(
+        self, board_id: UUID, row_ids: List[UUID], deleted: bool = False
+    ) -> None:
+        await self.board_repository.record_changes(
+            board_id, ChangeEntityEnum.ROW, row_ids, deleted
+        )
+        self.board_cache.invalidate(board_id)
 
-        updated_row = await self._get_row_entity(row_id, table_id)
-        return self.row_to_read(updated_row)
+    async def _row_changed_in_table(self, table_id: UUID, row_id: UUID) -> None:
+        board_id = await self.table_repository.get_board_id(table_id)
+        if board_id is not None:
+            await self._rows_changed(board_id, [row_id])
 
     async def _check_if_table_exists(self, table_id: UUID, user_id: UUID) -> Table:
-        table = await self.table_repository.get_by_user(table_id, user_id)
-        if not table:
+        table = await self.table_repository.get_by_id(table_id)
+        if not table or not await self.board_access.has_access(table.board_id, user_id):
             raise NotFoundError(message=f"Table with ID {table_id} not found")
         return table
 
@@ -288,12 +657,5 @@ class RowService(BaseService[Row, RowRead]):
             )
         return row
 
-    async def _get_normalized_row_positions(self, table_id: UUID) -> List[Row]:
-        rows = await self.row_repository.list_by_table(table_id)
-        for index, row in enumerate(rows, start=1):
-            if row.position != index:
-                await self.row_repository.update(row, {"position": index})
-        return rows
-
 
 RowServiceDep = Annotated[RowService, Depends(RowService)]
@@ -1,15 +1,27 @@
-from typing import List, Annotated
+from typing import AbstractSet, List, Annotated, Optional, Tuple
 from uuid import uuid4, UUID
 from fastapi import Depends
 
 from app.api.dal.table_repository import TableRepositoryDep
 from app.api.services.board_service import BoardServiceDep
+from app.api.services.board_cache_service import (
+    BoardCacheServiceDep,
+    board_etag,
+    etag_matches,
+)
 from app.database_models import Table
-from app.api.models.table_model import TableCreate, TableUpdate, TableRead
+from app.api.models.table_model import (
+    TableCreate,
+    TableUpdate,
+    TableRead,
+    TablePositionRead,
+)
 from app.api.services.duplicate.duplication_factory import DuplicationServiceFactory
 from app.common.service import BaseService
-from app.common.errors.exceptions import NotFoundError
+from app.common.projection import TABLE_RELATIONS, Projection
+from app.common.errors.exceptions import NotFoundError, ConflictError
 from app.api.dal.auth_repository import AuthRepositoryDep
+from app.core.enums import ChangeEntityEnum
 
 
 class TableService(BaseService[Table, TableRead]):
@@ -18,17 +30,39 @@ class TableService(BaseService[Table, TableRead]):
         table_repository: TableRepositoryDep,
         board_service: BoardServiceDep,
         auth_repository: AuthRepositoryDep,
+        board_cache: BoardCacheServiceDep,
     ):
         super().__init__(TableRead, table_repository)
         self.table_repository = table_repository
         self.board_service = board_service
         self.auth_repository = auth_repository
+        self.board_cache = board_cache
 
-    async def list_tables(self, board_id: UUID, user_id: UUID) -> List[TableRead]:
+    async def list_tables(
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        if_none_match: AbstractSet[str] = frozenset(),
+        projection: Optional[Projection] = None,
+    ) -> Tuple[Optional[str], Optional[List[TableRead]]]:
+        """
+        The board's ETag and its tables, or `None` instead of the tables when
+        `if_none_match` already holds the current ETag. Rows and owners left
+        out by `projection` are not loaded. The ETag is `None` while the board
+        version cannot be read from Redis.
+        """
+        if projection is not None:
+            projection.check(TABLE_RELATIONS)
         await self._check_if_board_exists(board_id, user_id)
-        tables = await self.table_repository.list_by_board(board_id)
+        etag = board_etag(await self.board_cache.get_version(board_id))
+        if etag_matches(etag, if_none_match):
+            return etag, None
 
-        return [self.convert_to_model(table) for table in tables]
+        wants = projection.wants if projection is not None else lambda _: True
+        tables = await self.table_repository.list_by_board(
+            board_id, with_rows=wants("rows"), with_owners=wants("rows.owners")
+        )
+        return etag, [self.convert_to_model(table) for table in tables]
 
     async def get_table(self, table_id: UUID, board_id: UUID, user_id: UUID) -> TableRead:
         await self._check_if_board_exists(board_id, user_id)
@@ -42,33 +76,35 @@ class TableService(BaseService[Table, TableRead]):
     ) -> TableRead:
         await self._check_if_board_exists(board_id, user_id)
 
-        existing_tables = await self.table_repository.list_by_board(board_id)
-        next_position = len(existing_tables) + 1 if existing_tables else 1
-
         table_data = data.model_dump(exclude_none=True)
 
         payload = Table(
             id=uuid4(),
             board_id=board_id,
-            position=next_position,
             **table_data,
         )
-        created = await self.table_repository.create(payload)
+        created = await self.table_repository.append(payload)
+        await self._tables_changed(board_id, [created.id])
 
         return self.convert_to_model(created)
 
     async def update_table(
+        # ruff: noqa: PLR0913
         self,
         table_id: UUID,
         board_id: UUID,
         user_id: UUID,
         data: TableUpdate,
+        expected_version: Optional[int] = None,
     ) -> TableRead:
         await self._check_if_board_exists(board_id, user_id)
 
         table = await self._get_table_entity(table_id, board_id)
         payload = data.model_dump(exclude_none=True)
-        updated_table = await self.table_repository.update(table, payload)
+        updated_table = await self.table_repository.update(
+            table, payload, expected_version
+        )
+        await self._tables_changed(board_id, [table_id])
 
         return self.convert_to_model(updated_table)
 
@@ -78,6 +114,7 @@ class TableService(BaseService[Table, TableRead]):
         await self._get_table_entity(table_id, board_id)
 
         await self.table_repository.delete(table_id, board_id)
+        await self._tables_changed(board_id, [table_id], deleted=True)
 
     async def duplicate_table(
         self, table_id: UUID, board_id: UUID, user_id: UUID
@@ -101,48 +138,75 @@ class TableService(BaseService[Table, TableRead]):
             },
         )
 
-        await self.table_repository.session.commit()
-
+        await self.table_repository.session.flush()
         new_table = await self._get_table_entity(duplicated_table.id, board_id)
+        await self._tables_changed(board_id, [new_table.id])
+        await self.board_service.record_changes(
+            board_id, ChangeEntityEnum.ROW, [row.id for row in new_table.rows]
+        )
 
         return self.convert_to_model(new_table)
 
     async def update_table_position(
-        self, table_id: UUID, board_id: UUID, user_id: UUID, new_position: int
-    ) -> TableRead:
+        # ruff: noqa: PLR0913
+        self,
+        table_id: UUID,
+        board_id: UUID,
+        user_id: UUID,
+        new_position: int,
+        expected_version: Optional[int] = None,
+    ) -> List[TablePositionRead]:
         await self._check_if_board_exists(board_id, user_id)
 
-        table = await self._get_table_entity(table_id, board_id)
-        all_tables = await self._get_normalized_table_positions(board_id)
+        current = await self.table_repository.list_positions(board_id)
+        ordered_ids = [t_id for t_id, _, _ in current]
+        if table_id not in ordered_ids:
+            raise NotFoundError(message=f"Table with ID {table_id} not found")
 
-        old_position = table.position
+        versions = {t_id: version for t_id, _, version in current}
+        if expected_version is not None and versions[table_id] != expected_version:
+            raise ConflictError(
+                message=f"Table with ID {table_id} was modified, expected version {expected_version}"  # noqa: E501
+            )
 
-        if new_position < 1 or new_position > len(all_tables):
+        if new_position < 1 or new_position > len(ordered_ids):
             raise ValueError(
                 f"New position {new_position} is out of bounds for the current table list"
             )
 
-        if old_position == new_position:
-            return self.convert_to_model(table)
-
-        if old_position < new_position:
-            # moving down: shift tables between old_position+1 and new_position up by 1
-            for t in all_tables:
-                if old_position < t.position <= new_position:
-                    await self.table_repository.update(t, {"position": t.position - 1})
-        else:
-            # moving up: shift tables between new_position and old_position-1 down by 1
-            for t in all_tables:
-                if new_position <= t.position < old_position:
-                    await self.table_repository.update(t, {"position": t.position + 1})
-
-        await self.table_repository.update(table, {"position": new_position})
-
-        updated_table = await self._get_table_entity(table_id, board_id)
-        return self.convert_to_model(updated_table)
+        ordered_ids.remove(table_id)
+        ordered_ids.insert(new_position - 1, table_id)
+
+        # Positions are normalized to 1..n in the same statement as the move.
+        current_positions = {t_id: position for t_id, position, _ in current}
+        changed = {
+            t_id: position
+            for position, t_id in enumerate(ordered_ids, start=1)
+            if current_positions[t_id] != position
+        }
+        await self.table_repository.reorder(board_id, changed, table_id)
+        await self._tables_changed(board_id, list(changed))
+        if table_id in changed:
+            versions[table_id] += 1
+
+        return [
+            TablePositionRead(id=t_id, position=position, version=versions[t_id])
+            for position, t_id in enumerate(ordered_ids, start=1)
+        ]
+
+    def convert_to_model(self, entity: Table) -> TableRead:
+        return self.board_service.table_to_read(entity)
+
+    async def _tables_changed(
+        self, board_id: UUID, table_ids: List[UUID], deleted: bool = False
+    ) -> None:
+        await self.board_service.record_changes(
+            board_id, ChangeEntityEnum.TABLE, table_ids, deleted
+        )
+        self.board_cache.invalidate(board_id)
 
     async def _check_if_board_exists(self, board_id: UUID, user_id: UUID) -> None:
-        await self.board_service.get_board_entity(board_id, user_id)
+        await self.board_service.check_access(board_id, user_id)
 
     async def _get_table_entity(self, table_id: UUID, board_id: UUID) -> Table:
         table = await self.table_repository.get(table_id, board_id)
@@ -150,12 +214,5 @@ class TableService(BaseService[Table, TableRead]):
             raise NotFoundError(message=f"Table with ID {table_id} not found")
         return table
 
-    async def _get_normalized_table_positions(self, board_id: UUID) -> List[Table]:
-        tables = await self.table_repository.list_by_board(board_id)
-        for index, table in enumerate(tables, start=1):
-            if table.position != index:
-                await self.table_repository.update(table, {"position": index})
-        return tables
-
 
 TableServiceDep = Annotated[TableService, Depends(TableService)]
@@ -1,9 +1,9 @@
 import jwt
 import secrets
 from datetime import timedelta, datetime, timezone
-from typing import Any, cast
+from typing import Any, Optional, cast
 from app.core.config import get_settings
-from app.core.security import TokenPayload
+from app.core.security import IdentityClaims, TokenPayload
 
 
 settings = get_settings()
@@ -11,9 +11,9 @@ settings = get_settings()
 
 class TokenService:
     @staticmethod
-    def create_access_token(sub: str) -> str:
+    def create_access_token(sub: str, claims: Optional[IdentityClaims] = None) -> str:
         return TokenService._create_token(
-            {"sub": sub, "type": "access"},
+            {"sub": sub, "type": "access", **(claims or {})},
             timedelta(minutes=settings.access_token_exp_minutes),
         )
 
@@ -0,0 +1,179 @@
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Annotated, Optional, Tuple
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.api.dal.auth_repository import AuthRepositoryDep
+from app.api.models.user_model import UserRead
+from app.core.config import get_settings
+from app.core.database import DBSessionDep, run_after_commit
+from app.core.logger import logger
+from app.core.redis import RedisDep
+from app.database_models.user import User
+
+
+def user_key(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+def profile_version_key(user_id: UUID) -> str:
+    return f"user:{user_id}:profile_version"
+
+
+class LocalUserCache:
+    """A bounded LRU of user snapshots whose entries expire after `ttl` seconds."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, Tuple[float, UserRead]] = OrderedDict()
+
+    def get(self, user_id: UUID) -> Optional[UserRead]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return snapshot
+
+    def put(self, snapshot: UserRead) -> None:
+        self._entries[snapshot.id] = (time.monotonic() + self.ttl, snapshot)
+        self._entries.move_to_end(snapshot.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
+
+
+_settings = get_settings()
+local_user_cache = LocalUserCache(
+    _settings.user_cache_max_size, _settings.user_cache_ttl_seconds
+)
+
+
+class UserCacheService:
+    """
+    Users by id, for authentication and actor lookups. Snapshots of the public
+    user fields live in a per-process LRU for a few seconds and, with
+    `user_cache_redis` on, in Redis so that other processes skip Postgres too.
+    A hit is returned as a transient `User` that must not be added to a session.
+    Writers of profile fields call `profile_changed`; entries that other
+    processes hold locally age out with the TTL.
+
+    The profile version is published in Redis for as long as an access token
+    lives, so the identity claims of older tokens can be told apart as stale
+    without a database read.
+    """
+
+    def __init__(
+        self,
+        auth_repository: AuthRepositoryDep,
+        redis_client: RedisDep,
+        session: DBSessionDep,
+    ):
+        self.auth_repository = auth_repository
+        self.redis_client = redis_client
+        self.session = session
+
+    async def get(self, user_id: UUID) -> Optional[User]:
+        snapshot = local_user_cache.get(user_id)
+        if snapshot is None and get_settings().user_cache_redis:
+            snapshot = await self._get_shared(user_id)
+            if snapshot is not None:
+                local_user_cache.put(snapshot)
+        if snapshot is not None:
+            return User(**snapshot.model_dump())
+
+        user = await self.auth_repository.get_user(user_id)
+        if user is not None:
+            await self._put(UserRead.model_validate(user))
+        return user
+
+    async def get_profile_version(self, user_id: UUID) -> Optional[int]:
+        """The latest profile version, if it changed within an access token's life."""
+        try:
+            version = await self.redis_client.get(profile_version_key(user_id))
+        except Exception as err:
+            logger.warning(
+                "user_cache.get_failed",
+                extra={"user_id": str(user_id), "error": str(err)},
+            )
+            return None
+        return int(version) if version is not None else None
+
+    async def profile_changed(self, user_id: UUID) -> None:
+        """Bump the user's profile version and drop the cached user."""
+        version = await self.auth_repository.bump_profile_version(user_id)
+        self.invalidate(user_id)
+        if version is not None:
+            run_after_commit(
+                self.session, partial(self._publish_profile_version, user_id, version)
+            )
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop the user's entries now and again once the current request commits."""
+        local_user_cache.discard(user_id)
+        run_after_commit(self.session, partial(self._drop, user_id))
+
+    async def _put(self, snapshot: UserRead) -> None:
+        local_user_cache.put(snapshot)
+        settings = get_settings()
+        if not settings.user_cache_redis:
+            return
+        try:
+            await self.redis_client.set(
+                user_key(snapshot.id),
+                snapshot.model_dump_json(),
+                ex=settings.user_cache_redis_ttl_seconds,
+            )
+        except Exception as err:
+            logger.warning(
+                "user_cache.set_failed",
+                extra={"user_id": str(snapshot.id), "error": str(err)},
+            )
+
+    async def _get_shared(self, user_id: UUID) -> Optional[UserRead]:
+        try:
+            payload = await self.redis_client.get(user_key(user_id))
+        except Exception as err:
+            logger.warning(
+                "user_cache.get_failed",
+                extra={"user_id": str(user_id), "error": str(err)},
+            )
+            return None
+        return UserRead.model_validate_json(payload) if payload is not None else None
+
+    async def _drop(self, user_id: UUID) -> None:
+        local_user_cache.discard(user_id)
+        if not get_settings().user_cache_redis:
+            return
+        try:
+            await self.redis_client.delete(user_key(user_id))
+        except Exception as err:
+            logger.warning(
+                "user_cache.invalidate_failed",
+                extra={"user_id": str(user_id), "error": str(err)},
+            )
+
+    async def _publish_profile_version(self, user_id: UUID, version: int) -> None:
+        try:
+            await self.redis_client.set(
+                profile_version_key(user_id),
+                version,
+                ex=get_settings().access_token_exp_minutes * 60,
+            )
+        except Exception as err:
+            logger.warning(
+                "user_cache.invalidate_failed",
+                extra={"user_id": str(user_id), "error": str(err)},
+            )
+
+
+UserCacheServiceDep = Annotated[UserCacheService, Depends(UserCacheService)]
@@ -1,13 +1,19 @@
-from typing import Optional
+import math
+from typing import Dict, Optional
 
 
 class AppExceptionError(Exception):
     def __init__(
-        self, message: str, status_code: int, error_code: Optional[str] = None
+        self,
+        message: str,
+        status_code: int,
+        error_code: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> None:
         self.message = message
         self.status_code = status_code
         self.error_code = error_code or self.__class__.__name__
+        self.headers = headers
 
 
 class NotFoundError(AppExceptionError):
@@ -43,3 +49,20 @@ class RefreshTokenExpiredError(AppExceptionError):
 class TokenInvalidError(AppExceptionError):
     def __init__(self, message: str = "Token invalid") -> None:
         super().__init__(message, status_code=401)
+
+
+class ServiceBusyError(AppExceptionError):
+    def __init__(self, message: str = "Service busy, please retry") -> None:
+        super().__init__(message, status_code=503)
+
+
+class RateLimitExceededError(AppExceptionError):
+    def __init__(
+        self, retry_after: float, message: str = "Too many requests, please retry later"
+    ) -> None:
+        super().__init__(
+            message,
+            status_code=429,
+            error_code="RATE_LIMIT_EXCEEDED",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
@@ -1,6 +1,7 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from fastapi import Query, Depends
 from pydantic import Field
-from typing import Annotated, TypeVar, Generic, List
+from typing import Annotated, TypeVar, Generic, List, Tuple
 from app.db.base import BaseSchema
 
 M = TypeVar("M", bound=BaseSchema)
@@ -23,8 +24,32 @@ class PageParams:
         return None if next_id is None else str(next_id)
 
 
+class KeysetParams:
+    def __init__(
+        self, cursor: str | None = Query(None), limit: int = Query(50, ge=1, le=200)
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+    @staticmethod
+    def encode_cursor(position: int, key: str) -> str:
+        """Opaque cursor pointing after the item at `position` with sort `key`."""
+        return urlsafe_b64encode(f"{position}:{key}".encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, str]:
+        try:
+            position, _, key = urlsafe_b64decode(cursor.encode()).decode().partition(":")
+            return int(position), key
+        except ValueError as err:
+            raise ValueError(f"Invalid cursor {cursor!r}") from err
+
+
 class PaginatedResponse(BaseSchema, Generic[M]):
-    total_count: int = Field(description="Total number of items")
+    total_count: int | None = Field(
+        description="Total number of items, null where counting is opt-in and was "
+        "not requested"
+    )
     items: List[M] = Field(description="List of items")
     next_cursor: str | None = Field(
         description="Next cursor for pagination", default=None
@@ -32,3 +57,4 @@ class PaginatedResponse(BaseSchema, Generic[M]):
 
 
 PageParamsDep = Annotated[PageParams, Depends(PageParams)]
+KeysetParamsDep = Annotated[KeysetParams, Depends(KeysetParams)]
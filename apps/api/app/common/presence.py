@@ -0,0 +1,63 @@
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+import redis.asyncio as redis
+
+PRESENCE_ZSET = "presence:last_seen"
+PRESENCE_FLUSHED_KEY = "presence:flushed_at"
+
+# Flushes re-read this many seconds before the previous one, so that a request
+# that took its timestamp just before a flush but wrote it just after is kept.
+PRESENCE_FLUSH_OVERLAP_SECONDS = 5
+
+
+async def record_presence(redis_client: redis.Redis, user_id: UUID) -> None:
+    """Mark `user_id` as seen now. A user's entry only ever moves forward."""
+    await redis_client.zadd(PRESENCE_ZSET, {str(user_id): time.time()}, gt=True)
+
+
+async def seen_since(
+    redis_client: redis.Redis, user_ids: Iterable[str], since: float
+) -> List[str]:
+    """The users among `user_ids` seen at or after the epoch second `since`."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return []
+    scores = await redis_client.zmscore(PRESENCE_ZSET, user_ids)
+    return [
+        user_id
+        for user_id, score in zip(user_ids, scores, strict=True)
+        if score is not None and score >= since
+    ]
+
+
+async def presence_to_flush(redis_client: redis.Redis) -> Dict[UUID, datetime]:
+    """Users seen since the previous flush, with the time they were last seen."""
+    flushed_at = await redis_client.get(PRESENCE_FLUSHED_KEY)
+    low = f"({flushed_at}" if flushed_at is not None else "-inf"
+    entries = await redis_client.zrangebyscore(
+        PRESENCE_ZSET, low, "+inf", withscores=True
+    )
+    return {
+        UUID(user_id): datetime.fromtimestamp(score, tz=timezone.utc)
+        for user_id, score in entries
+    }
+
+
+async def mark_presence_flushed(
+    redis_client: redis.Redis, started_at: float, retention_seconds: int
+) -> None:
+    """
+    Move the flush cursor to just before `started_at` and drop entries that are
+    both flushed and older than `retention_seconds`, the longest look-back of
+    `seen_since`.
+    """
+    flushed_at = started_at - PRESENCE_FLUSH_OVERLAP_SECONDS
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.set(PRESENCE_FLUSHED_KEY, flushed_at)
+    pipe.zremrangebyscore(
+        PRESENCE_ZSET, "-inf", f"({min(flushed_at, started_at - retention_seconds)}"
+    )
+    await pipe.execute()
@@ -0,0 +1,82 @@
+from fastapi import Query, Depends
+from typing import Annotated, Any, FrozenSet, Iterable, Optional
+
+BOARD_RELATIONS = ("tables", "tables.rows", "tables.rows.owners")
+TABLE_RELATIONS = ("rows", "rows.owners")
+ROW_RELATIONS = ("owners",)
+
+
+class Projection:
+    """
+    `fields=` and `include=` of a read endpoint, as comma separated camelCase
+    paths with dots for nested fields. `fields` keeps only the listed fields,
+    `include` only embeds the listed relationships. Relationships that do not
+    end up in the output are not loaded either.
+    """
+
+    def __init__(
+        self,
+        fields: str | None = Query(
+            None, description="Fields to return, e.g. `id,name,rows.id`"
+        ),
+        include: str | None = Query(
+            None, description="Relationships to embed, e.g. `rows,rows.owners`"
+        ),
+    ):
+        self.fields = _paths(fields)
+        self.include = _paths(include)
+
+    @property
+    def is_default(self) -> bool:
+        return self.fields is None and self.include is None
+
+    def wants(self, relation: str) -> bool:
+        """Whether `relation` is part of the output, so it has to be loaded."""
+        if self.include is not None and not any(
+            path == relation or path.startswith(f"{relation}.") for path in self.include
+        ):
+            return False
+        return self._wants_field(relation)
+
+    def check(self, relations: Iterable[str]) -> None:
+        """Reject `include` paths that are not among `relations`."""
+        unknown = sorted((self.include or frozenset()).difference(relations))
+        if unknown:
+            raise ValueError(f"Cannot include {', '.join(unknown)}")
+
+    def apply(self, data: Any, relations: Iterable[str]) -> Any:
+        """Prune JSON-ready `data` (an item or a list of items)."""
+        relations = tuple(relations)
+        self.check(relations)
+        omitted = frozenset(r for r in relations if not self.wants(r))
+        return self._prune(data, "", omitted)
+
+    def _prune(self, value: Any, prefix: str, omitted: FrozenSet[str]) -> Any:
+        if isinstance(value, list):
+            return [self._prune(item, prefix, omitted) for item in value]
+        if not isinstance(value, dict):
+            return value
+        pruned = {}
+        for key, item in value.items():
+            path = f"{prefix}{key}"
+            if path in omitted or not self._wants_field(path):
+                continue
+            pruned[key] = self._prune(item, f"{path}.", omitted)
+        return pruned
+
+    def _wants_field(self, path: str) -> bool:
+        if self.fields is None:
+            return True
+        return any(
+            field == path or field.startswith(f"{path}.") or path.startswith(f"{field}.")
+            for field in self.fields
+        )
+
+
+def _paths(value: Optional[str]) -> Optional[FrozenSet[str]]:
+    if value is None:
+        return None
+    return frozenset(path.strip() for path in value.split(",") if path.strip())
+
+
+ProjectionDep = Annotated[Projection, Depends(Projection)]
@@ -0,0 +1,122 @@
+import random
+from typing import List, Optional, Tuple
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+RANK_INTEGER_WIDTH = 8
+RANK_STEP = BASE**4
+RANK_MAX_INTEGER = BASE**RANK_INTEGER_WIDTH - 1
+RANK_REBALANCE_LENGTH = 32
+
+RANK_REBALANCE_SET = "rank:rebalance"
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:  # noqa: PLR0911
+    """
+    Return an ordering key that sorts strictly between `before` and `after`.
+    `None` stands for the start (before) or the end (after) of the list.
+
+    Keys are a fixed-width base36 integer part followed by an optional
+    fraction that never ends with "0", so there is always room between two keys.
+    The key is picked at random from the middle of the gap, so concurrent
+    writers placing a row in the same gap rarely pick the same key.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Rank {before!r} must sort before {after!r}")
+
+    head_a, frac_a = _split(before) if before is not None else (0, "")
+
+    if after is None:
+        if before is None:
+            return _encode(_step())
+        if head_a + RANK_STEP <= RANK_MAX_INTEGER:
+            return _encode(head_a + _step())
+        if head_a < RANK_MAX_INTEGER:
+            return _encode(RANK_MAX_INTEGER)
+        return _encode(head_a) + _midpoint(frac_a, None)
+
+    head_b, frac_b = _split(after)
+
+    if before is None and head_b > RANK_STEP:
+        return _encode(head_b - _step())
+    if head_b - head_a > 1:
+        return _encode(_pick_between(head_a, head_b))
+    if head_b - head_a == 1:
+        return _encode(head_a) + _midpoint(frac_a, None)
+    return _encode(head_a) + _midpoint(frac_a, frac_b)
+
+
+def ranks_between(before: Optional[str], after: Optional[str], count: int) -> List[str]:
+    """
+    `count` increasing keys strictly between `before` and `after`. The range is
+    bisected, so key length grows with log(count) instead of with count.
+    """
+    if count <= 0:
+        return []
+    middle = rank_between(before, after)
+    left = count // 2
+    return (
+        ranks_between(before, middle, left)
+        + [middle]
+        + ranks_between(middle, after, count - left - 1)
+    )
+
+
+def spaced_ranks(count: int) -> List[str]:
+    """Evenly spaced keys for `count` items, used for backfills and rebalancing."""
+    step = min(RANK_STEP, RANK_MAX_INTEGER // (count + 1))
+    return [_encode(step * index) for index in range(1, count + 1)]
+
+
+def needs_rebalance(rank: str) -> bool:
+    return len(rank) > RANK_REBALANCE_LENGTH
+
+
+def _step() -> int:
+    return random.randint(RANK_STEP // 2, RANK_STEP)  # noqa: S311
+
+
+def _pick_between(low: int, high: int) -> int:
+    """A value strictly between `low` and `high`, from the middle half of the gap."""
+    margin = max(1, (high - low) // 4)
+    return random.randint(low + margin, high - margin)  # noqa: S311
+
+
+def _split(rank: str) -> Tuple[int, str]:
+    return _decode(rank[:RANK_INTEGER_WIDTH]), rank[RANK_INTEGER_WIDTH:]
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(RANK_INTEGER_WIDTH):
+        value, remainder = divmod(value, BASE)
+        chars.append(DIGITS[remainder])
+    return "".join(reversed(chars))
+
+
+def _decode(value: str) -> int:
+    result = 0
+    for char in value:
+        result = result * BASE + DIGITS.index(char)
+    return result
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+
+    if digit_b - digit_a > 1:
+        return DIGITS[_pick_between(digit_a, digit_b)]
+
+    if b is not None and len(b) > 1:
+        return b[:1]
+
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
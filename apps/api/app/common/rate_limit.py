@@ -0,0 +1,119 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import NoScriptError
+
+from app.core.logger import logger
+
+# Refills the bucket for the time since its last use, then takes one token.
+# Returns {1, "0"} when a token was taken and {0, "<seconds until one is
+# available>"} otherwise. Time comes from the Redis server, so every API
+# process agrees on it.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(retry_after)}
+"""  # noqa: S105
+TOKEN_BUCKET_SHA = hashlib.sha1(
+    TOKEN_BUCKET_SCRIPT.encode(), usedforsecurity=False
+).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class TokenBucket:
+    """Bursts of up to `capacity` requests, refilled evenly over `period_seconds`."""
+
+    capacity: int
+    period_seconds: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    """
+    The buckets a route draws from: one per client IP, one per authenticated
+    user, and one per `email` in the JSON body, for sign-in attempts spread
+    over many addresses. With `methods`, other methods are not limited.
+    """
+
+    name: str
+    per_ip: Optional[TokenBucket] = None
+    per_user: Optional[TokenBucket] = None
+    per_email: Optional[TokenBucket] = None
+    methods: Optional[FrozenSet[str]] = None
+
+
+class LocalTokenBuckets:
+    """Per-process buckets, used while Redis cannot be reached."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+    def take(self, key: str, bucket: TokenBucket) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._entries.pop(key, (bucket.capacity, now))
+        tokens = min(bucket.capacity, tokens + (now - updated_at) * bucket.rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / bucket.rate
+        self._entries[key] = (tokens, now)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return retry_after
+
+
+async def take_token(
+    redis_client: redis.Redis,
+    local_buckets: LocalTokenBuckets,
+    key: str,
+    bucket: TokenBucket,
+) -> float:
+    """
+    Take a token from the bucket at `key`. Returns 0 when one was taken and
+    the seconds until the next one otherwise. Falls back to `local_buckets`
+    when Redis fails, so limits then hold per process instead of per cluster.
+    """
+    try:
+        allowed, retry_after = await _eval_token_bucket(redis_client, key, bucket)
+    except Exception as err:
+        logger.warning("rate_limit.redis_failed", extra={"key": key, "error": str(err)})
+        return local_buckets.take(key, bucket)
+    return 0.0 if int(allowed) else float(retry_after)
+
+
+async def _eval_token_bucket(
+    redis_client: redis.Redis, key: str, bucket: TokenBucket
+) -> Tuple[int, str]:
+    args = (bucket.capacity, bucket.rate)
+    try:
+        result = await redis_client.evalsha(TOKEN_BUCKET_SHA, 1, key, *args)
+    except NoScriptError:
+        result = await redis_client.eval(TOKEN_BUCKET_SCRIPT, 1, key, *args)
+    allowed, retry_after = result
+    return allowed, retry_after
@@ -1,13 +1,14 @@
 import abc
 from uuid import UUID
-from sqlalchemy import ColumnExpressionArgument, Executable, select, func
+from sqlalchemy import ColumnExpressionArgument, Executable, select, func, update, inspect
 from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Generic, TypeVar, List, Tuple, Sequence, Optional, Any, Type
+from typing import Generic, TypeVar, List, Tuple, Sequence, Optional, Any, Type, Dict
 from abc import ABC
 from app.db.base import BaseSchema
-from app.common.errors.exceptions import NotFoundError
+from app.common.errors.exceptions import NotFoundError, ConflictError
 
 T = TypeVar("T", bound=DeclarativeMeta)
 _T_co = TypeVar("_T_co", bound=Any, covariant=True)
@@ -131,10 +132,65 @@ class BaseRepository(Repository[T]):
         for key, value in kwargs.items():
             setattr(entity, key, value)
         await self._session.merge(entity)
-        await self._session.commit()
+        await self._session.flush()
         await self._session.refresh(entity)
         return entity
 
+    async def update_returning(
+        self,
+        entity: T,
+        values: Dict[str, Any],
+        *options: ExecutableOption,
+        expected_version: Optional[int] = None,
+    ) -> T:
+        """
+        Apply `values` with a single UPDATE ... RETURNING. Column
+        attributes of `entity` are refreshed from the returned row, relationships
+        that are already loaded are kept, and `options` reload relationships
+        only when the caller asks for them.
+
+        Versioned models get `version = version + 1`; with `expected_version`
+        the UPDATE only matches that version and a miss raises ConflictError.
+        """
+        entity_id = self.get_primary_key(entity)
+        column_attrs = inspect(self.model).column_attrs
+        stmt = update(self.model).where(self.primary_key_column == entity_id)
+
+        if "version" in column_attrs:
+            version_column = column_attrs["version"].expression
+            values = {**values, "version": version_column + 1}
+            if expected_version is not None:
+                stmt = stmt.where(version_column == expected_version)
+
+        stmt = stmt.values(**values).returning(
+            *[attr.expression for attr in column_attrs]
+        )
+        result = await self._session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        )
+        row = result.one_or_none()
+        if row is None and expected_version is not None:
+            raise ConflictError(
+                message=f"Entity with {self.primary_key_column_name}={entity_id} was modified, expected version {expected_version}"  # noqa: E501
+            )
+        if row is None:
+            raise NotFoundError(
+                message=f"Entity with {self.primary_key_column_name}={entity_id} not found"  # noqa: E501
+            )
+
+        for attr, value in zip(column_attrs, row, strict=True):
+            set_committed_value(entity, attr.key, value)
+
+        if options:
+            reloaded = await self._session.execute(
+                select(self.model)
+                .where(self.primary_key_column == entity_id)
+                .options(*options)
+                .execution_options(populate_existing=True)
+            )
+            return reloaded.scalars().one()
+        return entity
+
     async def _get_paged_using_filter(
         self,
         skip: int,
@@ -177,7 +233,7 @@ class BaseRepository(Repository[T]):
 
     async def create_entity(self, entity: T) -> T:
         self._session.add(entity)
-        await self._session.commit()
+        await self._session.flush()
         await self._session.refresh(entity)
         return entity
 
@@ -190,8 +246,6 @@ class BaseRepository(Repository[T]):
             self._session.add_all(batch)
             await self._session.flush()
 
-        await self._session.commit()
-
     async def delete_by_id(self, primary_key: UUID) -> None:
         entity = await self.get_by_id(primary_key)
 
@@ -199,4 +253,4 @@ class BaseRepository(Repository[T]):
             return None
 
         await self._session.delete(entity)
-        await self._session.commit()
+        await self._session.flush()
@@ -13,6 +13,14 @@ class Settings(BaseSettings):
     access_token_exp_minutes: int = 1500
     refresh_token_exp_days: int = 30
 
+    password_bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    password_hash_workers: int = Field(default=4, ge=1)
+    password_hash_max_queue: int = Field(default=64, ge=0)
+
+    rate_limit_enabled: bool = Field(default=True)
+    forwarded_allow_ips: str = Field(default="127.0.0.1")
+    rate_limit_local_max_size: int = Field(default=10000, ge=1)
+
     max_tries: int = 60
     wait_seconds: int = 1
 
@@ -25,6 +33,28 @@ class Settings(BaseSettings):
     notif_suppress_minutes: int = Field(default=5, ge=1)
     notif_worker_poll_ms: int = Field(default=5000, ge=1000)
 
+    maintenance_worker_poll_ms: int = Field(default=10000, ge=1000)
+    rank_rebalance_batch_size: int = Field(default=20, ge=1)
+    presence_flush_batch_size: int = Field(default=1000, ge=1)
+    refresh_token_purge_interval_seconds: int = Field(default=3600, ge=1)
+    refresh_token_purge_batch_size: int = Field(default=1000, ge=1)
+    board_change_retention_seconds: int = Field(default=7 * 24 * 3600, ge=60)
+    board_change_prune_interval_seconds: int = Field(default=3600, ge=1)
+    board_change_prune_batch_size: int = Field(default=1000, ge=1)
+
+    board_cache_ttl_seconds: int = Field(default=3600, ge=1)
+    board_tree_sql_render: bool = Field(default=False)
+    board_stats_ttl_seconds: int = Field(default=60, ge=1)
+    board_export_batch_size: int = Field(default=500, ge=1)
+    board_access_cache_ttl_seconds: float = Field(default=5, gt=0)
+    board_access_cache_max_size: int = Field(default=10000, ge=1)
+
+    user_cache_ttl_seconds: float = Field(default=30, gt=0)
+    user_cache_max_size: int = Field(default=10000, ge=1)
+    user_cache_redis: bool = Field(default=False)
+    user_cache_redis_ttl_seconds: int = Field(default=300, ge=1)
+    access_token_claims: bool = Field(default=False)
+
     environment: str = Field(default="development", alias="ENVIRONMENT")
 
     # Email settings
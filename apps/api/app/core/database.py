@@ -1,11 +1,14 @@
-from typing import Annotated
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncGenerator, AsyncIterator, Awaitable, Callable
 from fastapi import Depends
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
 )
 from app.core.config import get_settings
+from app.common.errors.exceptions import ConflictError
 
 settings = get_settings()
 
@@ -23,11 +26,80 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+BEFORE_COMMIT = "before_commit"
+AFTER_COMMIT = "after_commit"
 
-async def get_db_session() -> AsyncSession:  # type: ignore
-    async with async_session_maker() as session:
+
+def run_before_commit(
+    session: AsyncSession, key: str, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Queue `callback` to run in the request's transaction right before it
+    commits, for writes that take contended locks and should hold them as
+    briefly as possible. A `key` is queued once, however often it is passed.
+    """
+    session.info.setdefault(BEFORE_COMMIT, {}).setdefault(key, callback)
+
+
+def run_after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Queue `callback` to run once the request's unit of work has committed, for
+    side effects such as cache invalidation that must not see uncommitted data.
+    Callbacks are dropped when the unit of work rolls back.
+    """
+    session.info.setdefault(AFTER_COMMIT, []).append(callback)
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Run the request in `session` as one unit of work. Repositories only flush;
+    once the endpoint has returned, the unit of work runs the
+    `run_before_commit` callbacks, commits and runs the `run_after_commit`
+    callbacks. An error anywhere in the request rolls everything back. It ends
+    when the request's dependencies are closed, which is before the response
+    is sent.
+    """
+    try:
+        yield session
+        for callback in session.info.pop(BEFORE_COMMIT, {}).values():
+            await callback()
+    except Exception:
+        session.info.pop(BEFORE_COMMIT, None)
+        session.info.pop(AFTER_COMMIT, None)
+        await session.rollback()
+        raise
+
+    try:
+        await session.commit()
+    except IntegrityError as err:
+        session.info.pop(AFTER_COMMIT, None)
+        # Deferred constraints (e.g. the unique row rank) are only checked
+        # here, when a concurrent write got in first.
+        raise ConflictError(
+            message="The resource was modified concurrently, please retry"
+        ) from err
+    for callback in session.info.pop(AFTER_COMMIT, []):
+        await callback()
+
+
+@asynccontextmanager
+async def detached_session(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    A new session on the engine of `session`, for reads that outlive the
+    request's unit of work, such as the body of a streamed response.
+    """
+    async with AsyncSession(
+        session.bind, expire_on_commit=False, autoflush=False
+    ) as detached:
+        yield detached
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session_maker() as session, unit_of_work(session):
         yield session
-        await session.close()
 
 
 DBSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
@@ -47,3 +47,15 @@ class NotificationKindEnum(str, Enum):
     BOARD_INVITATION = "board_invitation"
     ROW_ASSIGNMENT = "row_assignment"
     DEADLINE_REMINDER = "deadline_reminder"
+
+
+class ChangeEntityEnum(str, Enum):
+    BOARD = "board"
+    TABLE = "table"
+    ROW = "row"
+    MEMBER = "member"
+
+
+class ExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
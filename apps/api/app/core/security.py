@@ -1,13 +1,35 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, TypedDict, cast
+from functools import partial
+from typing import Any, Callable, Optional, Tuple, TypedDict, TypeVar, cast
 import secrets
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.common.errors.exceptions import ServiceBusyError
+from app.middleware.metrics import (
+    password_hash_duration_seconds,
+    password_hash_pending,
+    password_hash_rejected_total,
+    password_hash_wait_seconds,
+)
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with any other cost are flagged by `needs_update` and rehashed
+# on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.password_bcrypt_rounds,
+    bcrypt__min_rounds=settings.password_bcrypt_rounds,
+    bcrypt__max_rounds=settings.password_bcrypt_rounds,
+)
+
+T = TypeVar("T")
 
 
 class TokenPayload(TypedDict):
@@ -17,6 +39,16 @@ class TokenPayload(TypedDict):
     type: str
 
 
+class IdentityClaims(TypedDict):
+    """Profile claims of an access token, issued with `access_token_claims` on."""
+
+    email: str
+    given_name: str
+    family_name: str
+    picture: Optional[str]
+    pv: int
+
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -25,6 +57,71 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool, off the event loop. bcrypt releases
+    the GIL, so `workers` hashes run in parallel while requests keep being
+    served. At most `max_queue` more jobs wait for a worker; past that, callers
+    get `ServiceBusyError` right away instead of queueing behind a login storm.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._pending = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password)
+
+    async def verify(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check `password` against `hashed_password`. On a match, also return a
+        new hash when the stored one was made with another cost or scheme.
+        """
+        if not await self._run("verify", verify_password, password, hashed_password):
+            return False, None
+        if not pwd_context.needs_update(hashed_password):
+            return True, None
+        return True, await self.hash(password)
+
+    async def _run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self.workers + self.max_queue:
+            password_hash_rejected_total.inc()
+            raise ServiceBusyError(message="Too many sign-ins at once, please retry")
+
+        self._pending += 1
+        password_hash_pending.set(self._pending)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(_timed, operation, time.perf_counter(), func, *args),
+            )
+        finally:
+            self._pending -= 1
+            password_hash_pending.set(self._pending)
+
+
+def _timed(operation: str, queued_at: float, func: Callable[..., T], *args: Any) -> T:
+    started_at = time.perf_counter()
+    password_hash_wait_seconds.observe(started_at - queued_at)
+    try:
+        return func(*args)
+    finally:
+        password_hash_duration_seconds.labels(operation=operation).observe(
+            time.perf_counter() - started_at
+        )
+
+
+password_hasher = PasswordHasher(
+    settings.password_hash_workers, settings.password_hash_max_queue
+)
+
+
 def _create_token(data: dict[str, Any], expires_delta: timedelta) -> str:
     to_encode = data.copy()
     to_encode["exp"] = datetime.now(tz=timezone.utc) + expires_delta
@@ -45,6 +142,11 @@ def create_refresh_token(sub: str) -> str:
     )
 
 
+def hash_refresh_token(token: str) -> bytes:
+    """The fixed-size digest refresh tokens are stored and looked up by."""
+    return hashlib.sha256(token.encode()).digest()
+
+
 def decode_token(token: str) -> TokenPayload:
     decoded = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
     return cast(TokenPayload, decoded)
@@ -7,6 +7,7 @@ from .note import Note  # noqa: F401
 from .refresh_token import RefreshToken  # noqa: F401
 from .notification import Notification  # noqa: F401
 from .board_member import BoardMember  # noqa: F401
+from .board_change import BoardChange  # noqa: F401
 
 __all__ = [
     "User",
@@ -15,6 +16,7 @@ __all__ = [
     "Row",
     "RowOwner",
     "BoardMember",
+    "BoardChange",
     "Note",
     "RefreshToken",
     "Notification",
@@ -1,10 +1,11 @@
 from uuid import UUID
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import ForeignKey, Integer, Index
+from sqlalchemy import BigInteger, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from app.database_models.common import (
     TimestampMixin,
+    VersionMixin,
     UuidPk,
     StrLen50,
     StrLen1K,
@@ -17,7 +18,7 @@ if TYPE_CHECKING:
     from app.database_models.board_member import BoardMember
 
 
-class Board(TimestampMixin, Base):
+class Board(TimestampMixin, VersionMixin, Base):
     id: Mapped[UuidPk]
     name: Mapped[StrLen50] = mapped_column(nullable=False)
     description: Mapped[Optional[StrLen1K]] = mapped_column(nullable=True)
@@ -25,6 +26,9 @@ class Board(TimestampMixin, Base):
         PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
     position: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
 
     # relationships
     owner: Mapped["User"] = relationship("User", back_populates="boards")
@@ -35,4 +39,7 @@ class Board(TimestampMixin, Base):
         "BoardMember", back_populates="board", cascade="all, delete-orphan"
     )
 
-    __table_args__ = (Index("ix_boards_user_order", "owner_id", "position"),)
+    __table_args__ = (
+        Index("ix_boards_user_order", "owner_id", "position"),
+        Index("ix_boards_owner_updated", "owner_id", "updated_at", "id"),
+    )
@@ -0,0 +1,33 @@
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, func
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from app.core.enums import ChangeEntityEnum
+from app.db.base import Base
+
+
+class BoardChange(Base):
+    """
+    One entry of a board's change log. `seq` is the board's `change_seq` after
+    the mutation, so entries of a board are read back in commit order. Entries
+    older than the retention window are pruned by the maintenance worker.
+    """
+
+    board_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("boards.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    entity: Mapped[ChangeEntityEnum] = mapped_column(
+        SQLEnum(ChangeEntityEnum, name="change_entity_enum"), primary_key=True
+    )
+    entity_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (Index("ix_boardchanges_created_at", "created_at"),)
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from app.database_models.common import TimestampMixin, UuidPk
@@ -27,3 +27,8 @@ class BoardMember(TimestampMixin, Base):
 
     board: Mapped["Board"] = relationship("Board", back_populates="members")
     user: Mapped["User"] = relationship("User", back_populates="board_memberships")
+
+    __table_args__ = (
+        Index("ix_boardmembers_user_board", "user_id", "board_id"),
+        Index("ix_boardmembers_board_user", "board_id", "user_id"),
+    )
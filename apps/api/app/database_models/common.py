@@ -20,6 +20,12 @@ class TimestampMixin:
     )
 
 
+class VersionMixin:
+    version: Mapped[int] = mapped_column(
+        INTEGER, nullable=False, default=1, server_default="1"
+    )
+
+
 UuidPk = Annotated[
     UUID, mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
 ]
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import String, ForeignKey, Boolean, DateTime, Index
+from sqlalchemy import LargeBinary, ForeignKey, Boolean, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from app.database_models.common import TimestampMixin, UuidPk
@@ -16,8 +16,12 @@ class RefreshToken(TimestampMixin, Base):
     user_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
-    token: Mapped[str] = mapped_column(
-        String, unique=True, index=True, nullable=False, doc="Refresh token string"
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
+        unique=True,
+        index=True,
+        nullable=False,
+        doc="SHA-256 of the refresh token string",
     )
     revoked: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False, doc="Revoked flag"
@@ -29,6 +33,6 @@ class RefreshToken(TimestampMixin, Base):
     user: Mapped["User"] = relationship("User", back_populates="refresh_tokens")
 
     __table_args__ = (
-        Index("ix_refresh_tokens_token", "token"),
         Index("ix_refresh_tokens_user_expires", "user_id", "expires_at"),
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
     )
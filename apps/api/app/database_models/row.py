@@ -1,9 +1,9 @@
 from uuid import UUID
 from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import ForeignKey, Integer, Index, DateTime, Enum
+from sqlalchemy import ForeignKey, Text, DateTime, Enum, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database_models.common import TimestampMixin, UuidPk, StrLen255
+from app.database_models.common import TimestampMixin, VersionMixin, UuidPk, StrLen255
 from app.db.base import Base
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from app.core.enums import StatusEnum, PriorityEnum
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from app.database_models.user import User
 
 
-class Row(TimestampMixin, Base):
+class Row(TimestampMixin, VersionMixin, Base):
     id: Mapped[UuidPk]
     table_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("tables.id"), nullable=False
@@ -39,7 +39,9 @@ class Row(TimestampMixin, Base):
     due_date: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
-    position: Mapped[int] = mapped_column(Integer, default=0)
+    # Unbounded: keys grow while many rows land in the same gap, until the
+    # maintenance worker rebalances the table.
+    rank: Mapped[str] = mapped_column(Text(collation="C"), nullable=False)
 
     # relationships
     owner_users: Mapped[List["User"]] = relationship(
@@ -48,4 +50,14 @@ class Row(TimestampMixin, Base):
     table: Mapped["Table"] = relationship("Table", back_populates="rows")
     notes: Mapped[List["Note"]] = relationship("Note", back_populates="row")
 
-    __table_args__ = (Index("ix_rows_table_position", "table_id", "position"),)
+    # Deferred so that rebalancing and batch moves may pass through transient
+    # duplicates; concurrent writers landing on the same rank conflict at commit.
+    __table_args__ = (
+        UniqueConstraint(
+            "table_id",
+            "rank",
+            name="uq_rows_table_rank",
+            deferrable=True,
+            initially="DEFERRED",
+        ),
+    )
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from app.database_models.common import (
     TimestampMixin,
+    VersionMixin,
     UuidPk,
     StrLen10,
     StrLen50,
@@ -16,7 +17,7 @@ from app.api.models.table_model import DEFAULT_TABLE_COLOR
 from app.db.base import Base
 
 
-class Table(TimestampMixin, Base):
+class Table(TimestampMixin, VersionMixin, Base):
     id: Mapped[UuidPk]
     board_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("boards.id"), nullable=False
@@ -29,7 +30,7 @@ class Table(TimestampMixin, Base):
     # relationships
     board: Mapped["Board"] = relationship("Board", back_populates="tables")
     rows: Mapped[List["Row"]] = relationship(
-        "Row", back_populates="table", cascade="all, delete-orphan"
+        "Row", back_populates="table", cascade="all, delete-orphan", order_by="Row.rank"
     )
 
     __table_args__ = (Index("ix_tables_board_position", "board_id", "position"),)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database_models.common import TimestampMixin, UuidPk, StrLen50
 from app.db.base import Base
@@ -24,6 +24,10 @@ class User(TimestampMixin, Base):
     last_seen_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Bumped whenever a field carried in access-token claims changes.
+    profile_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
 
     # relationships
     boards: Mapped[List["Board"]] = relationship(
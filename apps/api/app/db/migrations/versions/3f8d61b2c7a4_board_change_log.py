@@ -0,0 +1,73 @@
+"""boards: change sequence and change log
+
+Revision ID: 3f8d61b2c7a4
+Revises: 7c2e4a91d0b3
+Create Date: 2026-10-17 15:02:47.318422
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8d61b2c7a4"
+down_revision: Union[str, None] = "7c2e4a91d0b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+change_entity_enum = postgresql.ENUM(
+    "BOARD",
+    "TABLE",
+    "ROW",
+    "MEMBER",
+    name="change_entity_enum",
+    create_type=False,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "boards",
+        sa.Column("change_seq", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+    change_entity_enum.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "boardchanges",
+        sa.Column("board_id", sa.UUID(), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False),
+        sa.Column("entity", change_entity_enum, nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("deleted", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["board_id"],
+            ["boards.id"],
+            name=op.f("fk_boardchanges_board_id_boards"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "board_id", "seq", "entity", "entity_id", name=op.f("pk_boardchanges")
+        ),
+    )
+    op.create_index(
+        "ix_boardchanges_created_at", "boardchanges", ["created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_boardchanges_created_at", table_name="boardchanges")
+    op.drop_table("boardchanges")
+    change_entity_enum.drop(op.get_bind(), checkfirst=True)
+    op.drop_column("boards", "change_seq")
@@ -0,0 +1,81 @@
+"""rows: replace integer position with fractional rank
+
+Revision ID: 50151f48e509
+Revises: cb659aa97802
+Create Date: 2026-10-17 09:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "50151f48e509"
+down_revision: Union[str, None] = "cb659aa97802"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_INTEGER_WIDTH = 8
+RANK_STEP = 36**4
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(RANK_INTEGER_WIDTH):
+        value, remainder = divmod(value, len(DIGITS))
+        chars.append(DIGITS[remainder])
+    return "".join(reversed(chars))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "rows",
+        sa.Column("rank", sa.String(length=255, collation="C"), nullable=True),
+    )
+
+    # Backfill ranks from the existing dense positions, evenly spaced per table.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("""
+        SELECT id,
+               row_number() OVER (
+                   PARTITION BY table_id ORDER BY position, created_at, id
+               ) AS ordinal
+        FROM rows
+        """)
+    ).fetchall()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE rows SET rank = :rank WHERE id = :id"),
+            [{"id": row.id, "rank": _encode(row.ordinal * RANK_STEP)} for row in rows],
+        )
+
+    op.alter_column("rows", "rank", nullable=False)
+    op.create_index("ix_rows_table_rank", "rows", ["table_id", "rank"], unique=False)
+    op.drop_index("ix_rows_table_position", table_name="rows")
+    op.drop_column("rows", "position")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("rows", sa.Column("position", sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE rows
+        SET position = ordered.ordinal
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY table_id ORDER BY rank) AS ordinal
+            FROM rows
+        ) AS ordered
+        WHERE rows.id = ordered.id
+    """)
+    op.alter_column("rows", "position", nullable=False)
+    op.create_index(
+        "ix_rows_table_position", "rows", ["table_id", "position"], unique=False
+    )
+    op.drop_index("ix_rows_table_rank", table_name="rows")
+    op.drop_column("rows", "rank")
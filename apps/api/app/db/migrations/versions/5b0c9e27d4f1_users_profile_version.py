@@ -0,0 +1,32 @@
+"""users: profile version for access-token identity claims
+
+Revision ID: 5b0c9e27d4f1
+Revises: a4e97c3d5b18
+Create Date: 2026-10-17 18:05:42.610837
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0c9e27d4f1"
+down_revision: Union[str, None] = "a4e97c3d5b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("profile_version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "profile_version")
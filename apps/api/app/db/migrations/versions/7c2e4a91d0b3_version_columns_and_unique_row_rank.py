@@ -0,0 +1,46 @@
+"""boards, tables, rows: version columns and unique row ranks
+
+Revision ID: 7c2e4a91d0b3
+Revises: 50151f48e509
+Create Date: 2026-10-17 11:40:21.905113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e4a91d0b3"
+down_revision: Union[str, None] = "50151f48e509"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in ("boards", "tables", "rows"):
+        op.add_column(
+            table_name,
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        )
+
+    op.drop_index("ix_rows_table_rank", table_name="rows")
+    op.create_unique_constraint(
+        "uq_rows_table_rank",
+        "rows",
+        ["table_id", "rank"],
+        deferrable=True,
+        initially="DEFERRED",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_rows_table_rank", "rows", type_="unique")
+    op.create_index("ix_rows_table_rank", "rows", ["table_id", "rank"], unique=False)
+
+    for table_name in ("rows", "tables", "boards"):
+        op.drop_column(table_name, "version")
@@ -0,0 +1,63 @@
+"""refreshtokens: store SHA-256 token hashes and index expiry for purging
+
+Revision ID: 8d2f6a13c9e5
+Revises: 5b0c9e27d4f1
+Create Date: 2026-10-17 19:12:30.448201
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f6a13c9e5"
+down_revision: Union[str, None] = "5b0c9e27d4f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refreshtokens", sa.Column("token_hash", sa.LargeBinary(32), nullable=True)
+    )
+    op.execute("UPDATE refreshtokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+    # Revoked tokens expire right away, so the purge only has to look at expiry.
+    op.execute(
+        "UPDATE refreshtokens SET expires_at = now() WHERE revoked AND expires_at > now()"
+    )
+    op.alter_column("refreshtokens", "token_hash", nullable=False)
+    op.create_index(
+        op.f("ix_refreshtokens_token_hash"),
+        "refreshtokens",
+        ["token_hash"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_refresh_tokens_expires_at", "refreshtokens", ["expires_at"], unique=False
+    )
+
+    op.drop_index(op.f("ix_refreshtokens_token"), table_name="refreshtokens")
+    op.drop_index("ix_refresh_tokens_token", table_name="refreshtokens")
+    op.drop_column("refreshtokens", "token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens cannot be recovered: existing sessions have to sign in again.
+    op.add_column("refreshtokens", sa.Column("token", sa.String(), nullable=True))
+    op.execute(
+        "UPDATE refreshtokens SET token = encode(token_hash, 'hex'), revoked = true"
+    )
+    op.alter_column("refreshtokens", "token", nullable=False)
+    op.create_index(
+        op.f("ix_refreshtokens_token"), "refreshtokens", ["token"], unique=True
+    )
+    op.create_index("ix_refresh_tokens_token", "refreshtokens", ["token"], unique=False)
+
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refreshtokens")
+    op.drop_index(op.f("ix_refreshtokens_token_hash"), table_name="refreshtokens")
+    op.drop_column("refreshtokens", "token_hash")
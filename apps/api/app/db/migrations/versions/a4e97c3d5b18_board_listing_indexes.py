@@ -0,0 +1,47 @@
+"""boards, boardmembers: indexes for keyset board listing
+
+Revision ID: a4e97c3d5b18
+Revises: 3f8d61b2c7a4
+Create Date: 2026-10-17 16:21:09.574310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4e97c3d5b18"
+down_revision: Union[str, None] = "3f8d61b2c7a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_boards_owner_updated",
+        "boards",
+        ["owner_id", "updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_boardmembers_user_board",
+        "boardmembers",
+        ["user_id", "board_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_boardmembers_board_user",
+        "boardmembers",
+        ["board_id", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_boardmembers_board_user", table_name="boardmembers")
+    op.drop_index("ix_boardmembers_user_board", table_name="boardmembers")
+    op.drop_index("ix_boards_owner_updated", table_name="boards")
@@ -0,0 +1,41 @@
+"""rows: store rank keys as unbounded text
+
+Revision ID: b6f1d83e2a47
+Revises: 8d2f6a13c9e5
+Create Date: 2026-10-18 09:41:26.507314
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6f1d83e2a47"
+down_revision: Union[str, None] = "8d2f6a13c9e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "rows",
+        "rank",
+        existing_type=sa.String(length=255, collation="C"),
+        type_=sa.Text(collation="C"),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "rows",
+        "rank",
+        existing_type=sa.Text(collation="C"),
+        type_=sa.String(length=255, collation="C"),
+        existing_nullable=False,
+    )
@@ -9,11 +9,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from sqlalchemy import text
 
 from app.api.routes.main_router import add_routes
 from app.common.errors.error_model import ErrorResponseModel
 from app.common.errors.exceptions import AppExceptionError
+from app.core.config import get_settings
 from app.core.logger import logger, get_trace_id
 from app.core.database import async_engine
 from app.core.redis import close_redis_pool, init_redis_pool
@@ -97,6 +99,11 @@ def create_app() -> FastAPI:
     # Add Prometheus metrics middleware
     app.add_middleware(PrometheusMiddleware)
 
+    # Take the client address from X-Forwarded-For when a trusted proxy sent it
+    app.add_middleware(
+        ProxyHeadersMiddleware, trusted_hosts=get_settings().forwarded_allow_ips
+    )
+
     # Add routes
     add_routes(app)
 
@@ -168,6 +175,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
                 details=None,
                 trace_id=trace_id,
             ).model_dump(exclude_none=True),
+            headers=exc.headers,
         )
 
     @app.exception_handler(ValidationError)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.dal.auth_repository import AuthRepository
+from app.api.dal.board_repository import BoardRepository
+from app.api.dal.row_repository import RowRepository
+from app.api.services.board_cache_service import BoardCacheService
+from app.common.presence import mark_presence_flushed, presence_to_flush
+from app.common.rank import RANK_REBALANCE_SET
+from app.core.config import get_settings
+from app.core.database import async_session_maker, unit_of_work
+from app.core.enums import ChangeEntityEnum
+from app.core.logger import logger
+
+REFRESH_TOKEN_PURGE_LOCK = "maintenance:refresh_token_purge"  # noqa: S105
+BOARD_CHANGE_PRUNE_LOCK = "maintenance:board_change_prune"
+
+
+class MaintenanceWorker:
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        session_maker: async_sessionmaker[AsyncSession],
+    ):
+        self.redis = redis_client
+        self.session_maker = session_maker
+
+    async def run_once(self) -> None:
+        await self.rebalance_row_ranks()
+        await self.flush_presence()
+        await self.purge_refresh_tokens()
+        await self.prune_board_changes()
+
+    async def rebalance_row_ranks(self) -> None:
+        settings = get_settings()
+        table_ids = await self.redis.spop(  # type: ignore
+            RANK_REBALANCE_SET, settings.rank_rebalance_batch_size
+        )
+        if not table_ids:
+            return
+
+        for table_id in table_ids:
+            try:
+                async with self.session_maker() as session, unit_of_work(session):
+                    rebalanced = await RowRepository(session).rebalance(UUID(table_id))
+                    if rebalanced is not None:
+                        # Rows keep their order but get new ranks and versions,
+                        # so clients and cached trees must pick them up again.
+                        board_id, row_ids = rebalanced
+                        await BoardRepository(session).record_changes(
+                            board_id, ChangeEntityEnum.ROW, row_ids
+                        )
+                        BoardCacheService(self.redis, session).invalidate(board_id)
+
+                logger.info(
+                    "maintenance.rank_rebalanced",
+                    extra={"table_id": table_id},
+                )
+            except Exception as e:
+                logger.error(
+                    "maintenance.rank_rebalance_error",
+                    extra={"table_id": table_id, "error": str(e)},
+                )
+
+    async def flush_presence(self) -> None:
+        settings = get_settings()
+        started_at = time.time()
+        last_seen = await presence_to_flush(self.redis)
+        if last_seen:
+            entries = iter(last_seen.items())
+            try:
+                async with self.session_maker() as session:
+                    repository = AuthRepository(session)
+                    while batch := dict(
+                        islice(entries, settings.presence_flush_batch_size)
+                    ):
+                        await repository.set_last_seen(batch)
+                    await session.commit()
+            except Exception as e:
+                logger.error(
+                    "maintenance.presence_flush_error",
+                    extra={"users": len(last_seen), "error": str(e)},
+                )
+                return
+
+            logger.info(
+                "maintenance.presence_flushed",
+                extra={"users": len(last_seen)},
+            )
+
+        await mark_presence_flushed(
+            self.redis, started_at, settings.notif_suppress_seconds
+        )
+
+    async def purge_refresh_tokens(self) -> None:
+        """
+        Delete expired and revoked refresh tokens, one short transaction per
+        batch. Runs at most once per interval across all maintenance workers.
+        """
+        settings = get_settings()
+        if not await self.redis.set(
+            REFRESH_TOKEN_PURGE_LOCK,
+            int(time.time()),
+            nx=True,
+            ex=settings.refresh_token_purge_interval_seconds,
+        ):
+            return
+
+        batch_size = settings.refresh_token_purge_batch_size
+        purged = 0
+        try:
+            while True:
+                async with self.session_maker() as session:
+                    deleted = await AuthRepository(session).purge_expired_tokens(
+                        batch_size
+                    )
+                    await session.commit()
+                purged += deleted
+                if deleted < batch_size:
+                    break
+        except Exception as e:
+            logger.error(
+                "maintenance.refresh_token_purge_error",
+                extra={"purged": purged, "error": str(e)},
+            )
+            return
+
+        logger.info("maintenance.refresh_tokens_purged", extra={"purged": purged})
+
+    async def prune_board_changes(self) -> None:
+        """
+        Delete board change log entries older than the retention window, one
+        short transaction per batch. Clients syncing from a pruned change are
+        told to reload the board. Runs at most once per interval across all
+        maintenance workers.
+        """
+        settings = get_settings()
+        if not await self.redis.set(
+            BOARD_CHANGE_PRUNE_LOCK,
+            int(time.time()),
+            nx=True,
+            ex=settings.board_change_prune_interval_seconds,
+        ):
+            return
+
+        before = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.board_change_retention_seconds
+        )
+        batch_size = settings.board_change_prune_batch_size
+        pruned = 0
+        try:
+            while True:
+                async with self.session_maker() as session:
+                    deleted = await BoardRepository(session).prune_changes(
+                        before, batch_size
+                    )
+                    await session.commit()
+                pruned += deleted
+                if deleted < batch_size:
+                    break
+        except Exception as e:
+            logger.error(
+                "maintenance.board_change_prune_error",
+                extra={"pruned": pruned, "error": str(e)},
+            )
+            return
+
+        logger.info("maintenance.board_changes_pruned", extra={"pruned": pruned})
+
+
+async def run_worker() -> None:
+    logger.info("maintenance.starting")
+
+    settings = get_settings()
+    poll_interval = settings.maintenance_worker_poll_ms / 1000
+    logger.info(
+        "maintenance.config",
+        extra={"poll_interval_sec": poll_interval},
+    )
+
+    try:
+        while True:
+            redis_client = None
+            try:
+                redis_client = redis.Redis.from_url(
+                    settings.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                )
+
+                worker = MaintenanceWorker(redis_client, async_session_maker)
+
+                await worker.run_once()
+
+            except Exception as e:
+                logger.error(
+                    "maintenance.loop_error",
+                    extra={"error": str(e)},
+                )
+            finally:
+                if redis_client:
+                    await redis_client.aclose()
+
+            await asyncio.sleep(poll_interval)
+
+    except KeyboardInterrupt:
+        logger.info("maintenance.interrupted")
+    finally:
+        logger.info("maintenance.shutdown_complete")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
@@ -35,6 +35,35 @@ http_exceptions_total = Counter(
     ["method", "endpoint", "exception_type"],
 )
 
+password_hash_pending = Gauge(
+    "password_hash_pending",
+    "Password hashing jobs queued or running on the hashing pool",
+)
+
+password_hash_rejected_total = Counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs rejected because the hashing queue was full",
+)
+
+password_hash_wait_seconds = Histogram(
+    "password_hash_wait_seconds",
+    "Time a password hashing job waited for a pool worker",
+    buckets=(0.001, 0.005, 0.025, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+password_hash_duration_seconds = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password",
+    ["operation"],
+    buckets=(0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5),
+)
+
+rate_limit_rejected_total = Counter(
+    "rate_limit_rejected_total",
+    "Requests rejected by a rate limit policy",
+    ["policy", "scope"],
+)
+
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
 
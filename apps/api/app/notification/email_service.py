@@ -278,6 +278,8 @@ class EmailService:
             return "created a new row", "✨"
         elif "deleted" in actions:
             return "deleted the row", "🗑️"
+        elif "moved" in actions:
+            return "moved the row here", "↪️"
         elif "updated" in actions:
             if len(changes) == 1:
                 field = list(changes.keys())[0]
@@ -360,6 +362,8 @@ Activity in {board_name}
                         action_text = "created"
                     elif "deleted" in actions:
                         action_text = "deleted"
+                    elif "moved" in actions:
+                        action_text = "moved here"
                     elif "updated" in actions:
                         if len(changes) == 1:
                             field = list(changes.keys())[0]
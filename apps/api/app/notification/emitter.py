@@ -4,6 +4,7 @@ from typing import Iterable
 
 import redis.asyncio as redis
 
+from app.common.presence import seen_since
 from app.notification.schemas import Event
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,7 +24,9 @@ async def emit_activity(
     settings = get_settings()
     payloads = _serialize_events(events)
 
-    recipients = await _eligible_recipients_for_board(db, board_id, actor_id)
+    recipients = await _eligible_recipients_for_board(
+        db, redis_client, board_id, actor_id
+    )
     if not recipients:
         logger.info(
             "notif.skip_no_recipients",
@@ -72,8 +75,13 @@ def _expiry_ms(window_sec: int) -> int:
 
 
 async def _eligible_recipients_for_board(
-    db: AsyncSession, board_id: str, actor_id: str
+    db: AsyncSession, redis_client: redis.Redis, board_id: str, actor_id: str
 ) -> list[str]:
+    """
+    Board members other than the actor, without those active in the last
+    `notif_suppress_minutes`. Recent presence is read from Redis, since
+    users.last_seen_at is only written by the periodic presence flush.
+    """
     settings = get_settings()
     if settings.notif_suppress_minutes == 0:
         rows = await db.execute(
@@ -99,5 +107,8 @@ async def _eligible_recipients_for_board(
           """),
             {"b": board_id, "a": actor_id, "threshold": threshold_timestamp},
         )
+        recipients = [str(r[0]) for r in rows.fetchall()]
+        active = set(await seen_since(redis_client, recipients, threshold_timestamp))
+        return [rid for rid in recipients if rid not in active]
 
     return [str(r[0]) for r in rows.fetchall()]
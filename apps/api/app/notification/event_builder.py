@@ -11,6 +11,7 @@ from .schemas import (
     TableContext,
     FieldDelta,
     EventType,
+    MovedRow,
 )
 
 
@@ -63,6 +64,27 @@ def build_row_event(
     return event
 
 
+def build_rows_moved_event(
+    *,
+    rows: list[MovedRow],
+    table: Table,
+    board: Board,
+    actor: User,
+) -> Event:
+    return {
+        "type": "RowsMoved",
+        "board": {"id": str(board.id), "name": board.name},
+        "table": {
+            "id": str(table.id),
+            "name": table.name,
+            "board_id": str(table.board_id),
+        },
+        "actor": _user_to_snapshot(actor),
+        "at": _iso_now(),
+        "rows": rows,
+    }
+
+
 def _build_delta(
     row: Row,
     changed: list[str],
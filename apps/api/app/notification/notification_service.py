@@ -4,9 +4,9 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.redis import RedisDep
-from app.notification.schemas import Event
+from app.notification.schemas import Event, MovedRow
 from app.notification.emitter import emit_activity
-from app.notification.event_builder import build_row_event
+from app.notification.event_builder import build_row_event, build_rows_moved_event
 from app.database_models import Row, Table, Board, User
 
 
@@ -90,6 +90,69 @@ class NotificationService:
             events=[event],
         )
 
+    async def emit_row_batch(
+        # ruff: noqa: PLR0913
+        self,
+        db: AsyncSession,
+        table: Table,
+        board: Board,
+        actor: User,
+        created: list[Row],
+        updated: list[tuple[Row, list[str], dict]],
+        deleted: list[Row],
+    ) -> None:
+        events: list[Event] = [
+            build_row_event(
+                etype="RowCreated", row=row, table=table, board=board, actor=actor
+            )
+            for row in created
+        ]
+        events.extend(
+            build_row_event(
+                etype="RowUpdated",
+                row=row,
+                table=table,
+                board=board,
+                actor=actor,
+                changed=changed_fields,
+                old_values=old_values,
+            )
+            for row, changed_fields, old_values in updated
+        )
+        events.extend(
+            build_row_event(
+                etype="RowDeleted", row=row, table=table, board=board, actor=actor
+            )
+            for row in deleted
+        )
+        if not events:
+            return
+
+        await self._emit_events(
+            db=db,
+            board_id=str(board.id),
+            actor_id=str(actor.id),
+            events=events,
+        )
+
+    async def emit_rows_moved(
+        # ruff: noqa: PLR0913
+        self,
+        db: AsyncSession,
+        table: Table,
+        board: Board,
+        actor: User,
+        rows: list[MovedRow],
+    ) -> None:
+        event = build_rows_moved_event(rows=rows, table=table, board=board, actor=actor)
+
+        await self._emit_events(
+            db=db,
+            board_id=str(board.id),
+            actor_id=str(actor.id),
+            events=[event],
+        )
+
     async def _emit_events(
         # ruff: noqa: PLR0913
         self,
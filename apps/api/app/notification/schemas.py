@@ -4,6 +4,7 @@ EventType = Literal[
     "RowCreated",
     "RowUpdated",
     "RowDeleted",
+    "RowsMoved",
     "TableCreated",
     "TableUpdated",
     "TableDeleted",
@@ -35,6 +36,12 @@ class Snapshot(TypedDict, total=False):
     due_date: str | None
 
 
+class MovedRow(TypedDict):
+    id: str
+    name: str
+    from_table_id: str
+
+
 class FieldDelta(TypedDict):
     from_value: str
     to_value: str
@@ -50,3 +57,4 @@ class Event(TypedDict):
     snapshot: NotRequired[Snapshot]
     changed: NotRequired[list[str]]
     delta: NotRequired[Dict[str, FieldDelta]]
+    rows: NotRequired[list[MovedRow]]
@@ -11,6 +11,7 @@ from app.core.database import async_session_maker, AsyncSession
 from app.notification.email_service import EmailService
 from app.database_models import User, Board, Table, Row
 from app.core.enums import StatusEnum, PriorityEnum
+from app.common.rank import rank_between
 
 
 class ResendSandboxConfig:
@@ -81,7 +82,7 @@ class TestDataFactory:
         db_session: AsyncSession,
         table_id: UUID,
         name: str = "Test Row",
-        position: int = 1,
+        rank: Optional[str] = None,
     ) -> UUID:
         row_id = uuid4()
         row = Row(
@@ -90,7 +91,7 @@ class TestDataFactory:
             status=StatusEnum.NOT_STARTED,
             priority=PriorityEnum.MEDIUM,
             table_id=table_id,
-            position=position,
+            rank=rank or rank_between(None, None),
         )
         db_session.add(row)
         return row_id
@@ -151,6 +151,10 @@ class NotificationWorker:
         table_id = event["table"]["id"]
         row_id = event.get("row_id")
 
+        if event["type"] == "RowsMoved":
+            self._process_rows_moved(summary, event)
+            return
+
         if not row_id:
             return
 
@@ -170,6 +174,15 @@ class NotificationWorker:
         if "snapshot" in event:
             row_data["name"] = event["snapshot"].get("name", "Untitled")
 
+    def _process_rows_moved(self, summary: Dict, event: Event) -> None:
+        table = summary["boards"][event["board"]["id"]]["tables"][event["table"]["id"]]
+        table["name"] = event["table"]["name"]
+
+        for moved in event.get("rows", []):
+            row_data = table["rows"][moved["id"]]
+            row_data["name"] = moved["name"]
+            self._add_action(row_data, "moved")
+
     def _add_action(self, row_data: Dict, action: str) -> None:
         if action not in row_data["actions"]:
             row_data["actions"].append(action)
@@ -11,11 +11,19 @@ from httpx._transports.asgi import ASGITransport
 from http import HTTPStatus
 from app.main import app
 from app.db.base import Base
-from app.core.database import get_db_session
+from app.core.database import get_db_session, unit_of_work
 from app.core.redis import get_redis
 from tests.utils.register_and_login_user import register_and_login_user
 from app.notification.notification_service import NotificationService
-from app.api.services import AuthService, BoardService, RowService, TableService
+from app.api.services import (
+    AuthService,
+    BoardAccessService,
+    BoardCacheService,
+    BoardService,
+    RowService,
+    TableService,
+    UserCacheService,
+)
 from app.api.dal import (
     AuthRepository,
     BoardRepository,
@@ -63,8 +71,13 @@ def mock_redis() -> AsyncMock:
     pipeline.execute = AsyncMock(return_value=[])
     pipeline.rpush = MagicMock()
     pipeline.zadd = MagicMock()
+    pipeline.incr = MagicMock()
     r.pipeline = MagicMock(return_value=pipeline)
     r.zrangebyscore = AsyncMock(return_value=[])
+    r.get = AsyncMock(return_value=None)
+    r.mget = AsyncMock(return_value=[None, None])
+    r.zmscore = AsyncMock(side_effect=lambda _key, members: [None] * len(members))
+    r.evalsha = AsyncMock(return_value=[1, "0"])
     r.lrange = AsyncMock(return_value=[])
     r.zrem = AsyncMock()
     r.delete = AsyncMock()
@@ -104,7 +117,7 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
 @pytest.fixture(scope="function", autouse=True)
 def override_app_db() -> Generator[None, None, None]:
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        async with app.state.test_async_session_maker() as session:
+        async with app.state.test_async_session_maker() as session, unit_of_work(session):
             yield session
 
     app.dependency_overrides[get_db_session] = override_get_db
@@ -143,6 +156,32 @@ def row_owner_repository(db: AsyncSession) -> RowOwnerRepository:
     return RowOwnerRepository(db)
 
 
+@pytest.fixture
+def board_cache(mock_redis: AsyncMock, db: AsyncSession) -> BoardCacheService:
+    return BoardCacheService(mock_redis, db)
+
+
+@pytest.fixture
+def member_repository(db: AsyncSession) -> BoardMemberRepository:
+    return BoardMemberRepository(db)
+
+
+@pytest.fixture
+def board_access(
+    member_repository: BoardMemberRepository,
+    board_cache: BoardCacheService,
+    db: AsyncSession,
+) -> BoardAccessService:
+    return BoardAccessService(member_repository, board_cache, db)
+
+
+@pytest.fixture
+def user_cache(
+    auth_repository: AuthRepository, mock_redis: AsyncMock, db: AsyncSession
+) -> UserCacheService:
+    return UserCacheService(auth_repository, mock_redis, db)
+
+
 @pytest.fixture
 def auth_service(auth_repository: AuthRepository) -> AuthService:
     return AuthService(auth_repository)
@@ -153,11 +192,15 @@ def board_service(
     board_repository: BoardRepository,
     member_repository: BoardMemberRepository,
     row_service: RowService,
+    board_cache: BoardCacheService,
+    board_access: BoardAccessService,
 ) -> BoardService:
     return BoardService(
         board_repository=board_repository,
         member_repository=member_repository,
         row_service=row_service,
+        board_cache=board_cache,
+        board_access=board_access,
     )
 
 
@@ -166,11 +209,13 @@ def table_service(
     table_repository: TableRepository,
     board_service: BoardService,
     auth_repository: AuthRepository,
+    board_cache: BoardCacheService,
 ) -> TableService:
     return TableService(
         table_repository=table_repository,
         board_service=board_service,
         auth_repository=auth_repository,
+        board_cache=board_cache,
     )
 
 
@@ -179,17 +224,23 @@ def row_service(  # noqa: PLR0913
     row_repository: RowRepository,
     table_repository: TableRepository,
     row_owner_repository: RowOwnerRepository,
-    auth_repository: AuthRepository,
     notification_service: NotificationService,
     board_repository: BoardRepository,
+    mock_redis: AsyncMock,
+    board_cache: BoardCacheService,
+    user_cache: UserCacheService,
+    board_access: BoardAccessService,
 ) -> RowService:
     return RowService(
         row_repository=row_repository,
         table_repository=table_repository,
         row_owner_repository=row_owner_repository,
-        auth_repository=auth_repository,
         notification_service=notification_service,
         board_repository=board_repository,
+        redis_client=mock_redis,
+        board_cache=board_cache,
+        user_cache=user_cache,
+        board_access=board_access,
     )
 
 
@@ -1,7 +1,29 @@
+import hashlib
+import asyncio
 import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
 from httpx import AsyncClient
 from http import HTTPStatus
-from uuid import uuid4
+from uuid import UUID, uuid4
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.services.user_cache_service import UserCacheService, profile_version_key
+from passlib.context import CryptContext
+from app.common.errors.exceptions import ServiceBusyError
+from app.core.security import (
+    PasswordHasher,
+    decode_token,
+    hash_refresh_token,
+    pwd_context,
+)
+from app.database_models.refresh_token import RefreshToken
+from app.common.presence import PRESENCE_ZSET
+from app.common.rate_limit import LocalTokenBuckets, TokenBucket, take_token
+from app.database_models.user import User
+from app.main import app
+from app.maintenance.worker import MaintenanceWorker
+from tests.conftest import get_authenticated_client
 
 
 @pytest.mark.asyncio
@@ -25,7 +47,7 @@ async def test_register_and_login(async_client: AsyncClient) -> None:
     assert login_resp.status_code == HTTPStatus.OK
     assert "access_token" in login_resp.cookies
     assert "refresh_token" in login_resp.cookies
-    assert login_resp.cookies["refresh_token"] == register_resp.cookies["refresh_token"]
+    assert login_resp.cookies["refresh_token"] != register_resp.cookies["refresh_token"]
 
 
 @pytest.mark.asyncio
@@ -54,6 +76,48 @@ async def test_login_invalid_credentials(async_client: AsyncClient) -> None:
     assert json_resp["message"] == "Invalid email or password"
 
 
+@pytest.mark.asyncio
+async def test_login_rate_limited(
+    async_client: AsyncClient, mock_redis: AsyncMock
+) -> None:
+    mock_redis.evalsha.return_value = [0, "12.5"]
+    payload = {"email": "nonexistent@example.com", "password": "wrongpass"}
+
+    resp = await async_client.post("/api/v1/auth/login", json=payload)
+    assert resp.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert resp.json()["error_code"] == "RATE_LIMIT_EXCEEDED"
+    assert resp.headers["Retry-After"] == "13"
+    key = mock_redis.evalsha.await_args.args[2]
+    assert key.startswith("ratelimit:auth.login:ip:")
+
+    mock_redis.evalsha.side_effect = ConnectionError("redis is down")
+    local_buckets = LocalTokenBuckets(max_size=10)
+    bucket = TokenBucket(capacity=2, period_seconds=60)
+    assert await take_token(mock_redis, local_buckets, "k", bucket) == 0
+    assert await take_token(mock_redis, local_buckets, "k", bucket) == 0
+    assert await take_token(mock_redis, local_buckets, "k", bucket) > 0
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limit_keys(
+    async_client: AsyncClient, mock_redis: AsyncMock
+) -> None:
+    payload = {"email": " Someone@Example.com", "password": "wrongpass"}
+    resp = await async_client.post(
+        "/api/v1/auth/login",
+        json=payload,
+        headers={"X-Forwarded-For": "203.0.113.7"},
+    )
+    assert resp.status_code == HTTPStatus.UNAUTHORIZED
+
+    email_digest = hashlib.sha256(b"someone@example.com").hexdigest()
+    keys = [call.args[2] for call in mock_redis.evalsha.await_args_list]
+    assert keys == [
+        "ratelimit:auth.login:ip:203.0.113.7",
+        f"ratelimit:auth.login:email:{email_digest}",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_refresh_token_success_and_failure(async_client: AsyncClient) -> None:
     email = f"user+{uuid4().hex}@example.com"
@@ -131,3 +195,115 @@ async def test_register_with_invalid_chars_raise_error(
 
     assert first_name_error is not None
     assert last_name_error is not None
+
+
+@pytest.mark.asyncio
+async def test_presence_recorded_in_redis_and_flushed(
+    mock_redis_dependency: AsyncMock, db: AsyncSession
+) -> None:
+    client, user_id = await get_authenticated_client()
+
+    resp = await client.get("/api/v1/users/me")
+    assert resp.status_code == HTTPStatus.OK
+    assert mock_redis_dependency.zadd.await_args.args[0] == PRESENCE_ZSET
+    assert str(user_id) in mock_redis_dependency.zadd.await_args.args[1]
+
+    seen_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    mock_redis_dependency.zrangebyscore.return_value = [(user_id, seen_at.timestamp())]
+    worker = MaintenanceWorker(mock_redis_dependency, app.state.test_async_session_maker)
+    await worker.flush_presence()
+
+    user = await db.scalar(select(User).where(User.id == UUID(user_id)))
+    assert user is not None
+    assert user.last_seen_at == seen_at
+    mock_redis_dependency.pipeline.return_value.execute.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_current_user_cached_until_invalidated(
+    user_cache: UserCacheService, db: AsyncSession
+) -> None:
+    client, user_id = await get_authenticated_client()
+
+    resp = await client.get("/api/v1/users/me")
+    assert resp.json()["firstName"] == "Alice"
+
+    await db.execute(
+        update(User).where(User.id == UUID(user_id)).values(first_name="Renamed")
+    )
+    await db.commit()
+
+    resp = await client.get("/api/v1/users/me")
+    assert resp.json()["firstName"] == "Alice"
+
+    user_cache.invalidate(UUID(user_id))
+    resp = await client.get("/api/v1/users/me")
+    assert resp.json()["firstName"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_access_token_claims_authenticate_without_lookup(
+    monkeypatch: pytest.MonkeyPatch, mock_redis_dependency: AsyncMock, db: AsyncSession
+) -> None:
+    monkeypatch.setenv("ACCESS_TOKEN_CLAIMS", "true")
+    client, user_id = await get_authenticated_client()
+    claims = decode_token(client.cookies["access_token"])
+    assert claims["given_name"] == "Alice"  # type: ignore[typeddict-item]
+    assert claims["pv"] == 1  # type: ignore[typeddict-item]
+
+    # Tokens with current claims never load the user, so they outlive it.
+    await db.execute(delete(RefreshToken).where(RefreshToken.user_id == UUID(user_id)))
+    await db.execute(delete(User).where(User.id == UUID(user_id)))
+    await db.commit()
+    resp = await client.get("/api/v1/boards/")
+    assert resp.status_code == HTTPStatus.OK
+
+    version_key = profile_version_key(UUID(user_id))
+    mock_redis_dependency.get.side_effect = lambda key: (
+        "2" if key == version_key else None
+    )
+    resp = await client.get("/api/v1/boards/")
+    assert resp.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rehashes_and_sheds_load() -> None:
+    hasher = PasswordHasher(workers=1, max_queue=0)
+    cheap_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret123")
+
+    assert await hasher.verify("wrong", cheap_hash) == (False, None)
+    valid, new_hash = await hasher.verify("secret123", cheap_hash)
+    assert valid
+    assert new_hash is not None
+    assert not pwd_context.needs_update(new_hash)
+    assert await hasher.verify("secret123", new_hash) == (True, None)
+
+    with pytest.raises(ServiceBusyError):
+        await asyncio.gather(hasher.hash("first"), hasher.hash("second"))
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_stored_hashed_and_purged(
+    mock_redis_dependency: AsyncMock, db: AsyncSession
+) -> None:
+    client, user_id = await get_authenticated_client()
+    refresh_token = client.cookies["refresh_token"]
+
+    # Registering and signing in issued one token each; only hashes are stored.
+    user_tokens = select(RefreshToken.token_hash).where(
+        RefreshToken.user_id == UUID(user_id)
+    )
+    assert hash_refresh_token(refresh_token) in (await db.scalars(user_tokens)).all()
+
+    resp = await client.post("/api/v1/auth/refresh-token")
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.cookies["refresh_token"] == refresh_token
+
+    resp = await client.post("/api/v1/auth/logout")
+    assert resp.status_code == HTTPStatus.NO_CONTENT
+
+    worker = MaintenanceWorker(mock_redis_dependency, app.state.test_async_session_maker)
+    await worker.purge_refresh_tokens()
+    remaining = (await db.scalars(user_tokens)).all()
+    assert len(remaining) == 1
+    assert hash_refresh_token(refresh_token) not in remaining
@@ -1,8 +1,25 @@
-from uuid import uuid4
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
 import pytest
 from httpx import AsyncClient
 from http import HTTPStatus
-from tests.conftest import create_board_with_authenticated_user, get_authenticated_client
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.services.board_access_service import local_board_roles
+from app.database_models import Board
+from app.database_models.board_change import BoardChange
+from app.core.enums import RoleEnum
+from app.main import app
+from app.maintenance.worker import MaintenanceWorker
+from tests.conftest import (
+    create_board_with_authenticated_user,
+    create_table_with_authenticated_user,
+    get_authenticated_client,
+)
 
 
 @pytest.mark.asyncio
@@ -22,11 +39,47 @@ async def test_create_and_list_boards() -> None:
 
     list_resp = await client.get("/api/v1/boards/")
     assert list_resp.status_code == HTTPStatus.OK
-    boards = list_resp.json()
+    boards = list_resp.json()["items"]
     assert isinstance(boards, list)
     assert any(board["id"] == board_id for board in boards)
 
 
+@pytest.mark.asyncio
+async def test_create_board_is_committed(db: AsyncSession) -> None:
+    client, _ = await get_authenticated_client()
+
+    create_resp = await client.post("/api/v1/boards/", json={"name": "Committed"})
+    assert create_resp.status_code == HTTPStatus.CREATED
+
+    board = await db.get(Board, UUID(create_resp.json()["id"]))
+    assert board is not None
+    assert board.name == "Committed"
+
+
+@pytest.mark.asyncio
+async def test_list_boards_pages_with_cursor() -> None:
+    client, _ = await get_authenticated_client()
+    for name in ("Alpha 1", "Alpha 2", "Alpha 3", "Beta"):
+        await client.post("/api/v1/boards/", json={"name": name})
+
+    first_page = (
+        await client.get("/api/v1/boards/", params={"limit": 2, "name": "alpha"})
+    ).json()
+    assert first_page["totalCount"] == 3  # noqa: PLR2004
+    assert [board["name"] for board in first_page["items"]] == ["Alpha 3", "Alpha 2"]
+    assert first_page["items"][0]["memberCount"] == 1
+    assert "memberIds" not in first_page["items"][0]
+
+    second_page = (
+        await client.get(
+            "/api/v1/boards/",
+            params={"limit": 2, "name": "alpha", "cursor": first_page["nextCursor"]},
+        )
+    ).json()
+    assert [board["name"] for board in second_page["items"]] == ["Alpha 1"]
+    assert second_page["nextCursor"] is None
+
+
 @pytest.mark.asyncio
 async def test_get_board_by_id() -> None:
     client, _ = await get_authenticated_client()
@@ -47,6 +100,236 @@ async def test_get_board_by_id() -> None:
     assert board["description"] == "This is a test board."
 
 
+@pytest.mark.asyncio
+async def test_get_board_uses_cached_tree(mock_redis: AsyncMock) -> None:
+    client, _ = await get_authenticated_client()
+    create_resp = await client.post("/api/v1/boards/", json={"name": "Test Board"})
+    board_id = create_resp.json()["id"]
+
+    get_resp = await client.get(f"/api/v1/boards/{board_id}")
+    assert get_resp.status_code == HTTPStatus.OK
+    key, payload = mock_redis.set.call_args.args
+    assert key == f"board:{board_id}:tree"
+    assert json.loads(payload.partition(":")[2]) == get_resp.json()
+
+    cached = {**get_resp.json(), "name": "Cached Board"}
+    mock_redis.mget.return_value = ["3", f"3:{json.dumps(cached)}"]
+    cached_resp = await client.get(f"/api/v1/boards/{board_id}")
+    assert cached_resp.json()["name"] == "Cached Board"
+
+    mock_redis.mget.return_value = ["4", f"3:{json.dumps(cached)}"]
+    fresh_resp = await client.get(f"/api/v1/boards/{board_id}")
+    assert fresh_resp.json()["name"] == "Test Board"
+    assert fresh_resp.headers["ETag"] == 'W/"board-4"'
+
+    mock_redis.get.return_value = "4"
+    not_modified_resp = await client.get(
+        f"/api/v1/boards/{board_id}", headers={"If-None-Match": 'W/"board-4"'}
+    )
+    assert not_modified_resp.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_update_board_if_match_etag(mock_redis: AsyncMock) -> None:
+    client, _, board_id = await create_board_with_authenticated_user()
+    mock_redis.mget.return_value = ["5", None]
+    etag = (await client.get(f"/api/v1/boards/{board_id}")).headers["ETag"]
+    assert etag == 'W/"board-5"'
+
+    mock_redis.get.return_value = "5"
+    update_resp = await client.patch(
+        f"/api/v1/boards/{board_id}", json={"name": "Renamed"}, headers={"If-Match": etag}
+    )
+    assert update_resp.status_code == HTTPStatus.OK
+    assert update_resp.json()["name"] == "Renamed"
+
+    mock_redis.get.return_value = "6"
+    stale_resp = await client.patch(
+        f"/api/v1/boards/{board_id}", json={"name": "Stale"}, headers={"If-Match": etag}
+    )
+    assert stale_resp.status_code == HTTPStatus.CONFLICT
+
+
+@pytest.mark.asyncio
+async def test_get_board_without_redis(mock_redis: AsyncMock) -> None:
+    client, _, board_id = await create_board_with_authenticated_user()
+    local_board_roles.discard(UUID(board_id))
+    mock_redis.get.side_effect = ConnectionError("redis is down")
+    mock_redis.mget.side_effect = ConnectionError("redis is down")
+    mock_redis.set.side_effect = ConnectionError("redis is down")
+
+    resp = await client.get(f"/api/v1/boards/{board_id}")
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json()["id"] == board_id
+    assert "ETag" not in resp.headers
+
+    resp = await client.get(
+        f"/api/v1/boards/{board_id}/tables/", headers={"If-None-Match": "*"}
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert "ETag" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_get_board_rendered_in_sql(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, user_id, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    for name in ("Task 1", "Task 2", "Task 3"):
+        row_id = (await client.post(f"{rows_url}/", json={"name": name})).json()["id"]
+    await client.patch(
+        f"{rows_url}/{row_id}",
+        json={"owners": [user_id], "status": "done", "dueDate": "2030-01-01T10:00:00Z"},
+    )
+
+    for params in ({}, {"rows_per_table": 2}):
+        orm_resp = await client.get(f"/api/v1/boards/{board_id}", params=params)
+        monkeypatch.setenv("BOARD_TREE_SQL_RENDER", "true")
+        sql_resp = await client.get(f"/api/v1/boards/{board_id}", params=params)
+        monkeypatch.delenv("BOARD_TREE_SQL_RENDER")
+
+        assert sql_resp.status_code == HTTPStatus.OK
+        assert sql_resp.json() == orm_resp.json()
+
+
+@pytest.mark.asyncio
+async def test_get_board_changes_since() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    row_ids = [
+        (await client.post(f"{rows_url}/", json={"name": name})).json()["id"]
+        for name in ("Task 1", "Task 2", "Task 3")
+    ]
+    since = (await client.get(f"/api/v1/boards/{board_id}")).json()["changeSeq"]
+
+    await client.patch(f"{rows_url}/{row_ids[0]}", json={"name": "Renamed"})
+    await client.delete(f"{rows_url}/{row_ids[1]}")
+    new_table = await client.post(
+        f"/api/v1/boards/{board_id}/tables/", json={"name": "Second Table"}
+    )
+
+    resp = await client.get(f"/api/v1/boards/{board_id}/changes", params={"since": since})
+    assert resp.status_code == HTTPStatus.OK
+    changes = resp.json()
+    assert changes["changeSeq"] == since + 3
+    assert changes["board"] is None
+    assert [table["id"] for table in changes["tables"]] == [new_table.json()["id"]]
+    assert [(row["id"], row["name"]) for row in changes["rows"]] == [
+        (row_ids[0], "Renamed")
+    ]
+    assert changes["deletedRowIds"] == [row_ids[1]]
+
+    up_to_date = await client.get(
+        f"/api/v1/boards/{board_id}/changes", params={"since": changes["changeSeq"]}
+    )
+    assert up_to_date.json()["rows"] == []
+
+    ahead = await client.get(
+        f"/api/v1/boards/{board_id}/changes", params={"since": since + 10}
+    )
+    assert ahead.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_board_changes_after_pruning(
+    mock_redis: AsyncMock, db: AsyncSession
+) -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    row_id = (await client.post(f"{rows_url}/", json={"name": "Task 1"})).json()["id"]
+    changes_url = f"/api/v1/boards/{board_id}/changes"
+    assert (await client.get(changes_url, params={"since": 0})).json()["reload"] is False
+
+    await db.execute(
+        update(BoardChange)
+        .where(BoardChange.board_id == UUID(board_id), BoardChange.seq == 1)
+        .values(created_at=datetime.now(timezone.utc) - timedelta(days=30))
+    )
+    await db.commit()
+    worker = MaintenanceWorker(mock_redis, app.state.test_async_session_maker)
+    await worker.prune_board_changes()
+
+    pruned = (await client.get(changes_url, params={"since": 0})).json()
+    assert pruned["reload"] is True
+    assert pruned["changeSeq"] == 2  # noqa: PLR2004
+    assert pruned["tables"] == []
+
+    kept = (await client.get(changes_url, params={"since": 1})).json()
+    assert kept["reload"] is False
+    assert [row["id"] for row in kept["rows"]] == [row_id]
+
+
+@pytest.mark.asyncio
+async def test_get_board_stats() -> None:
+    client, user_id, board_id, table_id = await create_table_with_authenticated_user()
+    empty_table = await client.post(
+        f"/api/v1/boards/{board_id}/tables/", json={"name": "Empty Table"}
+    )
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    row_ids = [
+        (await client.post(f"{rows_url}/", json={"name": name})).json()["id"]
+        for name in ("Task 1", "Task 2", "Task 3")
+    ]
+    await client.patch(
+        f"{rows_url}/{row_ids[0]}",
+        json={"status": "done", "priority": "high", "dueDate": "2020-01-01T00:00:00Z"},
+    )
+    await client.patch(
+        f"{rows_url}/{row_ids[1]}",
+        json={"owners": [user_id], "dueDate": "2020-01-01T00:00:00Z"},
+    )
+
+    resp = await client.get(f"/api/v1/boards/{board_id}/stats")
+    assert resp.status_code == HTTPStatus.OK
+    stats = resp.json()
+    assert stats["rowCount"] == 3  # noqa: PLR2004
+    assert stats["overdueCount"] == 1
+    assert stats["byStatus"]["done"] == 1
+    assert stats["byStatus"]["stuck"] == 0
+    assert stats["byPriority"]["high"] == 1
+    assert [table["tableId"] for table in stats["tables"]] == [
+        table_id,
+        empty_table.json()["id"],
+    ]
+    assert stats["tables"][1]["rowCount"] == 0
+    assert stats["owners"] == [{"userId": user_id, "rowCount": 1, "overdueCount": 1}]
+
+
+@pytest.mark.asyncio
+async def test_export_board_rows() -> None:
+    client, user_id, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    row_ids = [
+        (await client.post(f"{rows_url}/", json={"name": name})).json()["id"]
+        for name in ("Task 1", "Task, 2", "=HYPERLINK(1)")
+    ]
+    await client.patch(f"{rows_url}/{row_ids[1]}", json={"owners": [user_id]})
+
+    resp = await client.get(f"/api/v1/boards/{board_id}/export")
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert [(r["id"], r["position"]) for r in records] == [
+        (row_ids[0], 1),
+        (row_ids[1], 2),
+        (row_ids[2], 3),
+    ]
+    assert records[2]["name"] == "=HYPERLINK(1)"
+    assert records[0]["tableId"] == table_id
+    assert records[0]["ownerIds"] == []
+    assert records[1]["ownerIds"] == [user_id]
+
+    resp = await client.get(f"/api/v1/boards/{board_id}/export", params={"format": "csv"})
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("text/csv")
+    lines = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [line["name"] for line in lines] == ["Task 1", "Task, 2", "'=HYPERLINK(1)"]
+    assert lines[1]["ownerIds"] == user_id
+
+    other_client, _ = await get_authenticated_client()
+    resp = await other_client.get(f"/api/v1/boards/{board_id}/export")
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+
+
 @pytest.mark.asyncio
 async def test_update_board() -> None:
     client, _ = await get_authenticated_client()
@@ -153,7 +436,7 @@ async def test_duplicate_board() -> None:
     # List both of the boards
     list_resp = await client.get("/api/v1/boards/")
     assert list_resp.status_code == HTTPStatus.OK
-    boards = list_resp.json()
+    boards = list_resp.json()["items"]
     board_ids = [board["id"] for board in boards]
     assert board_id in board_ids
     assert duplicated_board["id"] in board_ids
@@ -168,11 +451,57 @@ async def test_add_member_to_board() -> None:
     get_boards_list = await client_b.get("/api/v1/boards/")
 
     assert get_boards_list.status_code == HTTPStatus.OK
-    boards_data = get_boards_list.json()
+    boards_data = get_boards_list.json()["items"]
 
     board = next((b for b in boards_data if b["id"] == board_id), None)
     assert board is not None
-    assert user_id_b in board["memberIds"]
+    assert board["memberCount"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_board_access_follows_membership_changes() -> None:
+    client_a, user_id_a, board_id = await create_board_with_authenticated_user()
+    client_b, user_id_b = await get_authenticated_client(email="user_b@example.com")
+
+    resp = await client_b.get(f"/api/v1/boards/{board_id}")
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+    assert local_board_roles.get(UUID(board_id)) == {UUID(user_id_a): RoleEnum.owner}
+
+    await client_a.post(f"/api/v1/boards/{board_id}/members", json={"userId": user_id_b})
+    assert local_board_roles.get(UUID(board_id)) is None
+    resp = await client_b.get(f"/api/v1/boards/{board_id}")
+    assert resp.status_code == HTTPStatus.OK
+
+    resp = await client_a.delete(f"/api/v1/boards/{board_id}/members/{user_id_b}")
+    assert resp.status_code == HTTPStatus.NO_CONTENT
+    resp = await client_b.get(f"/api/v1/boards/{board_id}")
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+
+    resp = await client_a.delete(f"/api/v1/boards/{board_id}")
+    assert resp.status_code == HTTPStatus.NO_CONTENT
+    assert local_board_roles.get(UUID(board_id)) is None
+    resp = await client_a.get(f"/api/v1/boards/{board_id}")
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_board_members_have_their_own_version(mock_redis: AsyncMock) -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    _, user_id_b = await get_authenticated_client(email="user_b@example.com")
+    members_version = f"board:{board_id}:members:version"
+    pipe = mock_redis.pipeline.return_value
+
+    pipe.incr.reset_mock()
+    await client.post(
+        f"/api/v1/boards/{board_id}/tables/{table_id}/rows/", json={"name": "Task 1"}
+    )
+    assert [call.args[0] for call in pipe.incr.call_args_list] == [
+        f"board:{board_id}:version"
+    ]
+
+    pipe.incr.reset_mock()
+    await client.post(f"/api/v1/boards/{board_id}/members", json={"userId": user_id_b})
+    assert members_version in [call.args[0] for call in pipe.incr.call_args_list]
 
 
 @pytest.mark.asyncio
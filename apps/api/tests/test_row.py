@@ -1,22 +1,27 @@
 import pytest
 from uuid import UUID, uuid4
 from http import HTTPStatus
+from unittest.mock import AsyncMock
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 from tests.conftest import (
     get_authenticated_client,
     create_table_with_authenticated_user,
     RowService,
 )
 from app.common.errors.exceptions import NotFoundError
+from app.common.rank import rank_between
+from app.database_models import Row
+from app.main import app
+from app.maintenance.worker import MaintenanceWorker
 
 
 @pytest.mark.asyncio
 async def test_create_row() -> None:
     client, _, board_id, table_id = await create_table_with_authenticated_user()
 
-    response = await client.post(
-        f"/api/v1/boards/{board_id}/tables/{table_id}/rows/",
-        json={"name": "Task 1"},
-    )
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows/"
+    response = await client.post(rows_url, json={"name": "Task 1"})
     assert response.status_code == HTTPStatus.CREATED
     data = response.json()
     assert data["name"] == "Task 1"
@@ -24,6 +29,11 @@ async def test_create_row() -> None:
     assert data["id"] is not None
     assert data["position"] == 1
 
+    response = await client.post(
+        rows_url, json={"name": "Task 2"}, params={"with_position": False}
+    )
+    assert response.json()["position"] is None
+
 
 @pytest.mark.asyncio
 async def test_update_row() -> None:
@@ -50,6 +60,30 @@ async def test_update_row() -> None:
     assert updated_row["position"] == update_resp.json()["position"]
 
 
+@pytest.mark.asyncio
+async def test_update_row_with_stale_version() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+
+    create_resp = await client.post(
+        f"/api/v1/boards/{board_id}/tables/{table_id}/rows/",
+        json={"name": "Task 1"},
+    )
+    row = create_resp.json()
+    row_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows/{row['id']}"
+    assert row["version"] == 1
+
+    update_resp = await client.patch(
+        row_url, json={"name": "First"}, headers={"If-Match": '"1"'}
+    )
+    assert update_resp.status_code == HTTPStatus.OK
+    assert update_resp.json()["version"] == 2  # noqa: PLR2004
+
+    stale_resp = await client.patch(
+        row_url, json={"name": "Second"}, headers={"If-Match": '"1"'}
+    )
+    assert stale_resp.status_code == HTTPStatus.CONFLICT
+
+
 @pytest.mark.asyncio
 async def test_delete_row(row_service: RowService) -> None:
     client, _, board_id, table_id = await create_table_with_authenticated_user()
@@ -128,3 +162,302 @@ async def test_user_cannot_update_row_in_other_user_table() -> None:
         json={"name": "Should fail"},
     )
     assert update_resp.status_code in (HTTPStatus.FORBIDDEN, HTTPStatus.NOT_FOUND)
+
+
+@pytest.mark.asyncio
+async def test_update_row_position_within_table() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+
+    row_ids = []
+    for name in ("Task 1", "Task 2", "Task 3"):
+        resp = await client.post(f"{rows_url}/", json={"name": name})
+        assert resp.status_code == HTTPStatus.CREATED
+        row_ids.append(resp.json()["id"])
+
+    move_resp = await client.patch(
+        f"{rows_url}/{row_ids[2]}/position", json={"newPosition": 1}
+    )
+    assert move_resp.status_code == HTTPStatus.OK
+    assert move_resp.json()["position"] == 1
+
+    board_resp = await client.get(f"/api/v1/boards/{board_id}")
+    rows = board_resp.json()["tables"][0]["rows"]
+    assert [row["id"] for row in rows] == [row_ids[2], row_ids[0], row_ids[1]]
+    assert [row["position"] for row in rows] == [1, 2, 3]
+
+    out_of_bounds_resp = await client.patch(
+        f"{rows_url}/{row_ids[0]}/position", json={"newPosition": 4}
+    )
+    assert out_of_bounds_resp.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_update_row_position_with_long_ranks(db: AsyncSession) -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    row_ids = [
+        (await client.post(f"{rows_url}/", json={"name": name})).json()["id"]
+        for name in ("Task 1", "Task 2", "Task 3")
+    ]
+
+    # Keys grow while rows keep landing in the same gap.
+    before, after = "00000001", "00000002"
+    for _ in range(2000):
+        after = rank_between(before, after)
+    assert len(after) > 255  # noqa: PLR2004
+    for row_id, rank in zip(row_ids, (before, after), strict=False):
+        await db.execute(update(Row).where(Row.id == UUID(row_id)).values(rank=rank))
+    await db.commit()
+
+    move_resp = await client.patch(
+        f"{rows_url}/{row_ids[2]}/position", json={"newPosition": 2}
+    )
+    assert move_resp.status_code == HTTPStatus.OK
+
+    board_resp = await client.get(f"/api/v1/boards/{board_id}")
+    rows = board_resp.json()["tables"][0]["rows"]
+    assert [row["id"] for row in rows] == [row_ids[0], row_ids[2], row_ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_rebalance_row_ranks(mock_redis: AsyncMock) -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    rows = [
+        (await client.post(f"{rows_url}/", json={"name": name})).json()
+        for name in ("Task 1", "Task 2", "Task 3")
+    ]
+    since = (await client.get(f"/api/v1/boards/{board_id}")).json()["changeSeq"]
+
+    mock_redis.spop = AsyncMock(return_value=[table_id])
+    worker = MaintenanceWorker(mock_redis, app.state.test_async_session_maker)
+    await worker.rebalance_row_ranks()
+    mock_redis.pipeline.return_value.incr.assert_called_with(f"board:{board_id}:version")
+
+    changes = (
+        await client.get(f"/api/v1/boards/{board_id}/changes", params={"since": since})
+    ).json()
+    assert {row["id"]: (row["position"], row["version"]) for row in changes["rows"]} == {
+        row["id"]: (position, row["version"] + 1)
+        for position, row in enumerate(rows, start=1)
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_row_position_between_tables() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    target_resp = await client.post(
+        f"/api/v1/boards/{board_id}/tables/", json={"name": "Target Table"}
+    )
+    target_table_id = target_resp.json()["id"]
+
+    row_resp = await client.post(
+        f"/api/v1/boards/{board_id}/tables/{table_id}/rows/", json={"name": "Task 1"}
+    )
+    row_id = row_resp.json()["id"]
+    for name in ("Task 2", "Task 3"):
+        await client.post(
+            f"/api/v1/boards/{board_id}/tables/{target_table_id}/rows/",
+            json={"name": name},
+        )
+
+    move_resp = await client.patch(
+        f"/api/v1/boards/{board_id}/tables/{table_id}/rows/{row_id}/position",
+        json={"newPosition": 2, "targetTableId": target_table_id},
+    )
+    assert move_resp.status_code == HTTPStatus.OK
+    moved = move_resp.json()
+    assert moved["tableId"] == target_table_id
+    assert moved["position"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_move_rows() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    target_resp = await client.post(
+        f"/api/v1/boards/{board_id}/tables/", json={"name": "Target Table"}
+    )
+    target_table_id = target_resp.json()["id"]
+
+    row_ids = []
+    for name in ("Task 1", "Task 2", "Task 3"):
+        row_resp = await client.post(
+            f"/api/v1/boards/{board_id}/tables/{table_id}/rows/", json={"name": name}
+        )
+        row_ids.append(row_resp.json()["id"])
+    for name in ("Task 4", "Task 5"):
+        await client.post(
+            f"/api/v1/boards/{board_id}/tables/{target_table_id}/rows/",
+            json={"name": name},
+        )
+
+    move_resp = await client.post(
+        f"/api/v1/boards/{board_id}/tables/{target_table_id}/rows:move",
+        json={"rowIds": [row_ids[2], row_ids[0]], "newPosition": 2},
+    )
+    assert move_resp.status_code == HTTPStatus.OK
+    moved = move_resp.json()
+    assert [row["id"] for row in moved] == [row_ids[2], row_ids[0]]
+    assert [row["position"] for row in moved] == [2, 3]
+    assert all(row["tableId"] == target_table_id for row in moved)
+
+    board_resp = await client.get(f"/api/v1/boards/{board_id}")
+    tables = {table["id"]: table for table in board_resp.json()["tables"]}
+    target_rows = tables[target_table_id]["rows"]
+    assert [row["name"] for row in target_rows] == [
+        "Task 4",
+        "Task 3",
+        "Task 1",
+        "Task 5",
+    ]
+    assert [row["name"] for row in tables[table_id]["rows"]] == ["Task 2"]
+
+    missing_resp = await client.post(
+        f"/api/v1/boards/{board_id}/tables/{target_table_id}/rows:move",
+        json={"rowIds": [str(uuid4())], "newPosition": 1},
+    )
+    assert missing_resp.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_list_rows_pages_with_cursor() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    for name in ("Task 1", "Task 2", "Task 3"):
+        await client.post(f"{rows_url}/", json={"name": name})
+
+    first_page = (await client.get(f"{rows_url}/", params={"limit": 2})).json()
+    assert first_page["totalCount"] is None
+    assert [row["name"] for row in first_page["items"]] == ["Task 1", "Task 2"]
+    assert first_page["nextCursor"] is not None
+
+    second_page = (
+        await client.get(
+            f"{rows_url}/", params={"limit": 2, "cursor": first_page["nextCursor"]}
+        )
+    ).json()
+    assert [row["name"] for row in second_page["items"]] == ["Task 3"]
+    assert second_page["items"][0]["position"] == 3  # noqa: PLR2004
+    assert second_page["nextCursor"] is None
+
+    counted_page = (
+        await client.get(f"{rows_url}/", params={"limit": 2, "with_total_count": True})
+    ).json()
+    assert counted_page["totalCount"] == 3  # noqa: PLR2004
+
+    board_resp = await client.get(
+        f"/api/v1/boards/{board_id}", params={"rows_per_table": 2}
+    )
+    table = board_resp.json()["tables"][0]
+    assert [row["name"] for row in table["rows"]] == ["Task 1", "Task 2"]
+    assert table["nextRowsCursor"] == first_page["nextCursor"]
+
+
+@pytest.mark.asyncio
+async def test_batch_rows() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+
+    row_ids = []
+    for name in ("Task 1", "Task 2"):
+        resp = await client.post(f"{rows_url}/", json={"name": name})
+        row_ids.append(resp.json()["id"])
+
+    batch_resp = await client.post(
+        f"{rows_url}:batch",
+        json={
+            "operations": [
+                {"op": "create", "name": "Task 3"},
+                {"op": "update", "rowId": row_ids[0], "status": "done"},
+                {"op": "move", "rowId": row_ids[1], "newPosition": 1},
+                {"op": "delete", "rowId": row_ids[0]},
+            ]
+        },
+    )
+    assert batch_resp.status_code == HTTPStatus.OK
+    results = batch_resp.json()["results"]
+    assert [result["op"] for result in results] == ["create", "update", "move", "delete"]
+    assert results[0]["row"]["name"] == "Task 3"
+    assert results[2]["row"]["position"] == 1
+    assert results[3]["row"] is None
+
+    board_resp = await client.get(f"/api/v1/boards/{board_id}")
+    rows = board_resp.json()["tables"][0]["rows"]
+    assert [row["id"] for row in rows] == [row_ids[1], results[0]["rowId"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_move_to_current_position_is_noop() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+    rows = [
+        (await client.post(f"{rows_url}/", json={"name": name})).json()
+        for name in ("Task 1", "Task 2")
+    ]
+
+    batch_resp = await client.post(
+        f"{rows_url}:batch",
+        json={
+            "operations": [
+                {"op": "move", "rowId": rows[1]["id"], "newPosition": 2},
+                {"op": "update", "rowId": rows[0]["id"], "position": 1},
+            ]
+        },
+    )
+    assert batch_resp.status_code == HTTPStatus.OK
+    results = batch_resp.json()["results"]
+    assert results[0]["row"]["position"] == 2  # noqa: PLR2004
+    assert results[0]["row"]["updatedAt"] == rows[1]["updatedAt"]
+    assert results[0]["row"]["version"] == rows[1]["version"]
+    assert results[1]["row"]["position"] == 1
+    assert results[1]["row"]["version"] == rows[0]["version"]
+
+
+@pytest.mark.asyncio
+async def test_batch_rows_is_atomic() -> None:
+    client, _, board_id, table_id = await create_table_with_authenticated_user()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+
+    batch_resp = await client.post(
+        f"{rows_url}:batch",
+        json={
+            "operations": [
+                {"op": "create", "name": "Task 1"},
+                {"op": "delete", "rowId": str(uuid4())},
+            ]
+        },
+    )
+    assert batch_resp.status_code == HTTPStatus.NOT_FOUND
+
+    board_resp = await client.get(f"/api/v1/boards/{board_id}")
+    assert board_resp.json()["tables"][0]["rows"] == []
+
+
+@pytest.mark.asyncio
+async def test_replace_row_owners() -> None:
+    client, user_id, board_id, table_id = await create_table_with_authenticated_user()
+    _, other_user_id = await get_authenticated_client()
+    rows_url = f"/api/v1/boards/{board_id}/tables/{table_id}/rows"
+
+    row_id = (await client.post(f"{rows_url}/", json={"name": "Task 1"})).json()["id"]
+
+    replace_resp = await client.put(
+        f"{rows_url}/{row_id}/owners", json={"ownerIds": [user_id, other_user_id]}
+    )
+    assert replace_resp.status_code == HTTPStatus.OK
+    assert {owner["id"] for owner in replace_resp.json()} == {user_id, other_user_id}
+
+    replace_resp = await client.put(
+        f"{rows_url}/{row_id}/owners", json={"ownerIds": [other_user_id]}
+    )
+    assert [owner["id"] for owner in replace_resp.json()] == [other_user_id]
+
+    update_resp = await client.patch(f"{rows_url}/{row_id}", json={"owners": []})
+    assert update_resp.status_code == HTTPStatus.OK
+    assert update_resp.json()["owners"] == []
+
+    missing_resp = await client.put(
+        f"{rows_url}/{row_id}/owners", json={"ownerIds": [str(uuid4())]}
+    )
+    assert missing_resp.status_code == HTTPStatus.NOT_FOUND
@@ -3,6 +3,7 @@ from uuid import uuid4
 from http import HTTPStatus
 from tests.conftest import (
     create_board_with_authenticated_user,
+    create_table_with_authenticated_user,
     get_authenticated_client,
 )
 
@@ -28,6 +29,45 @@ async def test_create_and_list_tables() -> None:
     assert any(table["id"] == table_id for table in tables)
 
 
+@pytest.mark.asyncio
+async def test_list_tables_not_modified() -> None:
+    client, _, board_id = await create_board_with_authenticated_user()
+    tables_url = f"/api/v1/boards/{board_id}/tables/"
+
+    list_resp = await client.get(tables_url)
+    etag = list_resp.headers["ETag"]
+
+    cached_resp = await client.get(tables_url, headers={"If-None-Match": etag})
+    assert cached_resp.status_code == HTTPStatus.NOT_MODIFIED
+    assert cached_resp.headers["ETag"] == etag
+    assert not cached_resp.content
+
+    stale_resp = await client.get(tables_url, headers={"If-None-Match": 'W/"board-0x"'})
+    assert stale_resp.status_code == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+async def test_list_tables_with_projection() -> None:
+    client, user_id, board_id, table_id = await create_table_with_authenticated_user()
+    tables_url = f"/api/v1/boards/{board_id}/tables/"
+    row_resp = await client.post(f"{tables_url}{table_id}/rows/", json={"name": "Task"})
+    await client.patch(
+        f"{tables_url}{table_id}/rows/{row_resp.json()['id']}", json={"owners": [user_id]}
+    )
+
+    names_resp = await client.get(tables_url, params={"fields": "id,name"})
+    assert names_resp.status_code == HTTPStatus.OK
+    assert names_resp.json() == [{"id": table_id, "name": "Test Table"}]
+
+    rows_resp = await client.get(
+        tables_url, params={"fields": "id,rows.name,rows.owners", "include": "rows"}
+    )
+    assert rows_resp.json() == [{"id": table_id, "rows": [{"name": "Task"}]}]
+
+    invalid_resp = await client.get(tables_url, params={"include": "owners"})
+    assert invalid_resp.status_code == HTTPStatus.BAD_REQUEST
+
+
 @pytest.mark.asyncio
 async def test_create_table_invalid_board() -> None:
     client, _ = await get_authenticated_client()
@@ -154,3 +194,46 @@ async def test_duplicate_table() -> None:
     assert duplicated_table is not None
     assert len(duplicated_table["rows"]) == 1
     assert duplicated_table["rows"][0]["name"] == "Original Row"
+
+
+@pytest.mark.asyncio
+async def test_update_table_position() -> None:
+    client, _, board_id = await create_board_with_authenticated_user()
+    first = (
+        await client.post(
+            f"/api/v1/boards/{board_id}/tables/",
+            json={"name": "First", "description": "First table"},
+        )
+    ).json()
+    second = (
+        await client.post(
+            f"/api/v1/boards/{board_id}/tables/",
+            json={"name": "Second", "description": "Second table"},
+        )
+    ).json()
+
+    resp = await client.patch(
+        f"/api/v1/boards/{board_id}/tables/{second['id']}/position",
+        json={"newPosition": 1},
+    )
+    assert resp.status_code == HTTPStatus.OK
+    ordering = resp.json()
+    ids = [table["id"] for table in ordering]
+    assert ids.index(second["id"]) < ids.index(first["id"])
+    assert [table["position"] for table in ordering] == list(range(1, len(ids) + 1))
+
+
+@pytest.mark.asyncio
+async def test_create_table_appends_position() -> None:
+    client, _, board_id = await create_board_with_authenticated_user()
+
+    positions = []
+    for name in ("First", "Second"):
+        resp = await client.post(
+            f"/api/v1/boards/{board_id}/tables/", json={"name": name}
+        )
+        assert resp.status_code == HTTPStatus.CREATED
+        assert resp.json()["rows"] == []
+        positions.append(resp.json()["position"])
+
+    assert positions[1] == positions[0] + 1
@@ -5,6 +5,7 @@ import { showErrorToast, showSuccessToast } from '@/store/errorHandler';
 import {
   IBoard,
   IBoardList,
+  IBoardListPage,
   ICreateBoardRequest,
   IUpdateBoardRequest
 } from '../types/board.interface';
@@ -20,11 +21,14 @@ import {
   ICreateTableRequest,
   IDeleteTableRequest,
   ITable,
+  ITablePosition,
   IUpdateTableRequest,
   TableColor
 } from '../types/table.interface';
 import { generateTempId } from '../utils/board.utils';
 
+const BOARD_LIST_LIMIT = 200;
+
 const updatePositions = <T extends { position: number }>(items: T[]): T[] => {
   return items.map((item, index) => ({
     ...item,
@@ -55,7 +59,26 @@ export const boardApi = api.injectEndpoints({
   endpoints: (build) => ({
     // Board endpoints
     getBoards: build.query<IBoardList[], void>({
-      query: () => '/boards/',
+      // The list is paginated: follow nextCursor until every board is loaded.
+      async queryFn(_arg, _api, _extraOptions, baseQuery) {
+        const boards: IBoardList[] = [];
+        let cursor: string | null = null;
+        do {
+          const result = await baseQuery({
+            url: '/boards/',
+            params: cursor
+              ? { limit: BOARD_LIST_LIMIT, cursor }
+              : { limit: BOARD_LIST_LIMIT }
+          });
+          if (result.error) {
+            return { error: result.error };
+          }
+          const page = result.data as IBoardListPage;
+          boards.push(...page.items);
+          cursor = page.nextCursor;
+        } while (cursor);
+        return { data: boards };
+      },
       providesTags: ['Board']
     }),
 
@@ -375,7 +398,7 @@ export const boardApi = api.injectEndpoints({
     }),
 
     updateTablePosition: build.mutation<
-      ITable,
+      ITablePosition[],
       { boardId: string; tableId: string; newPosition: number }
     >({
       query: ({ boardId, tableId, newPosition }) => ({
@@ -422,9 +445,8 @@ export const boardApi = api.injectEndpoints({
                 if (!table.rows) {
                   table.rows = [];
                 }
-                table.rows.push(newRow);
-                // Sort by position to maintain order
-                table.rows.sort((a, b) => a.position - b.position);
+                // New rows go last; the API leaves their position out
+                table.rows.push({ ...newRow, position: table.rows.length + 1 });
               }
             })
           );
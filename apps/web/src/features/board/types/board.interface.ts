@@ -17,11 +17,17 @@ export interface IBoardList {
   name: string;
   description?: string;
   ownerId: string;
-  memberIds: string[];
+  memberCount?: number;
   createdAt: string;
   updatedAt: string;
 }
 
+export interface IBoardListPage {
+  totalCount: number;
+  items: IBoardList[];
+  nextCursor: string | null;
+}
+
 export interface IUpdateBoardRequest {
   id: string;
   name?: string;
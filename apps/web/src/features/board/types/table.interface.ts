@@ -33,6 +33,11 @@ export interface ITable {
   rows: IRow[];
 }
 
+export interface ITablePosition {
+  id: string;
+  position: number;
+}
+
 export interface ICreateTableRequest {
   boardId: string;
   name: string;
@@ -6,7 +6,7 @@ export const mockBoard: IBoardList[] = [
     name: 'Test Board',
     description: 'This is a test board',
     ownerId: 'test-user-1',
-    memberIds: ['1'],
+    memberCount: 1,
     createdAt: '2025-06-06T11:11:02.901852',
     updatedAt: '2025-06-06T15:51:48.421868'
   }
@@ -18,7 +18,7 @@ export const mockBoards: IBoardList[] = [
     name: 'New board YES!',
     description: 'The best board ever',
     ownerId: 'test-user-1',
-    memberIds: ['1'],
+    memberCount: 1,
     createdAt: '2025-06-06T11:11:02.901852',
     updatedAt: '2025-06-06T15:51:48.421868'
   },
@@ -27,7 +27,7 @@ export const mockBoards: IBoardList[] = [
     name: 'Second board',
     description: 'This is the second board',
     ownerId: 'test-user-1',
-    memberIds: ['2'],
+    memberCount: 1,
     createdAt: '2025-06-07T11:11:02.901852',
     updatedAt: '2025-06-07T15:51:48.421868'
   },
@@ -36,7 +36,7 @@ export const mockBoards: IBoardList[] = [
     name: 'Third board',
     description: 'This is the third board',
     ownerId: 'test-user-1',
-    memberIds: ['3'],
+    memberCount: 1,
     createdAt: '2025-06-08T11:11:02.901852',
     updatedAt: '2025-06-08T15:51:48.421868'
   }